@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import Generator, Union
+
+
+def round_robin(num_teams: int) -> Generator[list[tuple[int, int]], None, None]:
+    """
+    Generate the weeks of a single round-robin tournament using the circle (polygon) method.
+    Team 0 stays fixed while the remaining teams rotate one place every week, so every
+    team meets every other team exactly once.
+    An odd number of teams is padded with a bye; the team drawn against the bye rests that week.
+
+    Args:
+        num_teams (int): The number of teams in the tournament.
+
+    Yields:
+        list[tuple[int, int]]: The (home, away) team indices of every game in the week,
+            the lower index is always the home team.
+            Exactly N-1 weeks of N//2 games are produced for N teams (N weeks when N is odd).
+
+    Complexity:
+        Best Case Complexity: O(N) per week, where N is the number of teams (O(1) per fixture).
+        Worst Case Complexity: O(N) per week, where N is the number of teams (O(1) per fixture).
+    """
+    slots: list[Union[int, None]] = list(range(num_teams))
+    if num_teams % 2 == 1:
+        slots.append(None)  # the bye
+    num_slots = len(slots)
+    rotating = num_slots - 1
+
+    for week in range(rotating):
+        games: list[tuple[int, int]] = []
+        # Rotating the circle by `week` places is just an offset into the slots
+        pairs = [(slots[0], slots[1 + week])]
+        for k in range(1, num_slots // 2):
+            pairs.append((slots[1 + (week + k) % rotating], slots[1 + (week + rotating - k) % rotating]))
+
+        for team1, team2 in pairs:
+            if team1 is None or team2 is None:
+                continue
+            games.append((team1, team2) if team1 < team2 else (team2, team1))
+        yield games
@@ -0,0 +1,41 @@
+"""
+Build time of the hash tables from N known pairs: one __setitem__ per pair (growing through
+every size of TABLE_SIZES) against from_items (sized up front).
+
+Usage: python -m benchmarks.bench_bulk_load [number of keys]
+"""
+from __future__ import annotations
+import sys
+from time import perf_counter
+
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import ArrayBucket, HashTableSeparateChaining
+from hashy_step_table import HashyStepTable
+
+DEFAULT_KEYS = 1000000
+
+
+def main(num_keys: int) -> None:
+    items = [(f"Player {i}", i) for i in range(num_keys)]
+    builders = [
+        ("LinearProbeTable", LinearProbeTable, LinearProbeTable.from_items),
+        ("HashyStepTable", HashyStepTable, HashyStepTable.from_items),
+        ("HashTableSeparateChaining", lambda: HashTableSeparateChaining(bucket=ArrayBucket),
+         lambda pairs: HashTableSeparateChaining.from_items(pairs, bucket=ArrayBucket)),
+    ]
+    for name, empty, from_items in builders:
+        start = perf_counter()
+        table = empty()
+        for key, value in items:
+            table[key] = value
+        incremental = perf_counter() - start
+
+        start = perf_counter()
+        bulk = from_items(items)
+        bulk_time = perf_counter() - start
+        assert len(bulk) == len(table) == num_keys
+        print(f"{name:>25}: setitem {incremental:6.2f} s, from_items {bulk_time:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_KEYS)
@@ -0,0 +1,44 @@
+"""
+Memory (tracemalloc) and lookup time of HashTableSeparateChaining with linked buckets
+against array buckets with inline hashes.
+
+Usage: python -m benchmarks.bench_chaining_buckets [number of entries]
+"""
+from __future__ import annotations
+import sys
+import tracemalloc
+from time import perf_counter
+
+from benchmarks.league import best_of
+from data_structures.hash_table_separate_chaining import ArrayBucket, HashTableSeparateChaining, LinkedBucket
+
+DEFAULT_ENTRIES = 100000
+LOOKUPS = 20000
+
+
+def main(num_entries: int) -> None:
+    # build the keys and values first so only the table itself is measured
+    keys = [f"Player {i}" for i in range(num_entries)]
+    values = list(range(num_entries))
+    hits = keys[::max(1, num_entries // LOOKUPS)]
+    for bucket in (LinkedBucket, ArrayBucket):
+        tracemalloc.start()
+        start = perf_counter()
+        table = HashTableSeparateChaining(bucket=bucket)
+        for key, value in zip(keys, values):
+            table[key] = value
+        build_time = perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        def lookups() -> None:
+            for key in hits:
+                table[key]
+
+        lookup_time = best_of(3, lookups) / len(hits) * 1e6
+        print(f"{bucket.__name__:>12}: {memory / 2 ** 20:6.1f} MiB ({memory / num_entries:5.1f} B per entry), "
+              f"build {build_time:5.2f} s, lookup {lookup_time:5.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRIES)
@@ -0,0 +1,55 @@
+"""
+Lookup time of HashTableSeparateChaining as it grows from 10 keys to a million,
+against a table that never resizes (the previous behaviour).
+
+Usage: python -m benchmarks.bench_chaining_growth [max number of keys]
+"""
+from __future__ import annotations
+import sys
+
+from benchmarks.league import best_of
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+
+DEFAULT_MAX_KEYS = 1000000
+LOOKUPS = 5000
+# The fixed table stops being measured past this size, its chains make it too slow
+FIXED_MAX_KEYS = 10000
+
+
+class FixedChainingTable(HashTableSeparateChaining):
+    """ Never resizes, like the table did before. """
+
+    def _resize(self, grow: bool) -> None:
+        pass
+
+
+def lookup_time(table: HashTableSeparateChaining, num_keys: int) -> float:
+    """ Mean time of a successful lookup in microseconds. """
+    keys = [f"Player {i}" for i in range(0, num_keys, max(1, num_keys // LOOKUPS))]
+
+    def lookups() -> None:
+        for key in keys:
+            table[key]
+
+    return best_of(3, lookups) / len(keys) * 1e6
+
+
+def main(max_keys: int) -> None:
+    growing, fixed = HashTableSeparateChaining(), FixedChainingTable()
+    inserted = 0
+    num_keys = 10
+    while num_keys <= max_keys:
+        for i in range(inserted, num_keys):
+            growing[f"Player {i}"] = i
+            if num_keys <= FIXED_MAX_KEYS:
+                fixed[f"Player {i}"] = i
+        inserted = num_keys
+        line = f"{num_keys:8d} keys: resizing {lookup_time(growing, num_keys):6.2f} us ({len(growing.table):7d} chains)"
+        if num_keys <= FIXED_MAX_KEYS:
+            line += f", fixed {lookup_time(fixed, num_keys):8.2f} us ({len(fixed.table)} chains)"
+        print(line)
+        num_keys *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_KEYS)
@@ -0,0 +1,51 @@
+"""
+Steady-state lookup cost of the hash tables with and without a HashCache,
+for short stat names and for long keys.
+
+Usage: python -m benchmarks.bench_hash_cache
+"""
+from __future__ import annotations
+
+from benchmarks.league import best_of
+from constants import PlayerStats, TeamStats
+from data_structures.hash_cache import HashCache
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+
+LOOKUPS = 20000
+
+
+def lookups(table, keys: list[str]) -> None:
+    for _ in range(LOOKUPS // len(keys)):
+        for key in keys:
+            table[key] = table[key] + 1
+
+
+def main() -> None:
+    stat_keys = [stat.value for stat in TeamStats]
+    long_keys = [stat.value * 20 for stat in TeamStats]
+    cases = [
+        (HashyStepTable, stat_keys), (HashyStepTable, long_keys),
+        (LinearProbeTable, stat_keys), (LinearProbeTable, long_keys),
+        (HashTableSeparateChaining, stat_keys), (HashTableSeparateChaining, long_keys),
+        (HashyPerfectionTable, [stat.value for stat in PlayerStats]),
+    ]
+    for table_class, keys in cases:
+        timings = []
+        for cache in (None, HashCache()):
+            table = table_class()
+            table.hash_cache = cache
+            if hasattr(table, "step_cache"):
+                table.step_cache = None if cache is None else HashCache()
+            for key in keys:
+                table[key] = 0
+            timings.append(best_of(3, lambda: lookups(table, keys)) / (2 * LOOKUPS) * 1e6)
+        key_length = sum(len(key) for key in keys) // len(keys)
+        print(f"{table_class.__name__:>25} key length {key_length:4d}: "
+              f"{timings[0]:6.2f} us -> {timings[1]:5.2f} us per operation with cache")
+
+
+if __name__ == "__main__":
+    main()
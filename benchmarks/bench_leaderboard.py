@@ -0,0 +1,85 @@
+"""
+Compares rebuilding the leaderboard after every game against repositioning only
+the two teams that played, on a max-size league over a full season.
+
+Usage: python -m benchmarks.bench_leaderboard
+"""
+from __future__ import annotations
+
+from benchmarks.league import best_of, make_league
+from constants import TeamStats
+from data_structures.array_sorted_list import ArraySortedList
+from random_gen import RandomGen
+from season import Season
+from team import Team
+
+
+class CountingTeam(Team):
+    """ Team that counts how often the leaderboard compares it. """
+    comparisons = 0
+
+    def __lt__(self, other: Team) -> bool:
+        CountingTeam.comparisons += 1
+        return Team.__lt__(self, other)
+
+
+def play(game, home_goals: int, away_goals: int) -> None:
+    """ Applies a result to both teams of a game. """
+    home, away = game.home_team, game.away_team
+    if home_goals > away_goals:
+        home[TeamStats.WINS] += 1
+        away[TeamStats.LOSSES] += 1
+    elif home_goals == away_goals:
+        home[TeamStats.DRAWS] += 1
+        away[TeamStats.DRAWS] += 1
+    else:
+        home[TeamStats.LOSSES] += 1
+        away[TeamStats.WINS] += 1
+    home[TeamStats.GOALS_FOR] += home_goals
+    home[TeamStats.GOALS_AGAINST] += away_goals
+    away[TeamStats.GOALS_FOR] += away_goals
+    away[TeamStats.GOALS_AGAINST] += home_goals
+
+
+def run_season(season: Season, incremental: bool) -> None:
+    """ Plays a seeded season, maintaining the leaderboard with the chosen strategy. """
+    RandomGen.set_seed(7)
+    for team in season.teams:
+        team.reset_stats()
+    season.leaderboard = ArraySortedList(len(season.teams))
+    for team in season.teams:
+        season.leaderboard.add(team)
+
+    for week in season.schedule:
+        for game in week:
+            if incremental:
+                season.leaderboard.remove(game.home_team)
+                season.leaderboard.remove(game.away_team)
+            play(game, RandomGen.randint(0, 5), RandomGen.randint(0, 5))
+            if incremental:
+                season.leaderboard.add(game.home_team)
+                season.leaderboard.add(game.away_team)
+            else:
+                rebuilt = ArraySortedList(len(season.teams))
+                for team in season.leaderboard:
+                    rebuilt.add(team)
+                season.leaderboard = rebuilt
+
+
+def main() -> None:
+    teams = make_league()
+    for team in teams:
+        team.__class__ = CountingTeam
+    season = Season(teams)
+
+    for label, incremental in (("rebuild per game", False), ("reposition two teams", True)):
+        CountingTeam.comparisons = 0
+        run_season(season, incremental)
+        comparisons = CountingTeam.comparisons
+        order = [team.get_name() for team in season.leaderboard]
+        elapsed = best_of(3, lambda: run_season(season, incremental))
+        print(f"{label:>22}: {elapsed * 1000:8.2f} ms, {comparisons:7d} comparisons, leader {order[0]}")
+
+
+if __name__ == "__main__":
+    main()
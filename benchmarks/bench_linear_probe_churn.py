@@ -0,0 +1,58 @@
+"""
+Delete-heavy churn on LinearProbeTable at fixed load factors: every round deletes a random
+live key and inserts a new one. Compares backward-shift deletion with the previous deletion,
+which re-probed and re-inserted (rehashing) every following entry of the cluster.
+
+Usage: python -m benchmarks.bench_linear_probe_churn
+"""
+from __future__ import annotations
+from random import Random
+from time import perf_counter
+
+from data_structures.hash_table import LinearProbeTable
+
+# A single prime size, so the table never resizes and the load factor stays fixed
+TABLE_SIZE = 12289
+LOAD_FACTORS = (0.1, 0.2, 0.3, 0.4, 0.5)
+ROUNDS = 20000
+
+
+class LegacyProbeTable(LinearProbeTable):
+    """ The previous deletion: empty the slot, then rehash and re-insert the rest of the cluster. """
+
+    def __delitem__(self, key) -> None:
+        position = self._linear_probe(key, False)
+        self.array[position] = None
+        self.count -= 1
+        position = (position + 1) % self.table_size
+        while self.array[position] is not None:
+            key2, value, _ = self.array[position]
+            self.array[position] = None
+            home = self.hash(key2)
+            self.array[self._probe_from(home, key2, True)] = (key2, value, home)
+            position = (position + 1) % self.table_size
+
+
+def churn(table_class: type[LinearProbeTable], load_factor: float) -> float:
+    """ Returns the mean time of a delete plus insert in microseconds. """
+    table = table_class([TABLE_SIZE])
+    live = [f"Player {i}" for i in range(int(TABLE_SIZE * load_factor))]
+    for i, key in enumerate(live):
+        table[key] = i
+    rng = Random(1)
+    start = perf_counter()
+    for i in range(ROUNDS):
+        index = rng.randrange(len(live))
+        del table[live[index]]
+        live[index] = f"Player {len(live) + i}"
+        table[live[index]] = i
+    elapsed = perf_counter() - start
+    assert len(table) == len(live) and all(key in table for key in live[:100])
+    return elapsed / ROUNDS * 1e6
+
+
+if __name__ == "__main__":
+    for load_factor in LOAD_FACTORS:
+        shift = churn(LinearProbeTable, load_factor)
+        legacy = churn(LegacyProbeTable, load_factor)
+        print(f"load {load_factor:.1f}: backward shift {shift:5.1f} us, legacy {legacy:5.1f} us per delete+insert")
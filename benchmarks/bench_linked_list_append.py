@@ -0,0 +1,58 @@
+"""
+Building a LinkedList by appending: the O(1) rear path against the previous append,
+which walked the whole list to find the node before the end.
+
+Usage: python -m benchmarks.bench_linked_list_append [number of elements]
+"""
+from __future__ import annotations
+import sys
+from time import perf_counter
+
+from data_structures.linked_list import LinkedList
+from data_structures.node import Node
+
+DEFAULT_ELEMENTS = 1000000
+# The walking append is quadratic, so it only builds lists up to this length
+LEGACY_MAX_ELEMENTS = 20000
+
+
+class LegacyLinkedList(LinkedList):
+    """ append walks from the head to the last node, like insert(len(self), item) did.
+    The walk is spelled out here, LinkedList's own node lookup now jumps straight to the rear.
+    """
+
+    def append(self, item) -> None:
+        new_node = Node(item)
+        if len(self) == 0:
+            self.head = new_node
+        else:
+            current = self.head
+            for _ in range(len(self) - 1):
+                current = current.link
+            current.link = new_node
+        self.rear = new_node
+        self.length += 1
+
+
+def build(list_class: type[LinkedList], num_elements: int) -> float:
+    start = perf_counter()
+    linked_list = list_class()
+    for i in range(num_elements):
+        linked_list.append(i)
+    elapsed = perf_counter() - start
+    assert len(linked_list) == num_elements and linked_list.rear.item == num_elements - 1
+    return elapsed
+
+
+def main(max_elements: int) -> None:
+    num_elements = 1000
+    while num_elements <= max_elements:
+        line = f"{num_elements:8d} elements: rear append {build(LinkedList, num_elements):7.3f} s"
+        if num_elements <= LEGACY_MAX_ELEMENTS:
+            line += f", walking append {build(LegacyLinkedList, num_elements):7.3f} s"
+        print(line)
+        num_elements *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ELEMENTS)
@@ -0,0 +1,56 @@
+"""
+Index-based scans of a LinkedList, `for i in range(len(lst)): lst[i]`, with the finger
+against the previous lookup that walked from the head on every access.
+
+Usage: python -m benchmarks.bench_linked_list_index [number of elements]
+"""
+from __future__ import annotations
+import sys
+from time import perf_counter
+
+from data_structures.linked_list import LinkedList
+
+DEFAULT_ELEMENTS = 100000
+# The head walk makes the scan quadratic, so it only scans lists up to this length
+LEGACY_MAX_ELEMENTS = 10000
+
+
+class LegacyLinkedList(LinkedList):
+    """ Every indexed access walks from the head. """
+
+    def _LinkedList__get_node_at_index(self, index: int):
+        if 0 <= index and index <= len(self):
+            current = self.head
+            for i in range(index):
+                current = current.link
+            return current
+        else:
+            raise ValueError('Index out of bounds')
+
+
+def scan(list_class: type[LinkedList], num_elements: int) -> float:
+    linked_list = list_class()
+    for i in range(num_elements):
+        linked_list.append(i)
+    start = perf_counter()
+    total = 0
+    for i in range(len(linked_list)):
+        linked_list[i] = linked_list[i] + 1
+        total += linked_list[i]
+    elapsed = perf_counter() - start
+    assert total == num_elements * (num_elements + 1) // 2
+    return elapsed
+
+
+def main(max_elements: int) -> None:
+    num_elements = 1000
+    while num_elements <= max_elements:
+        line = f"{num_elements:8d} elements: finger scan {scan(LinkedList, num_elements):7.3f} s"
+        if num_elements <= LEGACY_MAX_ELEMENTS:
+            line += f", head walk scan {scan(LegacyLinkedList, num_elements):7.3f} s"
+        print(line)
+        num_elements *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ELEMENTS)
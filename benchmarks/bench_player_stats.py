@@ -0,0 +1,57 @@
+"""
+Compares applying a game's player stats by scanning name lists for every player
+against applying per-player event counts keyed by player identity, on 15-player squads.
+
+Usage: python -m benchmarks.bench_player_stats
+"""
+from __future__ import annotations
+
+from benchmarks.league import best_of, make_league
+from constants import Constants, PlayerStats, ResultStats
+from game_simulator import GameSimulator, MatchResult
+from random_gen import RandomStream
+
+GAMES = 2000
+
+
+def apply_by_name(home, away, results: MatchResult) -> None:
+    """ The previous approach: a membership test and a full scan per player and stat. """
+    keys = ((ResultStats.GOAL_SCORERS, PlayerStats.GOALS), (ResultStats.GOAL_ASSISTS, PlayerStats.ASSISTS),
+            (ResultStats.INTERCEPTIONS, PlayerStats.INTERCEPTIONS), (ResultStats.TACKLES, PlayerStats.TACKLES))
+    names = [(results[key.value], stat) for key, stat in keys]
+    for team in (home, away):
+        for player in team.get_players():
+            player.statistics[PlayerStats.GAMES_PLAYED.value] += 1
+            for event_names, stat in names:
+                if event_names is not None and player.name in event_names:
+                    for name in event_names:
+                        if name == player.name:
+                            player.statistics[stat.value] += 1
+
+
+def apply_by_identity(home, away, results: MatchResult) -> None:
+    """ The current approach: one pass over the players, one over the events. """
+    for team in (home, away):
+        for player in team.get_players():
+            player.statistics[PlayerStats.GAMES_PLAYED.value] += 1
+    for player, counts in results.player_events().items():
+        for stat, count in zip(MatchResult.EVENT_STATS, counts):
+            if count > 0:
+                player.statistics[stat.value] += count
+
+
+def main() -> None:
+    teams = make_league(2, Constants.TEAM_MAX_PLAYERS)
+    home, away = teams[0], teams[1]
+    rng = RandomStream(2024)
+    results = [GameSimulator.simulate(home, away, rng) for _ in range(GAMES)]
+    events = sum(len(r.goal_scorers) + len(r.goal_assists) + len(r.tackles) + len(r.interceptions) for r in results)
+    print(f"{GAMES} games, {len(home) + len(away)} players per game, {events / GAMES:.1f} events per game")
+
+    for label, apply in (("scan names", apply_by_name), ("identity counts", apply_by_identity)):
+        elapsed = best_of(3, lambda: [apply(home, away, result) for result in results])
+        print(f"{label:>16}: {elapsed / GAMES * 1e6:8.1f} us per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Moving weeks around a schedule by week number, as delay_week_of_games does: the indexable
+skip list against the LinkedList the schedule used to be, where every move walks from the head.
+
+Usage: python -m benchmarks.bench_reschedule [largest number of weeks]
+"""
+from __future__ import annotations
+import sys
+from random import Random
+from time import perf_counter
+
+from data_structures.abstract_list import List
+from data_structures.indexable_skip_list import IndexableSkipList
+from data_structures.linked_list import LinkedList
+
+DEFAULT_WEEKS = 100000
+MOVES = 2000
+
+
+def reschedule(list_class: type[List], num_weeks: int) -> float:
+    schedule = list_class()
+    for week in range(num_weeks):
+        schedule.append(week)
+    # the same random (orig_week, new_week) moves for both classes
+    random = Random(num_weeks)
+    moves = [(random.randrange(num_weeks), random.randrange(num_weeks)) for _ in range(MOVES)]
+    start = perf_counter()
+    for orig_index, new_index in moves:
+        if isinstance(schedule, IndexableSkipList):
+            schedule.move(orig_index, new_index)
+        else:
+            schedule.insert(new_index, schedule.delete_at_index(orig_index))
+    elapsed = perf_counter() - start
+    assert len(schedule) == num_weeks
+    return elapsed / MOVES * 1e6
+
+
+def main(max_weeks: int) -> None:
+    num_weeks = 100
+    while num_weeks <= max_weeks:
+        print(f"{num_weeks:7d} weeks: skip list {reschedule(IndexableSkipList, num_weeks):8.1f} us per move, "
+              f"linked list {reschedule(LinkedList, num_weeks):8.1f} us per move")
+        num_weeks *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WEEKS)
@@ -0,0 +1,50 @@
+"""
+LinearProbeTable (grows at load 0.5) against RobinHoodTable (grows at load 0.85):
+slots used, probe distances and lookup times for hits and misses, on player names.
+
+Usage: python -m benchmarks.bench_robin_hood [number of keys]
+"""
+from __future__ import annotations
+import sys
+
+from benchmarks.league import best_of
+from data_structures.hash_table import LinearProbeTable
+from data_structures.robin_hood_table import RobinHoodTable
+
+# Fills RobinHoodTable past 0.8 of its 24593 slots, just under its growth threshold
+DEFAULT_KEYS = 20000
+LOOKUPS = 20000
+
+
+def distances(table: LinearProbeTable) -> list[int]:
+    return [(position - table.array[position][2]) % table.table_size
+            for position in range(table.table_size) if table.array[position] is not None]
+
+
+def main(num_keys: int) -> None:
+    keys = [f"Player {i}" for i in range(num_keys)]
+    missing = [f"Missing {i}" for i in range(LOOKUPS)]
+    hits = keys[::max(1, num_keys // LOOKUPS)]
+    for table_class in (LinearProbeTable, RobinHoodTable):
+        table = table_class()
+        for i, key in enumerate(keys):
+            table[key] = i
+        probe = distances(table)
+
+        def find_hits() -> None:
+            for key in hits:
+                table[key]
+
+        def find_misses() -> None:
+            for key in missing:
+                key in table
+
+        hit_time = best_of(3, find_hits) / len(hits) * 1e6
+        miss_time = best_of(3, find_misses) / len(missing) * 1e6
+        print(f"{table_class.__name__:>16}: {table.table_size:7d} slots (load {len(table) / table.table_size:.2f}), "
+              f"probe distance mean/max {sum(probe) / len(probe):6.2f}/{max(probe):4d}, "
+              f"hit {hit_time:5.2f} us, miss {miss_time:5.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_KEYS)
@@ -0,0 +1,52 @@
+"""
+Stat updates per second for the old hash table backed stats stores and the EnumTable,
+plus the same update through Team and Player.
+
+Usage: python -m benchmarks.bench_stat_updates
+"""
+from __future__ import annotations
+
+from benchmarks.league import best_of, make_league
+from constants import PlayerStats, TeamStats
+from data_structures.enum_table import EnumTable
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+
+UPDATES = 50000
+
+
+def table_updates(table, key: str) -> None:
+    for _ in range(UPDATES):
+        table[key] += 1
+
+
+def main() -> None:
+    cases = [
+        ("HashyStepTable (team)", HashyStepTable(), TeamStats, TeamStats.GOALS_FOR.value),
+        ("EnumTable (team)", EnumTable(TeamStats), TeamStats, TeamStats.GOALS_FOR.value),
+        ("HashyPerfectionTable (player)", HashyPerfectionTable(), PlayerStats, PlayerStats.GOALS.value),
+        ("EnumTable (player)", EnumTable(PlayerStats), PlayerStats, PlayerStats.GOALS.value),
+    ]
+    for name, table, stats, key in cases:
+        for stat in stats:
+            table[stat.value] = 0
+        seconds = best_of(3, lambda: table_updates(table, key))
+        print(f"{name:>30}: {UPDATES / seconds / 1e6:5.2f} M updates/s")
+
+    team = make_league(num_teams=1)[0]
+    player = next(iter(team.get_players()))
+
+    def team_updates() -> None:
+        for _ in range(UPDATES):
+            team[TeamStats.GOALS_FOR] += 1
+
+    def player_updates() -> None:
+        for _ in range(UPDATES):
+            player[PlayerStats.GOALS] += 1
+
+    print(f"{'team[TeamStats.GOALS_FOR] += 1':>30}: {UPDATES / best_of(3, team_updates) / 1e6:5.2f} M updates/s")
+    print(f"{'player[PlayerStats.GOALS] += 1':>30}: {UPDATES / best_of(3, player_updates) / 1e6:5.2f} M updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Probe-length histograms for HashyStepTable with the previous first-letter step hash
+and the full-key step hash, on the stat names and on a league's worth of player names.
+
+Usage: python -m benchmarks.bench_step_hash
+"""
+from __future__ import annotations
+
+from benchmarks.bench_step_table_churn import probe_length
+from benchmarks.league import player_names
+from constants import PlayerStats, ResultStats, TeamStats
+from hashy_step_table import HashyStepTable
+
+
+class FirstLetterStepTable(HashyStepTable):
+    """ The previous step hash, derived from the first character only. """
+
+    def hash2(self, key: str) -> int:
+        return ((ord(key[0]) - ord("A")) % (self.table_size - 1)) + 1
+
+
+def histogram(table_class: type[HashyStepTable], keys: list[str]) -> tuple[dict[int, int], int]:
+    table = table_class()
+    for i, key in enumerate(keys):
+        table[key] = i
+    counts: dict[int, int] = {}
+    for key in keys:
+        length = probe_length(table, key)
+        counts[length] = counts.get(length, 0) + 1
+    return counts, table.table_size
+
+
+def main() -> None:
+    key_sets = {
+        "stat names": [stat.value for enum in (PlayerStats, TeamStats, ResultStats) for stat in enum],
+        "player names": player_names(),
+    }
+    for label, keys in key_sets.items():
+        keys = list(dict.fromkeys(keys))
+        print(f"{label} ({len(keys)} keys)")
+        for table_class in (FirstLetterStepTable, HashyStepTable):
+            counts, size = histogram(table_class, keys)
+            mean = sum(length * n for length, n in counts.items()) / len(keys)
+            bars = ", ".join(f"{length}:{counts[length]}" for length in sorted(counts))
+            print(f"  {table_class.__name__:>21} (size {size}): mean {mean:.2f}, max {max(counts)}  [{bars}]")
+
+
+if __name__ == "__main__":
+    main()
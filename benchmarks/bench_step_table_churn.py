@@ -0,0 +1,81 @@
+"""
+Churn-heavy insert/delete workload on HashyStepTable: a fixed number of live keys,
+where every round deletes the oldest key and inserts a new one.
+Reports probe lengths of successful lookups and of unsuccessful lookups (which must
+walk until an empty slot) with and without tombstone reclamation.
+
+Usage: python -m benchmarks.bench_step_table_churn
+"""
+from __future__ import annotations
+from time import perf_counter
+
+from hashy_step_table import HashyStepTable
+
+LIVE_KEYS = 200
+ROUNDS = 20000
+REPORT_EVERY = 4000
+
+
+class LegacyStepTable(HashyStepTable):
+    """ The previous deletion: tombstones are never counted, reused or purged. """
+
+    def __setitem__(self, key, data) -> None:
+        position = self._hashy_probe_legacy(key)
+        if self.array[position] is None:
+            self.count += 1
+            self.slots.add(position)
+        self.array[position] = (key, data)
+        if len(self) > self.table_size * 2 / 3:
+            self._rehash()
+
+    def __delitem__(self, key) -> None:
+        # the (key, sentinel) pair keeps its slot, and is carried over by rehashes
+        position = self._hashy_probe(key, False)
+        self.array[position] = (key, self.sentinel)
+        self.count -= 1
+
+    def _hashy_probe_legacy(self, key) -> int:
+        position = self.hash(key)
+        jump = self.hash2(key)
+        for _ in range(self.table_size):
+            if self.array[position] is None or self.array[position][0] == key:
+                return position
+            position = (position + jump) % self.table_size
+        raise RuntimeError("Table is full of tombstones")
+
+
+def probe_length(table: HashyStepTable, key: str) -> int:
+    """ Number of slots visited until the key (or an empty slot) is found. """
+    position, jump = table.hash(key), table.hash2(key)
+    for probes in range(1, table.table_size + 1):
+        item = table.array[position]
+        if item is None or (item is not table.sentinel and item[0] == key):
+            return probes
+        position = (position + jump) % table.table_size
+    return table.table_size
+
+
+def churn(table: HashyStepTable) -> None:
+    print(type(table).__name__)
+    for i in range(LIVE_KEYS):
+        table[f"Player {i}"] = i
+    start = perf_counter()
+    for i in range(LIVE_KEYS, LIVE_KEYS + ROUNDS):
+        try:
+            del table[f"Player {i - LIVE_KEYS}"]
+            table[f"Player {i}"] = i
+        except RuntimeError as error:
+            print(f"  round {i - LIVE_KEYS}: {error}")
+            return
+        if (i - LIVE_KEYS + 1) % REPORT_EVERY == 0:
+            hits = [probe_length(table, f"Player {j}") for j in range(i - LIVE_KEYS + 1, i + 1)]
+            misses = [probe_length(table, f"Missing {j}") for j in range(LIVE_KEYS)]
+            print(f"  round {i - LIVE_KEYS + 1:6d}: size {table.table_size:5d}, "
+                  f"hit mean/max {sum(hits) / len(hits):6.2f}/{max(hits):4d}, "
+                  f"miss mean/max {sum(misses) / len(misses):7.2f}/{max(misses):4d}")
+    print(f"  {(perf_counter() - start) / ROUNDS * 1e6:.1f} us per delete+insert")
+
+
+if __name__ == "__main__":
+    churn(HashyStepTable())
+    churn(LegacyStepTable())
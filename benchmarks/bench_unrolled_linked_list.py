@@ -0,0 +1,65 @@
+"""
+Memory (tracemalloc) and throughput of UnrolledLinkedList against LinkedList:
+building by appends, a full iteration, and inserts/deletes in the middle.
+
+Usage: python -m benchmarks.bench_unrolled_linked_list [largest number of elements]
+"""
+from __future__ import annotations
+import sys
+import tracemalloc
+from random import Random
+from time import perf_counter
+
+from benchmarks.league import best_of
+from data_structures.abstract_list import List
+from data_structures.linked_list import LinkedList
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+DEFAULT_ELEMENTS = 1000000
+# Middle inserts and deletes walk half the list, so only this many pairs run per size
+MIDDLE_OPERATIONS = 100
+
+
+def measure(list_class: type[List], num_elements: int) -> str:
+    # build the elements first so only the list itself is measured
+    elements = list(range(num_elements))
+    tracemalloc.start()
+    start = perf_counter()
+    lst = list_class()
+    for element in elements:
+        lst.append(element)
+    build_time = perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    def iterate() -> None:
+        for _ in lst:
+            pass
+
+    iterate_time = best_of(3, iterate)
+
+    # random positions in the middle half of the list, the same ones for both classes
+    random = Random(num_elements)
+    indices = [random.randrange(num_elements // 4, 3 * num_elements // 4) for _ in range(MIDDLE_OPERATIONS)]
+    start = perf_counter()
+    for index in indices:
+        lst.insert(index, -1)
+        lst.delete_at_index(index + 1)
+    middle_time = (perf_counter() - start) / (2 * MIDDLE_OPERATIONS) * 1e6
+    assert len(lst) == num_elements
+
+    return (f"{list_class.__name__:>20}: {memory / num_elements:6.1f} B per element, build {build_time:6.3f} s, "
+            f"iterate {iterate_time:6.3f} s, middle insert/delete {middle_time:8.1f} us")
+
+
+def main(max_elements: int) -> None:
+    num_elements = 10000
+    while num_elements <= max_elements:
+        print(f"{num_elements} elements")
+        for list_class in (LinkedList, UnrolledLinkedList):
+            print(measure(list_class, num_elements))
+        num_elements *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ELEMENTS)
@@ -0,0 +1,73 @@
+"""
+Shared helpers for building deterministic leagues in the benchmarks.
+
+Run any benchmark from the repository root, e.g. `python -m benchmarks.bench_leaderboard`.
+"""
+from __future__ import annotations
+from time import perf_counter
+from typing import Callable
+
+from constants import Constants, PlayerPosition, PlayerStats
+from data_structures.referential_array import ArrayR
+from player import Player
+from random_gen import RandomGen
+from team import Team
+
+# The name pools of the task 5 test roster, for benchmarks that need realistic player names
+FIRST_NAMES = ['Abey', 'Alexey', 'Ann', 'Alexandria', 'Ben', 'Bavley', 'Brett', 'Brendon', 'Chloe',
+               'Christian', 'Daniel', 'Fermi', 'Hui', 'Laura', 'Lisa', 'Maria', 'Matthew', 'Patrick',
+               'Rupert', 'Saksham', 'Yasmeen']
+LAST_NAMES = ['Bot', 'Bellingham', 'Bonmatí', 'Caicedo', 'Danial', 'Fernandes', 'Francis', 'Hernández',
+              'Henry', 'Iniesta', 'Kerr', 'Messi', 'Mbappé', 'Modric', 'Pearson',
+              'Peterson', 'Ronaldo', 'Roberto', 'Stacie', 'Sparks', 'Wright', 'York', 'Zidane']
+
+
+def make_league(num_teams: int = Constants.MAX_NUM_TEAMS,
+                num_players: int = Constants.TEAM_MAX_PLAYERS,
+                seed: int = 123) -> ArrayR[Team]:
+    """
+    Builds a league of teams with unique player names and seeded attributes.
+
+    Args:
+        num_teams (int): The number of teams in the league.
+        num_players (int): The number of players in every squad.
+        seed (int): The seed used for the player attributes.
+
+    Returns:
+        ArrayR[Team]: The teams of the league.
+    """
+    RandomGen.set_seed(seed)
+    positions = list(PlayerPosition)
+    teams: ArrayR[Team] = ArrayR(num_teams)
+    for i in range(num_teams):
+        players: ArrayR[Player] = ArrayR(num_players)
+        for j in range(num_players):
+            # keep a goalkeeper in every squad and spread the rest over the outfield positions
+            position = PlayerPosition.GOALKEEPER if j == 0 else positions[1 + j % (len(positions) - 1)]
+            player = Player(f"Player {i}-{j}", position, RandomGen.randint(18, 30))
+            player[PlayerStats.WEIGHT] = RandomGen.randint(70, 90)
+            player[PlayerStats.HEIGHT] = RandomGen.randint(150, 180)
+            player[PlayerStats.STAR_SKILL] = RandomGen.randint(0, 5)
+            player[PlayerStats.WEAK_FOOT_ABILITY] = RandomGen.randint(0, 5)
+            players[j] = player
+        teams[i] = Team(f"Team {i:02d}", players)
+    return teams
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> float:
+    """
+    Returns the fastest wall-clock time (in seconds) of `repeats` calls to `func`.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def player_names() -> list[str]:
+    """
+    Returns every "first last" combination of the name pools.
+    """
+    return [f"{first_name} {last_name}" for first_name in FIRST_NAMES for last_name in LAST_NAMES]
@@ -0,0 +1,138 @@
+""" Direct-addressed table for the members of a closed Enum. """
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from enum import Enum
+from typing import Generic, TypeVar, Union
+
+from data_structures.referential_array import ArrayR
+
+V = TypeVar('V')
+
+
+class EnumTable(Generic[V]):
+    """
+    Maps the members of an Enum to values, storing each value at the member's ordinal
+    (its position in the Enum) in a fixed-size array. No hashing or probing is needed,
+    and since the key set is closed the table never resizes.
+
+    Keys may be given either as the member (`TeamStats.WINS`) or as its value (`"Wins"`),
+    so the table is a drop-in replacement for the string keyed hash tables.
+
+    attributes:
+        enum: the Enum class whose members are the keys
+        array: the values, indexed by ordinal
+        count: number of members with a value
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    __slots__ = ("enum", "ordinals", "array", "count")
+
+    # Ordinal lookup per Enum class, built once: member -> ordinal and value -> ordinal
+    _ordinals: dict[type[Enum], dict] = {}
+    # Marks slots that hold no value, so None can still be stored
+    _EMPTY = object()
+
+    def __init__(self, enum: type[Enum]) -> None:
+        """
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        self.enum = enum
+        if enum not in EnumTable._ordinals:
+            ordinals = {}
+            for ordinal, member in enumerate(enum):
+                ordinals[member] = ordinal
+                ordinals[member.value] = ordinal
+            EnumTable._ordinals[enum] = ordinals
+        self.ordinals = EnumTable._ordinals[enum]
+        self.array: ArrayR[V] = ArrayR(len(enum))
+        for i in range(len(self.array)):
+            self.array[i] = EnumTable._EMPTY
+        self.count = 0
+
+    def _ordinal(self, key: Union[Enum, str]) -> int:
+        """
+        :raises KeyError: when the key is not a member (or member value) of the enum
+        """
+        try:
+            return self.ordinals[key]
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __getitem__(self, key: Union[Enum, str]) -> V:
+        """
+        Get the value of a member.
+        :raises KeyError: when the key is not in the enum or has no value
+        """
+        value = self.array[self._ordinal(key)]
+        if value is EnumTable._EMPTY:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Union[Enum, str], data: V) -> None:
+        """
+        Set the value of a member.
+        :raises KeyError: when the key is not in the enum
+        """
+        ordinal = self._ordinal(key)
+        if self.array[ordinal] is EnumTable._EMPTY:
+            self.count += 1
+        self.array[ordinal] = data
+
+    def __delitem__(self, key: Union[Enum, str]) -> None:
+        """
+        Remove the value of a member.
+        :raises KeyError: when the key is not in the enum or has no value
+        """
+        ordinal = self._ordinal(key)
+        if self.array[ordinal] is EnumTable._EMPTY:
+            raise KeyError(key)
+        self.array[ordinal] = EnumTable._EMPTY
+        self.count -= 1
+
+    def __contains__(self, key: Union[Enum, str]) -> bool:
+        """
+        Checks to see if the given member has a value.
+        """
+        ordinal = self.ordinals.get(key) if isinstance(key, (Enum, str)) else None
+        return ordinal is not None and self.array[ordinal] is not EnumTable._EMPTY
+
+    def __len__(self) -> int:
+        """
+        Returns the number of members with a value.
+        """
+        return self.count
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == len(self.array)
+
+    def keys(self) -> tuple[Enum, ...]:
+        """
+        Returns the members with a value, in Enum order.
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        return tuple(member for ordinal, member in enumerate(self.enum) if self.array[ordinal] is not EnumTable._EMPTY)
+
+    def values(self) -> tuple[V, ...]:
+        """
+        Returns the values, in Enum order.
+        :complexity: O(M) where M is the number of members of the enum
+        """
+        return tuple(value for value in self.array if value is not EnumTable._EMPTY)
+
+    def __str__(self) -> str:
+        """
+        Returns all the (member value, value) pairs in Enum order.
+        :complexity: O(M * (str(key) + str(value))) where M is the number of members of the enum
+        """
+        result = ""
+        for ordinal, member in enumerate(self.enum):
+            if self.array[ordinal] is not EnumTable._EMPTY:
+                result += "(" + str(member.value) + "," + str(self.array[ordinal]) + ")\n"
+        return result
+
+    def __repr__(self) -> str:
+        return str(self)
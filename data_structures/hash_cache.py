@@ -0,0 +1,77 @@
+""" Bounded memo of key hashes, shared by the hash tables. """
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class HashCache:
+    """
+    Remembers hash values per (key, table size, hash function), so hashing a key that was seen
+    before costs one dictionary lookup instead of a walk over its characters.
+
+    The hash tables opt in through their `hash_cache` attribute, either for a single table
+    (`table.hash_cache = HashCache()`) or for every instance of a class
+    (`HashyStepTable.hash_cache = HashCache()`). The hash function is identified by the class of
+    the table and the method computing it, so subclasses inheriting a class wide cache with other
+    hash parameters (HASH_BASE, OFFSET, ...) or another algorithm never see each other's hashes.
+
+    When full, the least recently used entry is evicted, so the hot keys stay cached.
+
+    attributes:
+        capacity: maximum number of remembered hashes
+        hits: number of lookups answered from the cache
+        misses: number of lookups that had to compute the hash
+    """
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        :complexity: O(1)
+        :raises ValueError: when the capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Cache capacity should be larger than 0.")
+        self.capacity = capacity
+        self.entries: OrderedDict[tuple, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable, table_size: int, compute: Callable[[Hashable], int]) -> int:
+        """
+        Returns the hash of `key` for a table of `table_size` slots, calling `compute(key)` on a miss.
+        `compute` is a bound method of the table, such as `table._hash`.
+        :complexity best: O(1) the hash is cached
+        :complexity worst: O(compute(key)) the hash has to be computed
+        """
+        token = (key, table_size, type(compute.__self__), compute.__func__)
+        value = self.entries.get(token)
+        if value is not None:
+            self.hits += 1
+            self.entries.move_to_end(token)
+            return value
+
+        self.misses += 1
+        value = compute(key)
+        if len(self.entries) >= self.capacity:
+            # entries are kept in order of use, so the first one is the least recently used
+            self.entries.popitem(last=False)
+        self.entries[token] = value
+        return value
+
+    def clear(self) -> None:
+        """
+        Forgets every cached hash.
+        :complexity: O(1)
+        """
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached hashes.
+        :complexity: O(1)
+        """
+        return len(self.entries)
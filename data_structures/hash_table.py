@@ -7,8 +7,8 @@ __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
 
-from typing import TypeVar, Generic
-from data_structures.referential_array import ArrayR
+from typing import TypeVar
+from data_structures.open_addressing_table import OpenAddressingTable
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -18,10 +18,13 @@ class FullError(Exception):
     pass
 
 
-class LinearProbeTable(Generic[K, V]):
+class LinearProbeTable(OpenAddressingTable[K, V]):
     """
     Linear Probe Table.
 
+    Entries are (key, value, home) where home is the hash of the key, kept so that
+    deletions can shift entries back without rehashing them.
+
     Type Arguments:
         - K:    Key Type. In most cases should be string.
                 Otherwise `hash` should be overwritten.
@@ -30,45 +33,6 @@ class LinearProbeTable(Generic[K, V]):
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
-    # No test case should exceed 1 million entries.
-    TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
-
-    HASH_BASE = 31
-
-    def __init__(self, sizes=None) -> None:
-        """
-        Initialise the Hash Table.
-        """
-        if sizes is not None:
-            self.TABLE_SIZES = sizes
-        self.size_index = 0
-        self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-
-    def hash(self, key: K) -> int:
-        """
-        Hash a key for insert/retrieve/update into the hashtable.
-
-        :complexity: O(len(key))
-        """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
-
-    @property
-    def table_size(self) -> int:
-        return len(self.array)
-
-    def __len__(self) -> int:
-        """
-        Returns number of elements in the hash table
-        """
-        return self.count
-
     def _linear_probe(self, key: K, is_insert: bool) -> int:
         """
         Find the correct position for this key in the hash table using linear probing.
@@ -78,8 +42,18 @@ class LinearProbeTable(Generic[K, V]):
         :raises KeyError: When the key is not in the table, but is_insert is False.
         :raises FullError: When a table is full and cannot be inserted.
         """
-        # Initial position
-        position = self.hash(key)
+        return self._probe_from(self.hash(key), key, is_insert)
+
+    def _probe_from(self, home: int, key: K, is_insert: bool) -> int:
+        """
+        Linear probe for this key starting from its already computed home position.
+        :complexity best: O(1) first position is empty
+        :complexity worst: O(N*comp(K)) when we've searched the entire table
+                        where N is the tablesize
+        :raises KeyError: When the key is not in the table, but is_insert is False.
+        :raises FullError: When a table is full and cannot be inserted.
+        """
+        position = home
 
         for _ in range(self.table_size):
             if self.array[position] is None:
@@ -99,47 +73,6 @@ class LinearProbeTable(Generic[K, V]):
         else:
             raise KeyError(key)
 
-    def keys(self) -> ArrayR[K]:
-        """
-        Returns all keys in the hash table.
-
-        :complexity: O(N) where N is self.table_size.
-        """
-        res = ArrayR(self.count)
-        i = 0
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res[i] = self.array[x][0]
-                i += 1
-        return res
-
-    def values(self) -> ArrayR[V]:
-        """
-        Returns all values in the hash table.
-
-        :complexity: O(N) where N is self.table_size.
-        """
-        res = ArrayR(self.count)
-        i = 0
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res[i] = self.array[x][1]
-                i += 1
-        return res
-
-    def __contains__(self, key: K) -> bool:
-        """
-        Checks to see if the given key is in the Hash Table
-
-        :complexity: See linear probe.
-        """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
-
     def __getitem__(self, key: K) -> V:
         """
         Get the value at a certain key
@@ -158,43 +91,43 @@ class LinearProbeTable(Generic[K, V]):
         :raises FullError: when the table cannot be resized further.
         """
 
-        position = self._linear_probe(key, True)
+        home = self.hash(key)
+        position = self._probe_from(home, key, True)
 
         if self.array[position] is None:
             self.count += 1
+            self.slots.add(position)
 
-        self.array[position] = (key, data)
+        self.array[position] = (key, data, home)
 
-        if len(self) > self.table_size / 2:
+        if len(self) > self.table_size * self.MAX_LOAD_FACTOR:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
         """
         Deletes a (key, value) pair in our hash table.
+        The rest of the cluster is shifted back into the hole, an entry only moves when the hole
+        lies between its home position and its current one, so no key is rehashed.
 
         :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
-        :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+        :complexity worst: O(hash(key) + N*comp(K)) deleting item is midway through large chain.
         :raises KeyError: when the key doesn't exist.
         """
-        position = self._linear_probe(key, False)
-        # Remove the element
-        self.array[position] = None
+        hole = self._linear_probe(key, False)
         self.count -= 1
         # Start moving over the cluster
-        position = (position + 1) % self.table_size
+        position = (hole + 1) % self.table_size
         while self.array[position] is not None:
-            key2, value = self.array[position]
-            self.array[position] = None
-            # Reinsert.
-            newpos = self._linear_probe(key2, True)
-            self.array[newpos] = (key2, value)
+            home = self.array[position][2]
+            # The entry may fill the hole if it does not move in front of its home position
+            if (position - home) % self.table_size >= (position - hole) % self.table_size:
+                self.array[hole] = self.array[position]
+                hole = position
             position = (position + 1) % self.table_size
-
-    def is_empty(self) -> bool:
-        return self.count == 0
-
-    def is_full(self) -> bool:
-        return self.count == self.table_size
+        # Shifting keeps every other slot of the cluster occupied, only the last hole empties
+        self.array[hole] = None
+        self.slots.remove(hole)
+        self._shrink_if_sparse()
 
     def _rehash(self) -> None:
         """
@@ -204,27 +137,20 @@ class LinearProbeTable(Generic[K, V]):
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
         """
-        old_array = self.array
-        self.size_index += 1
-        if self.size_index == len(self.TABLE_SIZES):
+        if self.size_index + 1 >= len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-        for item in old_array:
-            if item is not None:
-                key, value = item
-                self[key] = value
-
-    def __str__(self) -> str:
+        self._resize(self.size_index + 1)
+
+    def _resize(self, size_index: int) -> None:
         """
-        Returns all they key/value pairs in our hash table (no particular
-        order).
-        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        Rebuilds the table with size TABLE_SIZES[size_index], reinserting all values.
+
+        :complexity best: O(N*hash(K) + M) No probing.
+        :complexity worst: O(N*hash(K) + N^2*comp(K) + M) Lots of probing.
+        Where N is len(self) and M is the new table size
         """
-        result = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+        old_items = list(self.items())
+        self._allocate(size_index)
+        for key, value in old_items:
+            self[key] = value
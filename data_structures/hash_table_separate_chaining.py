@@ -1,20 +1,177 @@
 """ Hash Table ADT
 
-Defines a Hash Table using Linear Probing for conflict resolution.
-It currently rehashes the primary cluster to handle deletion.
+Defines a Hash Table using Separate Chaining for conflict resolution.
+The chains are linked lists (LinkedBucket) or contiguous arrays (ArrayBucket).
 """
 __author__ = 'Brendon Taylor & Rupert Ebeling'
 __docformat__ = 'reStructuredText'
 __modified__ = '15/08/2023'
 __since__ = '31/03/2023'
 
+from data_structures.hash_cache import HashCache
+from data_structures.hash_table import LinearProbeTable
 from data_structures.referential_array import ArrayR
 from data_structures.linked_list import LinkedList
-from typing import TypeVar, Generic
+from typing import Iterable, TypeVar, Generic, Union
 
 T = TypeVar('T')
 
 
+class LinkedBucket(LinkedList[tuple[str, T]]):
+    """
+    Chain of (key, data) nodes, the default bucket.
+    Buckets do not store hashes, so every entry is rehashed when the table resizes.
+    """
+    STORES_HASHES = False
+
+    def get(self, key: str, key_hash: Union[int, None]) -> T:
+        """
+        :complexity: O(C*comp(K)) where C is the chain length
+        :raises KeyError: when the key doesn't exist
+        """
+        node = self.head
+        while node is not None:
+            if node.item[0] == key:
+                return node.item[1]
+            node = node.link
+        raise KeyError(key)
+
+    def set(self, key: str, key_hash: Union[int, None], data: T) -> bool:
+        """
+        Updates the data of the key in place, or adds the key when it is new.
+        Returns whether the key was added.
+        :complexity: O(C*comp(K)) where C is the chain length
+        """
+        node = self.head
+        while node is not None:
+            if node.item[0] == key:
+                node.item = (key, data)
+                return False
+            node = node.link
+        # The whole chain was walked already, so the key goes in front in O(1)
+        self.insert(0, (key, data))
+        return True
+
+    def add(self, key: str, key_hash: Union[int, None], data: T) -> None:
+        """
+        Adds a key known not to be in the bucket.
+        :complexity: O(1)
+        """
+        self.insert(0, (key, data))
+
+    def delete(self, key: str, key_hash: Union[int, None]) -> None:
+        """
+        :complexity: O(C*comp(K)) where C is the chain length
+        :raises KeyError: when the key doesn't exist
+        """
+        index = 0
+        node = self.head
+        while node is not None:
+            if node.item[0] == key:
+                self.delete_at_index(index)
+                return
+            node = node.link
+            index += 1
+        raise KeyError(key)
+
+    def entries(self):
+        """
+        Yields the (hash, key, data) of every entry, hash being None.
+        :complexity: O(C) where C is the chain length
+        """
+        node = self.head
+        while node is not None:
+            yield None, node.item[0], node.item[1]
+            node = node.link
+
+
+class ArrayBucket(Generic[T]):
+    """
+    Bucket holding its entries contiguously in a single list as hash, key, data triples.
+    The full hash of every key is stored inline: comparing it first skips most key comparisons,
+    and the table resizes without hashing any key again.
+    """
+    __slots__ = ("items",)
+    STORES_HASHES = True
+
+    def __init__(self) -> None:
+        self.items: list = []
+
+    def __len__(self) -> int:
+        return len(self.items) // 3
+
+    def _find(self, key: str, key_hash: int) -> int:
+        """
+        Returns the index of the hash of the key in `items`, -1 when it is not in the bucket.
+        :complexity: O(C) where C is the bucket length, plus comp(K) per matching hash
+        """
+        items = self.items
+        for i in range(0, len(items), 3):
+            if items[i] == key_hash and items[i + 1] == key:
+                return i
+        return -1
+
+    def get(self, key: str, key_hash: int) -> T:
+        """
+        :complexity: See _find.
+        :raises KeyError: when the key doesn't exist
+        """
+        i = self._find(key, key_hash)
+        if i < 0:
+            raise KeyError(key)
+        return self.items[i + 2]
+
+    def set(self, key: str, key_hash: int, data: T) -> bool:
+        """
+        Updates the data of the key in place, or adds the key when it is new.
+        Returns whether the key was added.
+        :complexity: See _find.
+        """
+        i = self._find(key, key_hash)
+        if i >= 0:
+            self.items[i + 2] = data
+            return False
+        self.items += (key_hash, key, data)
+        return True
+
+    def add(self, key: str, key_hash: int, data: T) -> None:
+        """
+        Adds a key known not to be in the bucket.
+        :complexity: O(1) amortised
+        """
+        self.items += (key_hash, key, data)
+
+    def delete(self, key: str, key_hash: int) -> None:
+        """
+        Moves the last entry into the place of the deleted one.
+        :complexity: See _find.
+        :raises KeyError: when the key doesn't exist
+        """
+        i = self._find(key, key_hash)
+        if i < 0:
+            raise KeyError(key)
+        last = len(self.items) - 3
+        self.items[i:i + 3] = self.items[last:]
+        del self.items[last:]
+
+    def entries(self):
+        """
+        Yields the (hash, key, data) of every entry.
+        :complexity: O(C) where C is the bucket length
+        """
+        items = self.items
+        for i in range(0, len(items), 3):
+            yield items[i], items[i + 1], items[i + 2]
+
+    def __iter__(self):
+        """
+        Iterates over the (key, data) pairs, like a LinkedBucket.
+        :complexity: O(C) where C is the bucket length
+        """
+        for _, key, data in self.entries():
+            yield key, data
+
+
 class HashTableSeparateChaining(Generic[T]):
     """
     Separate Chaining Hash Table
@@ -23,22 +180,42 @@ class HashTableSeparateChaining(Generic[T]):
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
+        DEFAULT_LOAD_FACTOR: default mean chain length at which the table grows
+        TABLE_SIZES: the prime sizes the table grows and shrinks along
+        FULL_HASH_MODULUS: modulus of the table size independent hash stored by array buckets
 
     attributes:
         count: number of elements in the hash table
         array: used to represent our internal array
+        load_factor: the table grows once count exceeds load_factor * table size, and
+            shrinks (never below its initial size) once count drops under a quarter of that
+        min_size: the initial table size
+        bucket: the bucket class, LinkedBucket (linked chains) or ArrayBucket (contiguous entries with inline hashes)
     """
     MIN_CAPACITY = 1
 
     DEFAULT_TABLE_SIZE = 17
     DEFAULT_HASH_BASE = 31
+    DEFAULT_LOAD_FACTOR = 1.0
+    TABLE_SIZES = LinearProbeTable.TABLE_SIZES
+    FULL_HASH_MODULUS = (1 << 31) - 1
+
+    # Opt-in memo of key hashes, see HashCache.
+    hash_cache: Union[HashCache, None] = None
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, load_factor: float = DEFAULT_LOAD_FACTOR,
+                 bucket: type = LinkedBucket) -> None:
         """
         :complexity: O(A) where A is complexity of ArrayR.__init__()
+        :raises ValueError: when the load factor is not positive
         """
+        if load_factor <= 0:
+            raise ValueError("The load factor must be positive")
+        self.bucket = bucket
         self.count = 0
-        self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.load_factor = load_factor
+        self.min_size = max(self.MIN_CAPACITY, table_size)
+        self.table = ArrayR(self.min_size)
 
     def __len__(self) -> int:
         """
@@ -47,46 +224,111 @@ class HashTableSeparateChaining(Generic[T]):
         """
         return self.count
 
+    def _locate(self, key: str) -> tuple[int, Union[int, None]]:
+        """
+        Returns the position of the key, and its full hash when the buckets store hashes.
+        :complexity: O(K) where K is the size of the key, O(1) when found in the hash cache
+        """
+        if self.bucket.STORES_HASHES:
+            key_hash = self.full_hash(key)
+            return key_hash % len(self.table), key_hash
+        return self.hash(key), None
+
     def __delitem__(self, key: str) -> None:
         """
         Deletes an item from our hash table
+        :complexity: O(hash(key) + C*comp(K)) where C is the chain length,
+            plus O(N) when the delete shrinks the table
         :raises KeyError: when the key doesn't exist
         """
-        position = self.hash(key)
-        if self.table[position] is None:
+        position, key_hash = self._locate(key)
+        chain = self.table[position]
+        if chain is None:
             raise KeyError(key)
 
-        for index, item in enumerate(self.table[position]):
-            if item[0] == key:
-                if len(self.table[position]) <= 1:
-                    self.table[position] = None
-                else:
-                    self.table[position].delete_at_index(index)
+        chain.delete(key, key_hash)
+        if len(chain) == 0:
+            self.table[position] = None
+        self.count -= 1
+        if len(self.table) > self.min_size and self.count < len(self.table) * self.load_factor / 4:
+            self._resize(grow=False)
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+        Set a (key, data) pair in our hash table
+        :complexity: O(hash(key) + C*comp(K)) where C is the chain length,
+            plus O(N) when the insert grows the table
+        """
+        position, key_hash = self._locate(key)
+        chain = self.table[position]
+        if chain is None:
+            chain = self.bucket()
+            self.table[position] = chain
+
+        if chain.set(key, key_hash, data):
+            self.count += 1
+            if self.count > len(self.table) * self.load_factor:
+                self._resize(grow=True)
 
-                self.count -= 1
+    def _resize(self, grow: bool) -> None:
+        """
+        Moves every item to a table of the next (or previous) size of TABLE_SIZES.
+        :complexity: See _rebuild.
+        """
+        if grow:
+            larger = [size for size in self.TABLE_SIZES if size > len(self.table)]
+            if len(larger) == 0:
+                # Cannot be resized further, the chains just get longer.
                 return
+            new_size = larger[0]
+        else:
+            smaller = [size for size in self.TABLE_SIZES if self.min_size <= size < len(self.table)]
+            new_size = smaller[-1] if len(smaller) > 0 else self.min_size
+        self._rebuild(new_size)
 
-        raise KeyError(key)
+    def _rebuild(self, new_size: int) -> None:
+        """
+        Moves every item to a table of `new_size` chains.
+        Keys are known to be distinct, so items are added to their new chains without searching them.
+        Keys are only hashed again when the buckets do not store their hashes.
+        :complexity: O(N*hash(K) + M) where N is the number of items and M is the new table size,
+            O(N + M) with stored hashes
+        """
+        old_table = self.table
+        self.table = ArrayR(new_size)
+        for chain in old_table:
+            if chain is not None:
+                for key_hash, key, data in chain.entries():
+                    position = self.hash(key) if key_hash is None else key_hash % new_size
+                    if self.table[position] is None:
+                        self.table[position] = self.bucket()
+                    self.table[position].add(key, key_hash, data)
 
-    def __setitem__(self, key: str, data: T) -> None:
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, T]], table_size: int = DEFAULT_TABLE_SIZE,
+                   load_factor: float = DEFAULT_LOAD_FACTOR, bucket: type = LinkedBucket) -> "HashTableSeparateChaining[T]":
         """
-        Set a (key, data) pair in our hash table
+        Builds a table from (key, data) pairs, sized for all of them up front.
+        :complexity: See update.
+        """
+        table = cls(table_size, load_factor, bucket)
+        table.update(items)
+        return table
+
+    def update(self, items: Iterable[tuple[str, T]]) -> None:
+        """
+        Sets every (key, data) pair. The table grows once, straight to the smallest size of
+        TABLE_SIZES that holds all of them, instead of rebuilding at every intermediate size.
+        :complexity: O(N*(hash(K) + C*comp(K)) + M) where N is the number of items (old and new),
+            C is the chain length and M is the final table size
         """
-        position = self.hash(key)
-        if self.table[position] is None:
-            self.table[position] = LinkedList()
-
-        # Attempt to find the key in our linked list
-        if len(self.table[position]) > 0:
-            for index, item in enumerate(self.table[position]):
-                if item[0] == key:
-                    # If found update the data
-                    self.table[position][index] = (key, data)
-                    return
-                
-        # self.table[position].insert(0, (key, data)) # To insert at the beginning 
-        self.table[position].append((key, data))
-        self.count += 1
+        items = list(items)
+        needed = len(self) + len(items)
+        if needed > len(self.table) * self.load_factor:
+            fitting = [size for size in self.TABLE_SIZES if size > len(self.table) and needed <= size * self.load_factor]
+            self._rebuild(fitting[0] if len(fitting) > 0 else max(len(self.table), self.TABLE_SIZES[-1]))
+        for key, data in items:
+            self[key] = data
 
     def __contains__(self, key: str) -> bool:
         """
@@ -104,16 +346,14 @@ class HashTableSeparateChaining(Generic[T]):
     def __getitem__(self, key: str) -> T:
         """
         Get the data associated with a key
+        :complexity: O(hash(key) + C*comp(K)) where C is the chain length
         :raises KeyError: when the key doesn't exist
         """
-        position = self.hash(key)
-        if self.table[position] is None:
+        position, key_hash = self._locate(key)
+        chain = self.table[position]
+        if chain is None:
             raise KeyError(key)
-        for item in self.table[position]:
-            if item[0] == key:
-                return item[1]
-
-        raise KeyError(key)
+        return chain.get(key, key_hash)
 
     def is_empty(self):
         """
@@ -126,6 +366,15 @@ class HashTableSeparateChaining(Generic[T]):
         """
         Universal Hash function
         :post: returns a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the size of the key, O(1) when found in the hash cache
+        """
+        if self.hash_cache is not None:
+            return self.hash_cache.lookup(key, len(self.table), self._hash)
+        return self._hash(key)
+
+    def _hash(self, key: str) -> int:
+        """
+        Computes the hash of a key from its characters.
         :complexity: O(K) where K is the size of the key
         """
         value = 0
@@ -135,6 +384,26 @@ class HashTableSeparateChaining(Generic[T]):
             a = a * HashTableSeparateChaining.DEFAULT_HASH_BASE % (len(self.table) - 1)
         return value
 
+    def full_hash(self, key: str) -> int:
+        """
+        Hash of the key independent of the table size, stored by array buckets.
+        :complexity: O(K) where K is the size of the key, O(1) when found in the hash cache
+        """
+        if self.hash_cache is not None:
+            # full hashes do not depend on the table size, the method keeps them apart from positions
+            return self.hash_cache.lookup(key, 0, self._full_hash)
+        return self._full_hash(key)
+
+    def _full_hash(self, key: str) -> int:
+        """
+        Computes the full hash of a key from its characters.
+        :complexity: O(K) where K is the size of the key
+        """
+        value = 0
+        for char in key:
+            value = (value * HashTableSeparateChaining.DEFAULT_HASH_BASE + ord(char)) % self.FULL_HASH_MODULUS
+        return value
+
     def insert(self, key: str, data: T) -> None:
         """
         Utility method to call our setitem method
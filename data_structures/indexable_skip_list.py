@@ -0,0 +1,257 @@
+""" Indexable skip list implementation of List ADT. """
+from __future__ import annotations
+from typing import Generic, Union
+
+from data_structures.abstract_list import List, T
+from data_structures.referential_array import ArrayR
+from random_gen import RandomStream
+
+__docformat__ = 'reStructuredText'
+
+
+class SkipNode(Generic[T]):
+    """
+    Skip list node. On every level it is part of, it links to the next node of that level
+    and records how many positions that link skips over.
+    """
+    __slots__ = ("item", "links", "widths")
+
+    def __init__(self, item: T, height: int) -> None:
+        """ Skip node initialiser. """
+        self.item = item
+        self.links: ArrayR[Union[SkipNode[T], None]] = ArrayR(height)
+        self.widths: ArrayR[int] = ArrayR(height)
+
+
+class SkipListIterator(Generic[T]):
+    """ Cursor over level 0 of a skip list, independent of any other traversal. """
+    __slots__ = ("current",)
+
+    def __init__(self, node: Union[SkipNode[T], None]) -> None:
+        """ Starts the cursor at the given node. """
+        self.current = node
+
+    def __iter__(self) -> SkipListIterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        """ Magic method. Get the next item in the iteration. """
+        if self.current is None:
+            raise StopIteration
+        else:
+            item = self.current.item
+            self.current = self.current.links[0]
+            return item
+
+
+class IndexableSkipList(List[T]):
+    """
+    List ADT implemented with an indexable skip list.
+
+    Nodes are linked on level 0 in list order, and a random half of the nodes of every level
+    are also linked on the level above. Each link stores its width, the number of positions it
+    skips, so reaching a position takes O(log N) expected steps from the top level down, and
+    positional insertion and deletion only update the links around that position.
+    A link at the end of a level has the width it would have to a node one past the last one.
+
+    Node heights are drawn from a private RandomStream with a fixed seed, so the same sequence
+    of operations always builds the same list, and the global RandomGen is never consumed.
+
+    attributes:
+        head: sentinel node at position -1, linked on every level
+        height: the number of levels currently in use
+        height_stream: the private RandomStream drawing node heights
+
+    Where N is len(self), all complexities are expected ones.
+    """
+    MAX_HEIGHT = 20
+    # The first draws after seed 0 are tiny, which would make the first nodes as tall as allowed
+    SEED = 2654435761
+
+    def __init__(self, dummy_capacity=1) -> None:
+        """ Indexable skip list object initialiser. """
+        List.__init__(self)
+        self.height_stream = RandomStream(self.SEED)
+        self.clear()
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        List.clear(self)
+        self.head = SkipNode(None, self.MAX_HEIGHT)
+        self.head.widths[0] = 1
+        self.height = 1
+
+    def __random_height(self) -> int:
+        """ Draw the number of levels of a new node: each extra level has probability 1/2.
+        A node is at most one level taller than the list, so a lucky streak cannot add empty levels.
+        """
+        max_height = min(self.MAX_HEIGHT, self.height + 1)
+        height = 1
+        while height < max_height and self.height_stream.random_chance(0.5):
+            height += 1
+        return height
+
+    def __get_node_at_index(self, index: int) -> SkipNode[T]:
+        """ Descend from the top level to the node at the given position.
+        :complexity: O(log N)
+        :raises ValueError: if the index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise ValueError('Index out of bounds')
+        node, position = self.head, -1
+        for level in range(self.height - 1, -1, -1):
+            width = node.widths[level]
+            while position + width <= index:
+                position += width
+                node = node.links[level]
+                width = node.widths[level]
+        return node
+
+    def __get_predecessors(self, index: int) -> tuple[ArrayR[SkipNode[T]], ArrayR[int]]:
+        """ For every level in use, find the last node before the given position and its position.
+        :complexity: O(log N)
+        """
+        predecessors = ArrayR(self.height)
+        positions = ArrayR(self.height)
+        node, position = self.head, -1
+        for level in range(self.height - 1, -1, -1):
+            width = node.widths[level]
+            while position + width < index:
+                position += width
+                node = node.links[level]
+                width = node.widths[level]
+            predecessors[level] = node
+            positions[level] = position
+        return predecessors, positions
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position.
+        :complexity: O(log N)
+        """
+        return self.__get_node_at_index(index).item
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :complexity: O(log N)
+        """
+        self.__get_node_at_index(index).item = item
+
+    def __len__(self) -> int:
+        """ Magic method. Return the number of elements in the list. """
+        return self.length
+
+    def __iter__(self) -> SkipListIterator[T]:
+        """ Magic method. Iterate through the list.
+        Every call returns a new cursor, so several traversals of the same list can run at once.
+        """
+        return SkipListIterator(self.head.links[0])
+
+    def iterate_from(self, index: int) -> SkipListIterator[T]:
+        """ Iterate through the list starting at the given position, len(self) giving an empty iteration.
+        :complexity: O(log N) to start, then O(1) per item
+        :raises ValueError: if the index is out of bounds
+        """
+        if index == len(self):
+            return SkipListIterator(None)
+        return SkipListIterator(self.__get_node_at_index(index))
+
+    def __contains__(self, item: T) -> bool:
+        """ Magic method. Check if the item is in the list. """
+        for element in self:
+            if element == item:
+                return True
+        return False
+
+    def append(self, item: T) -> None:
+        """ Append the item to the end of the list.
+        :complexity: O(log N)
+        """
+        self.insert(len(self), item)
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert the item at a given position.
+        :complexity: O(log N)
+        :raises ValueError: if the index is out of bounds
+        """
+        if not 0 <= index <= len(self):
+            raise ValueError('Index out of bounds')
+        self.__link(SkipNode(item, self.__random_height()), index)
+
+    def __link(self, node: SkipNode[T], index: int) -> None:
+        """ Link the node in at the given position, on all of its levels.
+        :complexity: O(log N)
+        """
+        node_height = len(node.links)
+        if node_height > self.height:
+            # the head links of the new levels skip over the whole list
+            for level in range(self.height, node_height):
+                self.head.widths[level] = len(self) + 1
+            self.height = node_height
+
+        predecessors, positions = self.__get_predecessors(index)
+        for level in range(self.height):
+            previous = predecessors[level]
+            if level < node_height:
+                node.links[level] = previous.links[level]
+                node.widths[level] = positions[level] + previous.widths[level] + 1 - index
+                previous.links[level] = node
+                previous.widths[level] = index - positions[level]
+            else:
+                previous.widths[level] += 1
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position.
+        :complexity: O(log N)
+        :raises ValueError: if the index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise ValueError('Index out of bounds')
+        return self.__unlink(index).item
+
+    def __unlink(self, index: int) -> SkipNode[T]:
+        """ Unlink the node at the given position from all of its levels, and return it.
+        :complexity: O(log N)
+        """
+        predecessors, _ = self.__get_predecessors(index)
+        node = predecessors[0].links[0]
+        for level in range(self.height):
+            previous = predecessors[level]
+            if previous.links[level] is node:
+                previous.links[level] = node.links[level]
+                previous.widths[level] += node.widths[level] - 1
+            else:
+                previous.widths[level] -= 1
+        self.length -= 1
+        return node
+
+    def move(self, orig_index: int, new_index: int) -> None:
+        """ Move the item at orig_index so it ends up at new_index, the items in between shifting by one.
+        The node itself is relinked, keeping its height.
+        :complexity: O(log N)
+        :raises ValueError: if either index is out of bounds
+        """
+        if not (0 <= orig_index < len(self) and 0 <= new_index < len(self)):
+            raise ValueError('Index out of bounds')
+        if orig_index != new_index:
+            self.__link(self.__unlink(orig_index), new_index)
+
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list. """
+        for index, element in enumerate(self):
+            if element == item:
+                return index
+        raise ValueError('Item is not in list')
+
+    def is_empty(self) -> bool:
+        """ Check if the list is empty. """
+        return len(self) == 0
+
+    def __str__(self) -> str:
+        if not len(self):
+            return "Skip List []"
+
+        return "Skip List [" + ", ".join(str(item) for item in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
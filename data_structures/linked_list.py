@@ -1,4 +1,7 @@
 """ Linked-node based implementation of List ADT. """
+from __future__ import annotations
+from typing import Generic, Union
+
 from data_structures.abstract_list import List, T
 from data_structures.node import Node
 
@@ -6,6 +9,27 @@ __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ig
 __docformat__ = 'reStructuredText'
 
 
+class LinkedListIterator(Generic[T]):
+    """ Cursor over the nodes of a linked list, independent of any other traversal. """
+    __slots__ = ("current",)
+
+    def __init__(self, node: Union[Node[T], None]) -> None:
+        """ Starts the cursor at the given node. """
+        self.current = node
+
+    def __iter__(self) -> LinkedListIterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        """ Magic method. Get the next item in the iteration. """
+        if self.current is None:
+            raise StopIteration
+        else:
+            item = self.current.item
+            self.current = self.current.link
+            return item
+
+
 class LinkedList(List[T]):
     """ List ADT implemented with linked nodes. """
 
@@ -14,12 +38,18 @@ class LinkedList(List[T]):
         List.__init__(self)  # Could use super(LinkedList, self).__init__() instead
         self.head = None
         self.rear = None
+        # The last node reached by index and its position, where the next indexed walk can start
+        self.finger_node = None
+        self.finger_index = 0
 
     def clear(self):
         """ Clear the list. """
         # first call clear() for the base class
         List.clear(self)
         self.head = None
+        self.rear = None
+        self.finger_node = None
+        self.finger_index = 0
 
     def __setitem__(self, index: int, item: T) -> None:
         """ Magic method. Insert the item at a given position. """
@@ -35,19 +65,11 @@ class LinkedList(List[T]):
         """ Magic method. Return the number of elements in the list. """
         return self.length
 
-    def __iter__(self):
-        """ Magic method. Iterate through the list. """
-        self.current = self.head
-        return self
-
-    def __next__(self):
-        """ Magic method. Get the next item in the iteration. """
-        if self.current is None:
-            raise StopIteration
-        else:
-            item = self.current.item
-            self.current = self.current.link
-            return item
+    def __iter__(self) -> LinkedListIterator[T]:
+        """ Magic method. Iterate through the list.
+        Every call returns a new cursor, so several traversals of the same list can run at once.
+        """
+        return LinkedListIterator(self.head)
 
     def __contains__(self, item: T) -> bool:
         """ Magic method. Check if the item is in the list. """
@@ -60,17 +82,43 @@ class LinkedList(List[T]):
         """ Append the item to the end of the list. 
         Given we have a reference to the rear of the list, this is O(1).
         """
-        self.insert(len(self), item)
+        new_node = Node(item)
+        if self.rear is None:
+            self.head = new_node
+        else:
+            self.rear.link = new_node
+        self.rear = new_node
+        self.length += 1
 
     def __get_node_at_index(self, index: int) -> Node[T]:
+        """ Walk to the node at the given position.
+        The walk starts from the finger when it is at or before the index, so sequential and
+        nearby accesses cost O(distance from the last access) instead of O(index).
+        """
         if 0 <= index and index <= len(self):
-            current = self.head
-            for i in range(index):
-                current = current.link
+            if index == len(self) - 1:
+                current = self.rear
+            elif self.finger_node is not None and self.finger_index <= index:
+                current = self.finger_node
+                for i in range(index - self.finger_index):
+                    current = current.link
+            else:
+                current = self.head
+                for i in range(index):
+                    current = current.link
+            if current is not None:
+                self.finger_node = current
+                self.finger_index = index
             return current
         else:
             raise ValueError('Index out of bounds')
 
+    def __invalidate_finger_from(self, index: int) -> None:
+        """ Drop the finger if a node is added or removed at or before its position. """
+        if index <= self.finger_index:
+            self.finger_node = None
+            self.finger_index = 0
+
     def index(self, item: T) -> int:
         """ Find the position of a given item in the list. """
         current = self.head
@@ -84,7 +132,11 @@ class LinkedList(List[T]):
             return index
 
     def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position, keeping rear on the last node. """
         if not self.is_empty():
+            if index >= len(self):
+                raise ValueError("Index out of bounds")
+            self.__invalidate_finger_from(index)
             if index > 0:
                 previous_node = self.__get_node_at_index(index-1)
                 item = previous_node.link.item
@@ -97,6 +149,7 @@ class LinkedList(List[T]):
                 raise ValueError("Index out of bounds")
 
             if index == len(self) - 1:
+                # the last node was removed, its predecessor (None when the list empties) is the new rear
                 self.rear = previous_node
 
             self.length -= 1
@@ -105,6 +158,14 @@ class LinkedList(List[T]):
             raise ValueError("Index out of bounds: list is empty")
 
     def insert(self, index: int, item: T) -> None:
+        """ Insert the item at a given position.
+        Inserting at the end goes through the rear reference in O(1), without traversing.
+        """
+        if index == len(self):
+            self.append(item)
+            return
+
+        self.__invalidate_finger_from(index)
         new_node = Node(item)
         if index == 0:
             new_node.link = self.head
@@ -114,11 +175,6 @@ class LinkedList(List[T]):
             new_node.link = previous_node.link
             previous_node.link = new_node
 
-        if index == len(self):
-            if len(self) > 0:
-                self.rear.link = new_node
-            self.rear = new_node
-
         self.length += 1
 
     def is_empty(self) -> bool:
@@ -0,0 +1,282 @@
+""" Hash Table ADT
+
+Defines the sizing, resizing policy and views shared by the open-addressing hash tables.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Generic, Iterable, TypeVar, Union
+
+from data_structures.hash_cache import HashCache
+from data_structures.referential_array import ArrayR
+from data_structures.table_views import ItemsView, KeysView, SlotIndex, ValuesView
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class OpenAddressingTable(ABC, Generic[K, V]):
+    """
+    Base of the hash tables storing their entries directly in `array`, as tuples starting with
+    (key, value). The occupied positions are kept in `slots` (a SlotIndex).
+
+    Subclasses choose the probing and implement __getitem__, __setitem__, __delitem__ and
+    _resize; they grow through the TABLE_SIZES ladder once more than MAX_LOAD_FACTOR of the
+    table is taken, and call _shrink_if_sparse after a delete.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    # No test case should exceed 1 million entries.
+    TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
+
+    HASH_BASE = 31
+    # The table grows once more than this fraction of its slots is occupied.
+    MAX_LOAD_FACTOR = 0.5
+    # Deleting shrinks the table once its load drops under this fraction of MAX_LOAD_FACTOR.
+    # The gap to the growth threshold keeps a table at the edge from resizing back and forth.
+    SHRINK_FACTOR = 1 / 4
+
+    # Opt-in memo of key hashes, see HashCache.
+    hash_cache: Union[HashCache, None] = None
+
+    def __init__(self, sizes=None) -> None:
+        """
+        Initialise the Hash Table.
+
+        :complexity: O(M) where M is the smallest table size.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+        self._allocate(0)
+
+    def _allocate(self, size_index: int) -> None:
+        """
+        Replaces the contents with an empty table of size TABLE_SIZES[size_index].
+        Subclasses keeping more bookkeeping reset it here as well.
+
+        :complexity: O(M) where M is the new table size.
+        """
+        self.size_index = size_index
+        self.array: ArrayR[tuple] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self.slots = SlotIndex(self.table_size)
+        self.count = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], sizes=None) -> OpenAddressingTable[K, V]:
+        """
+        Builds a table from (key, value) pairs, sized for all of them up front.
+
+        :complexity: See update.
+        """
+        table = cls(sizes)
+        table.update(items)
+        return table
+
+    def update(self, items: Iterable[tuple[K, V]]) -> None:
+        """
+        Sets every (key, value) pair. The table grows once, straight to a size that holds
+        all of them, instead of rehashing through every intermediate size.
+
+        :complexity best: O(N*hash(K) + M) No probing.
+        :complexity worst: O(N*hash(K) + N^2*comp(K) + M) Lots of probing.
+        Where N is the number of items (old and new) and M is the final table size
+        """
+        items = list(items)
+        size_index = self._size_index_for(len(self) + len(items))
+        if size_index > self.size_index:
+            self._resize(size_index)
+        for key, value in items:
+            self[key] = value
+
+    def _size_index_for(self, count: int) -> int:
+        """
+        Index of the smallest size in TABLE_SIZES holding `count` items without growing.
+
+        :complexity: O(S) where S is the length of TABLE_SIZES
+        """
+        for index, size in enumerate(self.TABLE_SIZES):
+            if count <= size * self.MAX_LOAD_FACTOR:
+                return index
+        return len(self.TABLE_SIZES) - 1
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key for insert/retrieve/update into the hashtable.
+
+        :complexity: O(len(key)), O(1) when the hash is found in the hash cache
+        """
+        if self.hash_cache is not None:
+            return self.hash_cache.lookup(key, self.table_size, self._hash)
+        return self._hash(key)
+
+    def _hash(self, key: K) -> int:
+        """
+        Computes the hash of a key from its characters.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        a = 31415
+        for char in key:
+            value = (ord(char) + a * value) % self.table_size
+            a = a * self.HASH_BASE % (self.table_size - 1)
+        return value
+
+    @property
+    def table_size(self) -> int:
+        return len(self.array)
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def keys(self) -> KeysView[K, V]:
+        """
+        Returns a live view of all keys in the hash table.
+
+        :complexity: O(1), iterating the view is O(N) where N is len(self).
+        """
+        return KeysView(self)
+
+    def values(self) -> ValuesView[K, V]:
+        """
+        Returns a live view of all values in the hash table.
+
+        :complexity: O(1), iterating the view is O(N) where N is len(self).
+        """
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[K, V]:
+        """
+        Returns a live view of all (key, value) pairs in the hash table.
+
+        :complexity: O(1), iterating the view is O(N) where N is len(self).
+        """
+        return ItemsView(self)
+
+    def __iter__(self):
+        """
+        Iterates over the values of the hash table, like HashTableSeparateChaining.
+
+        :complexity: O(N) where N is len(self).
+        """
+        return iter(ValuesView(self))
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: See __getitem__.
+        """
+        try:
+            _ = self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    @abstractmethod
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :raises KeyError: when the key doesn't exist.
+        """
+        pass
+
+    @abstractmethod
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :raises FullError: when the table cannot be resized further.
+        """
+        pass
+
+    @abstractmethod
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        :raises KeyError: when the key doesn't exist.
+        """
+        pass
+
+    @abstractmethod
+    def _resize(self, size_index: int) -> None:
+        """
+        Rebuilds the table with size TABLE_SIZES[size_index], reinserting all values.
+        """
+        pass
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == self.table_size
+
+    def _fitting_size_index(self) -> int:
+        """
+        Index of the smallest size in TABLE_SIZES holding the items at half the maximum load,
+        so that the table can take as many items again before it grows.
+
+        :complexity: O(S) where S is the length of TABLE_SIZES
+        """
+        for index, size in enumerate(self.TABLE_SIZES):
+            if self.count <= size * self.MAX_LOAD_FACTOR / 2:
+                return index
+        return len(self.TABLE_SIZES) - 1
+
+    def _shrink_if_sparse(self) -> bool:
+        """
+        Moves the table down the TABLE_SIZES ladder once deletions left it mostly empty.
+        Nothing happens while no smaller size fits, e.g. when the ladder skips from a tiny size.
+        Returns whether the table was resized.
+
+        :complexity best: O(1) the table is not sparse.
+        :complexity worst: See _resize.
+        """
+        if self.size_index > 0 and self.count < self.table_size * self.MAX_LOAD_FACTOR * self.SHRINK_FACTOR:
+            size_index = self._fitting_size_index()
+            if size_index < self.size_index:
+                self._resize(size_index)
+                return True
+        return False
+
+    def compact(self) -> None:
+        """
+        Shrinks the table to the smallest size holding its items at half the maximum load.
+        Never grows the table.
+
+        :complexity: See _resize.
+        """
+        size_index = min(self.size_index, self._fitting_size_index())
+        if size_index != self.size_index:
+            self._resize(size_index)
+
+    def clear(self) -> None:
+        """
+        Removes every item and returns the table to the smallest size.
+
+        :complexity: O(M) where M is the smallest table size.
+        """
+        self._allocate(0)
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is len(self)
+        """
+        result = ""
+        for key, value in self.items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
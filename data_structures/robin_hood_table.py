@@ -0,0 +1,176 @@
+""" Hash Table ADT
+
+Defines a Hash Table using Robin Hood linear probing for conflict resolution.
+"""
+from __future__ import annotations
+
+from typing import TypeVar
+
+from data_structures.hash_table import FullError, LinearProbeTable
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class RobinHoodTable(LinearProbeTable[K, V]):
+    """
+    Robin Hood Table.
+
+    A linear probe table where an inserted entry takes the slot of any entry closer to its home
+    than the inserted one is to its own ("takes from the rich"). Probe distances stay short and
+    even, so the table can run at a much higher load factor than LinearProbeTable.
+    Along a cluster the probe distances never drop by more than one from slot to slot, so a
+    lookup can stop as soon as it meets an entry closer to home than the key would be.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    MAX_LOAD_FACTOR = 0.85
+    # Modulus of the full polynomial hash of a key
+    FULL_HASH_MODULUS = (1 << 31) - 1
+    # Knuth's multiplicative constant, close to 2^32 divided by the golden ratio. Multiplying by it
+    # modulo 2^32 spreads keys differing only in their last characters over the whole table.
+    HASH_MIX = 2654435761
+
+    def _allocate(self, size_index: int) -> None:
+        """
+        Replaces the contents with an empty table of size TABLE_SIZES[size_index].
+
+        :complexity: O(M) where M is the new table size.
+        """
+        LinearProbeTable._allocate(self, size_index)
+        # Sum of the probe distances of all entries, and the largest distance since the last resize.
+        self.total_distance = 0
+        self.max_distance = 0
+
+    def _hash(self, key: K) -> int:
+        """
+        Computes the home slot of a key from a full polynomial hash of its characters, mixed
+        before it is reduced by the table size.
+        The hash inherited from LinearProbeTable reduces every step by the table size and
+        gathers keys on too few home slots for a table this full.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * self.HASH_BASE + ord(char)) % self.FULL_HASH_MODULUS
+        return value * self.HASH_MIX % (1 << 32) % self.table_size
+
+    def distance(self, position: int) -> int:
+        """
+        Returns how far the entry at `position` is from its home slot.
+        """
+        return (position - self.array[position][2]) % self.table_size
+
+    @property
+    def mean_probe_distance(self) -> float:
+        """
+        Mean number of slots a successful lookup has to skip.
+        """
+        return self.total_distance / self.count if self.count > 0 else 0.0
+
+    @property
+    def max_probe_distance(self) -> int:
+        """
+        Largest probe distance reached since the table was last resized, an upper bound on the
+        number of slots any lookup skips.
+        """
+        return self.max_distance
+
+    def _probe_from(self, home: int, key: K, is_insert: bool) -> int:
+        """
+        Find the position of this key, starting from its home position.
+        Unsuccessful lookups stop at the first slot whose entry is closer to its home than the key.
+
+        :complexity best: O(1) first position is empty
+        :complexity worst: O(D*comp(K)) where D is the max probe distance
+        :raises KeyError: When the key is not in the table, but is_insert is False.
+        :raises FullError: When a table is full and cannot be inserted.
+        """
+        position = home
+        for distance in range(self.table_size):
+            item = self.array[position]
+            if item is None or (position - item[2]) % self.table_size < distance:
+                # The key would have been placed here or earlier
+                if is_insert:
+                    return position
+                raise KeyError(key)
+            elif item[0] == key:
+                return position
+            position = (position + 1) % self.table_size
+
+        if is_insert:
+            raise FullError("Table is full!")
+        raise KeyError(key)
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the max probe distance
+        :raises FullError: when the table cannot be resized further.
+        """
+        home = self.hash(key)
+        position = self._probe_from(home, key, True)
+        item = self.array[position]
+        if item is not None and item[0] == key:
+            self.array[position] = (key, data, home)
+            return
+
+        # Place the entry, carrying every richer entry it displaces further along the cluster
+        entry = (key, data, home)
+        distance = (position - home) % self.table_size
+        start = position
+        for _ in range(self.table_size):
+            item = self.array[position]
+            if item is None:
+                self.array[position] = entry
+                self.max_distance = max(self.max_distance, distance)
+                break
+            item_distance = (position - item[2]) % self.table_size
+            if item_distance < distance:
+                self.array[position] = entry
+                self.max_distance = max(self.max_distance, distance)
+                entry, distance = item, item_distance
+            position = (position + 1) % self.table_size
+            distance += 1
+        else:
+            raise FullError("Table is full!")
+
+        self.count += 1
+        # Swaps move entries between occupied slots, only the final slot is newly occupied
+        self.slots.add(position)
+        # Swaps leave the sum unchanged, every slot stepped over adds one to the carried entry
+        self.total_distance += (start - home) % self.table_size + (position - start) % self.table_size
+
+        if len(self) > self.table_size * self.MAX_LOAD_FACTOR:
+            self._rehash()
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+        Every following entry of the cluster that is away from home moves one slot back.
+
+        :complexity best: O(hash(key)) the next slot is empty or holds an entry at home.
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the max probe distance
+        :raises KeyError: when the key doesn't exist.
+        """
+        hole = self._linear_probe(key, False)
+        self.total_distance -= self.distance(hole)
+        self.count -= 1
+        position = (hole + 1) % self.table_size
+        while self.array[position] is not None and self.distance(position) > 0:
+            self.array[hole] = self.array[position]
+            self.total_distance -= 1
+            hole = position
+            position = (position + 1) % self.table_size
+        self.array[hole] = None
+        self.slots.remove(hole)
+        self._shrink_if_sparse()
@@ -0,0 +1,136 @@
+""" Occupied-slot index and lazy views for the open-addressing hash tables. """
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from typing import Generic, Iterator, TypeVar
+
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class SlotIndex:
+    """
+    The positions of the occupied slots of a table, kept dense so that walking the entries
+    costs O(len(table)) instead of O(table size).
+    Positions are in no particular order; removing one moves the last position into its place.
+
+    attributes:
+        positions: the occupied positions
+        index_of: for every occupied slot, its index in `positions`
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    __slots__ = ("positions", "index_of")
+
+    def __init__(self, table_size: int) -> None:
+        """
+        :complexity: O(table_size)
+        """
+        self.positions: list[int] = []
+        self.index_of: ArrayR[int] = ArrayR(table_size)
+
+    def add(self, position: int) -> None:
+        """ Records that the slot at `position` became occupied. """
+        self.index_of[position] = len(self.positions)
+        self.positions.append(position)
+
+    def remove(self, position: int) -> None:
+        """ Records that the slot at `position` became empty. """
+        index = self.index_of[position]
+        last = self.positions.pop()
+        if last != position:
+            self.positions[index] = last
+            self.index_of[last] = index
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index: int) -> int:
+        return self.positions[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.positions)
+
+
+class TableView(ABC, Generic[K, V]):
+    """
+    Live, read-only view over the entries of a table holding `array` and `slots` (a SlotIndex),
+    with entries stored as tuples starting with (key, value).
+    Nothing is copied: iterating and indexing read the table directly, so a view reflects later
+    changes, and the table must not be changed while a view is being iterated.
+    """
+    __slots__ = ("table",)
+
+    def __init__(self, table) -> None:
+        self.table = table
+
+    @abstractmethod
+    def _project(self, entry: tuple):
+        """ Returns the part of a stored entry this view shows. """
+        pass
+
+    def __len__(self) -> int:
+        return len(self.table.slots)
+
+    def __getitem__(self, index: int):
+        """
+        Returns the index-th entry, in the order of iteration.
+        :complexity: O(1)
+        """
+        return self._project(self.table.array[self.table.slots[index]])
+
+    def __iter__(self):
+        """
+        :complexity: O(N) where N is len(table)
+        """
+        array = self.table.array
+        for position in self.table.slots:
+            yield self._project(array[position])
+
+    def __contains__(self, item) -> bool:
+        """
+        :complexity: O(N*comp) where N is len(table)
+        """
+        for element in self:
+            if element == item:
+                return True
+        return False
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(element) for element in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class KeysView(TableView[K, V]):
+    """ View over the keys of a table. """
+    __slots__ = ()
+
+    def _project(self, entry: tuple) -> K:
+        return entry[0]
+
+    def __contains__(self, key: K) -> bool:
+        """
+        :complexity: See the table's __contains__.
+        """
+        return key in self.table
+
+
+class ValuesView(TableView[K, V]):
+    """ View over the values of a table. """
+    __slots__ = ()
+
+    def _project(self, entry: tuple) -> V:
+        return entry[1]
+
+
+class ItemsView(TableView[K, V]):
+    """ View over the (key, value) pairs of a table. """
+    __slots__ = ()
+
+    def _project(self, entry: tuple) -> tuple[K, V]:
+        return entry[0], entry[1]
@@ -0,0 +1,226 @@
+""" Unrolled linked-node based implementation of List ADT. """
+from __future__ import annotations
+from typing import Generic, Iterator, Union
+
+from data_structures.abstract_list import List, T
+from data_structures.referential_array import ArrayR
+
+__docformat__ = 'reStructuredText'
+
+
+class BlockNode(Generic[T]):
+    """ Linked node holding up to `capacity` items in an array, packed at the front. """
+    __slots__ = ("items", "count", "link")
+
+    def __init__(self, capacity: int) -> None:
+        """ Block node initialiser. """
+        self.items: ArrayR[T] = ArrayR(capacity)
+        self.count = 0
+        self.link: Union[BlockNode[T], None] = None
+
+    def is_full(self) -> bool:
+        """ Check if the block has no free slot. """
+        return self.count == len(self.items)
+
+
+class UnrolledLinkedList(List[T]):
+    """
+    List ADT implemented with linked blocks of items.
+
+    Every node stores a small array of items instead of a single one, which saves one node per
+    item and keeps neighbouring items together: walking the list skips whole blocks, and
+    inserting or deleting in the middle only shifts the items of one block.
+    Blocks split in two when an insertion overflows them, and a block merges with the next one
+    once both fit in a single block, so blocks stay at least half full on average.
+
+    attributes:
+        block_capacity: the number of items each block can hold
+        head: the first block, None when the list is empty
+        rear: the last block, None when the list is empty
+
+    Where B is the block capacity and N is len(self).
+    """
+    BLOCK_CAPACITY = 32
+
+    def __init__(self, block_capacity: int = BLOCK_CAPACITY) -> None:
+        """ Unrolled linked-list object initialiser.
+        :raises ValueError: if the block capacity is smaller than 2
+        """
+        if block_capacity < 2:
+            raise ValueError("Blocks should hold at least 2 items.")
+        List.__init__(self)
+        self.block_capacity = block_capacity
+        self.head = None
+        self.rear = None
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        List.clear(self)
+        self.head = None
+        self.rear = None
+
+    def __get_block_at_index(self, index: int) -> tuple[BlockNode[T], int]:
+        """ Find the block holding the given position, and the offset of the position in it.
+        :complexity: O(N/B), O(1) for positions in the last block
+        :raises ValueError: if the index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise ValueError('Index out of bounds')
+        rear_start = len(self) - self.rear.count
+        if index >= rear_start:
+            return self.rear, index - rear_start
+        current = self.head
+        while index >= current.count:
+            index -= current.count
+            current = current.link
+        return current, index
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position.
+        :complexity: O(N/B)
+        """
+        block, offset = self.__get_block_at_index(index)
+        return block.items[offset]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the element at a given position.
+        :complexity: O(N/B)
+        """
+        block, offset = self.__get_block_at_index(index)
+        block.items[offset] = item
+
+    def __len__(self) -> int:
+        """ Magic method. Return the number of elements in the list. """
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        """ Magic method. Iterate through the list, a block at a time.
+        :complexity: O(N)
+        """
+        current = self.head
+        while current is not None:
+            yield from current.items[:current.count]
+            current = current.link
+
+    def __contains__(self, item: T) -> bool:
+        """ Magic method. Check if the item is in the list. """
+        for element in self:
+            if element == item:
+                return True
+        return False
+
+    def append(self, item: T) -> None:
+        """ Append the item to the end of the list, opening a new block when the last one is full.
+        :complexity: O(1)
+        """
+        if self.rear is None or self.rear.is_full():
+            self.__link_after(self.rear, BlockNode(self.block_capacity))
+        self.rear.items[self.rear.count] = item
+        self.rear.count += 1
+        self.length += 1
+
+    def insert(self, index: int, item: T) -> None:
+        """ Insert the item at a given position, splitting its block if it is full.
+        :complexity: O(N/B + B)
+        :raises ValueError: if the index is out of bounds
+        """
+        if index == len(self):
+            self.append(item)
+            return
+
+        block, offset = self.__get_block_at_index(index)
+        if block.is_full():
+            # move the upper half of the block to a new block right after it
+            half = block.count // 2
+            new_block = BlockNode(self.block_capacity)
+            new_block.items[:block.count - half] = block.items[half:block.count]
+            new_block.count = block.count - half
+            block.items[half:block.count] = [None] * new_block.count
+            block.count = half
+            self.__link_after(block, new_block)
+            if offset > half:
+                block, offset = new_block, offset - half
+
+        block.items[offset + 1:block.count + 1] = block.items[offset:block.count]
+        block.items[offset] = item
+        block.count += 1
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete the item at a given position, merging its block with the next one when both fit in one.
+        :complexity: O(N/B + B)
+        :raises ValueError: if the index is out of bounds
+        """
+        if not 0 <= index < len(self):
+            raise ValueError('Index out of bounds')
+
+        # the predecessor is needed to unlink a block that runs empty
+        previous = None
+        block = self.head
+        while index >= block.count:
+            index -= block.count
+            previous, block = block, block.link
+
+        item = block.items[index]
+        block.items[index:block.count - 1] = block.items[index + 1:block.count]
+        block.count -= 1
+        block.items[block.count] = None
+        self.length -= 1
+
+        following = block.link
+        if block.count == 0:
+            self.__unlink_after(previous, block)
+        elif following is not None and block.count + following.count <= self.block_capacity:
+            block.items[block.count:block.count + following.count] = following.items[:following.count]
+            block.count += following.count
+            self.__unlink_after(block, following)
+        return item
+
+    def __link_after(self, previous: Union[BlockNode[T], None], block: BlockNode[T]) -> None:
+        """ Link the block after the given one, or at the front when previous is None. """
+        if previous is None:
+            block.link = self.head
+            self.head = block
+        else:
+            block.link = previous.link
+            previous.link = block
+        if block.link is None:
+            self.rear = block
+
+    def __unlink_after(self, previous: Union[BlockNode[T], None], block: BlockNode[T]) -> None:
+        """ Unlink the block following previous, or the head when previous is None. """
+        if previous is None:
+            self.head = block.link
+        else:
+            previous.link = block.link
+        if block is self.rear:
+            self.rear = previous
+
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list. """
+        for index, element in enumerate(self):
+            if element == item:
+                return index
+        raise ValueError('Item is not in list')
+
+    def is_empty(self) -> bool:
+        """ Check if the list is empty. """
+        return len(self) == 0
+
+    def block_count(self) -> int:
+        """ Return the number of blocks in the list. """
+        count = 0
+        current = self.head
+        while current is not None:
+            count += 1
+            current = current.link
+        return count
+
+    def __str__(self) -> str:
+        if not len(self):
+            return "Unrolled Linked List []"
+
+        return "Unrolled Linked List [" + ", ".join(str(item) for item in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -1,109 +1,269 @@
 from __future__ import annotations
-from data_structures.hash_table import LinearProbeTable
+from bisect import bisect_left
+from weakref import WeakKeyDictionary
 from data_structures.referential_array import ArrayR
 from constants import PlayerPosition, PlayerStats, ResultStats
+from typing import Union
 from player import Player
-from random_gen import RandomGen
+from random_gen import RandomGen, RandomStream
 from team import Team
 
 
-class GameSimulator:
+class WeightedSampler:
+    """
+    Precomputed weighted choice over a fixed list of players.
 
-    @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> LinearProbeTable:
-        """
-        Simulates a game between two teams, considering player stats for a more probabilistic outcome.
-        Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
+    The summed attribute weight of every player is computed once into a cumulative-weight array,
+    after which each draw is a single random number plus a binary search.
+    A sampler remembers the roster and player versions it was built from so it can tell when it is stale.
+    It keeps no reference to its team, so caching it per team does not keep the team alive.
+    """
+    __slots__ = ("players", "cumulative", "total", "roster_version", "player_versions")
 
+    def __init__(self, team: Team, players: list[Player], attributes: tuple[PlayerStats, ...]) -> None:
+        """
         Args:
-            home_team (Team): The home team.
-            away_team (Team): The away team.
+            team (Team): The team the players belong to.
+            players (list[Player]): The players to choose from, in draw order.
+            attributes (tuple[PlayerStats, ...]): The stats summed into each player's weight.
 
-        Returns:
-            LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
-                            'Goal Assists', 'Interceptions', 'Tacklers'
+        Complexity:
+            Best Case Complexity: O(P*A), where P is the number of players and A the number of attributes
+            Worst Case Complexity: O(P*A), where P is the number of players and A the number of attributes
         """
-        result_table: LinearProbeTable = LinearProbeTable()
+        self.players = players
+        self.cumulative: list[int] = []
+        total = 0
+        for player in players:
+            total += sum(player[attr] for attr in attributes)
+            self.cumulative.append(total)
+        self.total = total
+        self.roster_version = team.roster_version
+        self.player_versions = [player.version for player in players]
 
-        # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
-        result_table[ResultStats.HOME_GOALS.value] = home_goals
-        result_table[ResultStats.AWAY_GOALS.value] = away_goals
+    def is_stale(self, team: Team) -> bool:
+        """
+        Checks whether the roster of `team` (the team the sampler was built for) or any player's
+        stats changed since the sampler was built.
 
-        # 2. Select goal scorers and assist providers based on stats
-        goal_scorers: list[str] = []
-        goal_assists: list[str] = []
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
+        Complexity:
+            Best Case Complexity: O(1), the roster changed
+            Worst Case Complexity: O(P), where P is the number of players
+        """
+        if self.roster_version != team.roster_version:
+            return True
+        for player, version in zip(self.players, self.player_versions):
+            if player.version != version:
+                return True
+        return False
+
+    def pick(self, rand_val: int) -> Player:
+        """
+        Returns the first player whose cumulative weight reaches `rand_val`.
+
+        Complexity:
+            Best Case Complexity: O(log(P))
+            Worst Case Complexity: O(log(P)), where P is the number of players
+        """
+        return self.players[bisect_left(self.cumulative, rand_val)]
+
+    def choose(self, rng: Union[type[RandomGen], RandomStream]) -> Player:
+        """
+        Selects a player based on weighted stats.
+        Consumes the same random numbers as a scan over the players would.
+
+        Complexity:
+            Best Case Complexity: O(1), all weights are zero
+            Worst Case Complexity: O(log(P)), where P is the number of players
+        """
+        if self.total == 0:  # Handle edge case where all weights are zero
+            return rng.random_choice(self.players)
+        return self.pick(rng.random_choice(range(self.total)))
 
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.get_position() != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.get_position() != PlayerPosition.GOALKEEPER]
+    @staticmethod
+    def choose_between(first: WeightedSampler, second: WeightedSampler,
+                       rng: Union[type[RandomGen], RandomStream]) -> Player:
+        """
+        Selects a player from the players of both samplers, as if they were a single list
+        with the players of `first` before those of `second`.
+
+        Complexity:
+            Best Case Complexity: O(1), all weights are zero
+            Worst Case Complexity: O(log(P)), where P is the number of players
+        """
+        total = first.total + second.total
+        if total == 0:
+            index = rng.randint(0, len(first.players) + len(second.players) - 1)
+            if index < len(first.players):
+                return first.players[index]
+            return second.players[index - len(first.players)]
 
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
+        rand_val = rng.random_choice(range(total))
+        if rand_val <= first.total and len(first.players) > 0:
+            return first.pick(rand_val)
+        return second.pick(rand_val - first.total)
 
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
 
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+class MatchResult:
+    """
+    Fixed-layout record of a simulated game.
 
-        for _ in range(home_goals):
-            scorer: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
-            goal_scorers.append(scorer.get_name())
+    The players involved in each event are stored as Player references (one entry per event),
+    not names. `result[ResultStats.X.value]` still works for callers of the old table based
+    result, returning the goal counts or an ArrayR of player names (None when there were no events).
+    """
+    __slots__ = ("home_goals", "away_goals", "goal_scorers", "goal_assists", "tackles", "interceptions")
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
-                goal_assists.append(assist.get_name())
+    # ResultStats value -> attribute, for the compatibility view
+    FIELDS = {
+        ResultStats.HOME_GOALS.value: "home_goals",
+        ResultStats.AWAY_GOALS.value: "away_goals",
+        ResultStats.GOAL_SCORERS.value: "goal_scorers",
+        ResultStats.GOAL_ASSISTS.value: "goal_assists",
+        ResultStats.TACKLES.value: "tackles",
+        ResultStats.INTERCEPTIONS.value: "interceptions",
+    }
 
-        for _ in range(away_goals):
-            scorer: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
-            goal_scorers.append(scorer.get_name())
+    # The per-event stats, in the order used by `player_events`
+    EVENT_STATS = (PlayerStats.GOALS, PlayerStats.ASSISTS, PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
-                goal_assists.append(assist.get_name())
+    def __init__(self, home_goals: int, away_goals: int, goal_scorers: list[Player], goal_assists: list[Player],
+                 tackles: list[Player], interceptions: list[Player]) -> None:
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.goal_scorers = goal_scorers
+        self.goal_assists = goal_assists
+        self.tackles = tackles
+        self.interceptions = interceptions
 
-        result_table[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list(goal_scorers)
-        result_table[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list(goal_assists)
+    def player_events(self) -> dict[Player, list[int]]:
+        """
+        Counts the events of every involved player, keyed by the player object itself
+        (so two players sharing a name are never confused).
 
-        # 3. Assign interceptions and tackles based on defensive stats
-        interceptions: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
-        tackles: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
+        Returns:
+            dict[Player, list[int]]: For each player the number of goals, assists, tackles
+                and interceptions, in the order of EVENT_STATS.
 
-        result_table[ResultStats.TACKLES.value] = ArrayR.from_list(tackles)
-        result_table[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list(interceptions)
+        Complexity:
+            Best Case Complexity: O(E), where E is the number of events in the game
+            Worst Case Complexity: O(E), where E is the number of events in the game
+        """
+        counts: dict[Player, list[int]] = {}
+        for stat_index, players in enumerate((self.goal_scorers, self.goal_assists, self.tackles, self.interceptions)):
+            for player in players:
+                player_counts = counts.get(player)
+                if player_counts is None:
+                    player_counts = [0] * len(self.EVENT_STATS)
+                    counts[player] = player_counts
+                player_counts[stat_index] += 1
+        return counts
 
-        return result_table
+    def __getitem__(self, key: str) -> Union[int, ArrayR[str], None]:
+        """
+        Compatibility view, returns the value stored under a ResultStats key.
+
+        Complexity:
+            Best Case Complexity: O(1), a goal count
+            Worst Case Complexity: O(E), where E is the number of events of that kind
+
+        Raises:
+            KeyError: When the key is not a ResultStats value.
+        """
+        value = getattr(self, self.FIELDS[key])
+        if isinstance(value, list):
+            return ArrayR.from_list([player.get_name() for player in value])
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns all the keys of the compatibility view.
+        """
+        return ArrayR.from_list(list(self.FIELDS))
+
+
+class GameSimulator:
+
+    # Samplers per team, keyed by (outfield only, attributes); samplers do not reference their team,
+    # so an entry is dropped once the team is garbage collected.
+    _samplers: WeakKeyDictionary = WeakKeyDictionary()
 
     @staticmethod
-    def __weighted_choice(players: list, *attributes: str) -> Player:
+    def simulate(home_team: Team, away_team: Team, rng: Union[type[RandomGen], RandomStream] = RandomGen) -> MatchResult:
         """
-        Selects a player based on weighted stats.
+        Simulates a game between two teams, considering player stats for a more probabilistic outcome.
+        Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
 
         Args:
-            players (list): List of players to choose from.
-            *attributes (str): Attributes to consider for weighting.
+            home_team (Team): The home team.
+            away_team (Team): The away team.
+            rng (Union[type[RandomGen], RandomStream]): Source of randomness, defaults to the global RandomGen.
 
         Returns:
-            Player: The selected player.
+            MatchResult: The goals of each team and the players behind every goal, assist, tackle and interception.
+                Still answers the keys 'Home Goals', 'Away Goals', 'Goal Scorers',
+                'Goal Assists', 'Interceptions', 'Tacklers' like the previous result table.
         """
-        total_weight: int = sum(
-            sum(player[attr] for attr in attributes) for player in players
-        )
+        # 1. Determine goals scored by each team with a higher likelihood of low scores
+        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
+        home_goals: int = rng.random_choice(goal_distribution)
+        away_goals: int = rng.random_choice(goal_distribution)
+
+        # 2. Select goal scorers and assist providers based on stats
+        goal_scorers: list[Player] = []
+        goal_assists: list[Player] = []
 
-        if total_weight == 0:  # Handle edge case where all weights are zero
-            return RandomGen.random_choice(players)
+        for team, goals in ((home_team, home_goals), (away_team, away_goals)):
+            if goals == 0:
+                continue
+            # Outfield players only
+            scorers = GameSimulator.get_sampler(team, True, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+            assists = GameSimulator.get_sampler(team, True, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+            for _ in range(goals):
+                goal_scorers.append(scorers.choose(rng))
 
-        rand_val: int = RandomGen.random_choice(range(total_weight))
-        cumulative_weight: int = 0
-        for player in players:
-            player_weight: int = sum(player[attr] for attr in attributes)
-            cumulative_weight += player_weight
-            if cumulative_weight >= rand_val:
-                return player
+                if rng.random_chance(0.7):  # 70% chance of an assist
+                    goal_assists.append(assists.choose(rng))
+
+        # 3. Assign interceptions and tackles based on defensive stats, drawing from both squads
+        home_defence = GameSimulator.get_sampler(home_team, False, PlayerStats.HEIGHT)
+        away_defence = GameSimulator.get_sampler(away_team, False, PlayerStats.HEIGHT)
+        interceptions: list[Player] = [WeightedSampler.choose_between(home_defence, away_defence, rng) for _ in range(rng.randint(0, 10))]
+        tackles: list[Player] = [WeightedSampler.choose_between(home_defence, away_defence, rng) for _ in range(rng.randint(0, 10))]
+
+        return MatchResult(home_goals, away_goals, goal_scorers, goal_assists, tackles, interceptions)
+
+    @staticmethod
+    def get_sampler(team: Team, outfield_only: bool, *attributes: PlayerStats) -> WeightedSampler:
+        """
+        Returns the cached sampler for a team and attribute set, rebuilding it only when
+        the roster or one of its players' stats changed.
+
+        Args:
+            team (Team): The team to choose players from.
+            outfield_only (bool): Whether goalkeepers are excluded.
+            *attributes (PlayerStats): Attributes to consider for weighting.
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of players (validating the cached sampler)
+            Worst Case Complexity: O(P*A), where A is the number of attributes (rebuilding the sampler)
+        """
+        team_samplers = GameSimulator._samplers.get(team)
+        if team_samplers is None:
+            team_samplers = {}
+            GameSimulator._samplers[team] = team_samplers
 
-        # Fallback in case rounding errors cause a miss
-        return RandomGen.random_choice(players)
+        key = (outfield_only, attributes)
+        sampler = team_samplers.get(key)
+        if sampler is None or sampler.is_stale(team):
+            players: list[Player] = [player for player in team.get_players()
+                                     if not outfield_only or player.get_position() != PlayerPosition.GOALKEEPER]
+            sampler = WeightedSampler(team, players, attributes)
+            team_samplers[key] = sampler
+        return sampler
@@ -3,6 +3,7 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor'
 __since__ = '22/08/2024'
 
+from data_structures.hash_cache import HashCache
 from data_structures.referential_array import ArrayR
 from typing import Generic, Union, TypeVar
 
@@ -22,25 +23,48 @@ class HashyPerfectionTable(Generic[K, V]):
 
     Unless stated otherwise, all methods have O(1) complexity.
     """
+    # Opt-in memo of key hashes, see HashCache.
+    hash_cache: Union[HashCache, None] = None
+
+    # Parameters of the hash. Tables for other key sets are subclasses overriding these,
+    # see perfect_hash_generator.py.
+    HASH_BASE = 53
+    OFFSET = 89
+    TABLE_SIZE = 13
+    # The closed key set, when known only these keys may be inserted.
+    KEYS: Union[frozenset[K], None] = None
+
     def __init__(self) -> None:
         """
         Initialise the Hash Table.
         Note: Our default table size 13, if you increase it to 19, you will not get full marks for approach.
         """
-        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(13)
+        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZE)
         self.count: int = 0
-        self.table_size = 13
+        self.table_size = self.TABLE_SIZE
     def hash(self, key: K) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
 
         Complexity:
-        Best Case Complexity: O(opp), where opp is the cost of operations
+        Best Case Complexity: O(1), the hash is found in the hash cache
+        Worst Case Complexity: O(l), where l is the length of the key
+        """
+        if self.hash_cache is not None:
+            return self.hash_cache.lookup(key, self.table_size, self._hash)
+        return self._hash(key)
+
+    def _hash(self, key: K) -> int:
+        """
+        Computes the hash of a key from its characters.
+
+        Complexity:
+        Best Case Complexity: O(l), where l is the length of the key
         Worst Case Complexity: O(l), where l is the length of the key
         """
         hashy = 0
-        hash_base = 53
-        offset = 89
+        hash_base = self.HASH_BASE
+        offset = self.OFFSET
         for i,char in enumerate(key):
             hashy += ((ord(char)+len(key))*(hash_base**i))%offset
         hashy%=self.table_size
@@ -61,7 +85,7 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         res = ArrayR(len(self.array))
         i = 0
-        for x in range(len(self)):
+        for x in range(self.table_size):
             if self.array[x] is not None:
                 res[i] = self.array[x][0]
                 i += 1
@@ -75,7 +99,7 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         res = ArrayR(len(self.array))
         i = 0
-        for x in range(len(self)):
+        for x in range(self.table_size):
             if self.array[x] is not None:
                 res[i] = self.array[x][1]
                 i += 1
@@ -108,7 +132,8 @@ class HashyPerfectionTable(Generic[K, V]):
         KeyError: When the key doesn't exist.
         """
         position: int = self.hash(key)
-        if self.array[position] is None:
+        # A key outside the key set may hash onto the slot of another key
+        if self.array[position] is None or self.array[position][0] != key:
             raise KeyError(f"{key} not found")
         return self.array[position][1]
 
@@ -123,10 +148,14 @@ class HashyPerfectionTable(Generic[K, V]):
         Raises:
         KeyError: When the key doesn't exist.
         """
+        if self.KEYS is not None and key not in self.KEYS:
+            raise KeyError(f"{key} is not one of the keys of this table")
         position: int = self.hash(key)
 
         if self.array[position] is None:
             self.count += 1
+        elif self.array[position][0] != key:
+            raise KeyError(f"{key} collides with {self.array[position][0]}")
 
         self.array[position] = (key, data)
 
@@ -142,6 +171,8 @@ class HashyPerfectionTable(Generic[K, V]):
         KeyError: When the key doesn't exist.
         """
         position: int = self.hash(key)
+        if self.array[position] is None or self.array[position][0] != key:
+            raise KeyError(f"{key} not found")
         self.array[position] = None
         self.count -= 1
 
@@ -163,3 +194,47 @@ class HashyPerfectionTable(Generic[K, V]):
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
+
+
+class HashyDisplacementTable(HashyPerfectionTable[K, V]):
+    """
+    Perfect hash table for key sets too large for a HashyPerfectionTable parameter search
+    (hash and displace). A first hash splits the keys into buckets, and every bucket stores a
+    displacement: the seed of the second hash that places all its keys in free slots.
+
+    Tables for a key set are subclasses setting DISPLACEMENTS, TABLE_SIZE and KEYS,
+    see perfect_hash_generator.py.
+    """
+    DISPLACEMENTS: tuple[int, ...] = (0,)
+
+    MASK = (1 << 32) - 1
+    FNV_PRIME = 16777619
+
+    @classmethod
+    def seeded_hash(cls, key: K, seed: int) -> int:
+        """
+        FNV-1a hash of the key, started from `seed`, with a final avalanche so that
+        nearby seeds give unrelated hashes.
+
+        Complexity:
+        Best Case Complexity: O(l), where l is the length of the key
+        Worst Case Complexity: O(l), where l is the length of the key
+        """
+        value = (seed ^ 2166136261) & cls.MASK
+        for char in key:
+            value = ((value ^ ord(char)) * cls.FNV_PRIME) & cls.MASK
+        value ^= value >> 16
+        value = (value * 0x45d9f3b) & cls.MASK
+        value ^= value >> 16
+        return value
+
+    def _hash(self, key: K) -> int:
+        """
+        Computes the slot of a key from the displacement of its bucket.
+
+        Complexity:
+        Best Case Complexity: O(l), where l is the length of the key
+        Worst Case Complexity: O(l), where l is the length of the key
+        """
+        bucket = self.seeded_hash(key, 0) % len(self.DISPLACEMENTS)
+        return self.seeded_hash(key, self.DISPLACEMENTS[bucket]) % self.table_size
@@ -1,26 +1,11 @@
-from enum import Enum
-import math
-class PlayerStats(Enum):
-    GAMES_PLAYED = "Games Played"
-    GOALS = "Goals"
-    ASSISTS = "Assists"
-    TACKLES = "Tackles"
-    INTERCEPTIONS = "Interceptions"
-    STAR_SKILL = "Star Skill"
-    WEAK_FOOT_ABILITY = "Weak Foot Ability"
-    WEIGHT = "Weight"
-    HEIGHT = "Height"
+"""
+Prints the perfect hash table classes for the closed key sets of the project.
 
-for key in PlayerStats:
-    step = 0
-    hash_base = 53
-    offset = 89
-    key = key.value
-    table_size  =13
-    for i,char in enumerate(key):
-        step+= ((ord(char)+len(key))*(hash_base**i))%offset*4
-        step%=table_size
-    if step >= 5:
-        step%= 5
+Usage: python hashy_perfection_testing.py
+"""
+from constants import PlayerPosition, PlayerStats, ResultStats, TeamStats
+from perfect_hash_generator import perfect_table_class, table_source
 
-    print(f'{key}: {step}')
\ No newline at end of file
+for keys in (PlayerStats, TeamStats, ResultStats, PlayerPosition):
+    table_class = perfect_table_class(keys, f"{keys.__name__}Table")
+    print(table_source(table_class))
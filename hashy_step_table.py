@@ -6,8 +6,10 @@ from __future__ import annotations
 __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
-from data_structures.referential_array import ArrayR
-from typing import Generic, TypeVar, Union
+from data_structures.hash_cache import HashCache
+from data_structures.open_addressing_table import OpenAddressingTable
+from math import gcd
+from typing import TypeVar, Union
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -17,7 +19,7 @@ class FullError(Exception):
     pass
 
 
-class HashyStepTable(Generic[K, V]):
+class HashyStepTable(OpenAddressingTable[K, V]):
     """
     Hashy Step Table.
 
@@ -29,10 +31,16 @@ class HashyStepTable(Generic[K, V]):
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
-    # No test case should exceed 1 million entries.
-    TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
+    # Base of the step hash, different from HASH_BASE so the two hashes are independent
+    STEP_HASH_BASE = 37
 
-    HASH_BASE = 31
+    # Opt-in memo of the step hashes, see HashCache.
+    step_cache: Union[HashCache, None] = None
+
+    # Occupied plus deleted slots may fill at most this fraction of the table before a rehash.
+    MAX_LOAD_FACTOR = 2 / 3
+    # Deleting triggers a cleanup rehash once tombstones fill this fraction of the table.
+    TOMBSTONE_FACTOR = 1 / 4
 
     def __init__(self, sizes=None) -> None:
         """
@@ -42,51 +50,52 @@ class HashyStepTable(Generic[K, V]):
         Best Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         Worst Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         """
-        if sizes is not None:
-            self.TABLE_SIZES = sizes
-        self.size_index = 0
-        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-        self.sentinel = "DELETED"
+        # Left in the slot of a deleted item so probe chains running through it stay intact.
+        self.sentinel = object()
+        OpenAddressingTable.__init__(self, sizes)
 
-    def hash(self, key: K) -> int:
+    def _allocate(self, size_index: int) -> None:
         """
-        Hash a key for insert/retrieve/update into the hashtable.
+        Replaces the contents with an empty table of size TABLE_SIZES[size_index], without tombstones.
 
         Complexity:
-        Best Case Complexity: O(len(key))
-        Worst Case Complexity: O(len(key))
+        Best Case Complexity: O(M) where M is the new table size.
+        Worst Case Complexity: O(M) where M is the new table size.
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        OpenAddressingTable._allocate(self, size_index)
+        self.tombstones = 0
 
     def hash2(self, key: K) -> int:
         """
         Used to determine the step size for our hash table.
+        Every character of the key contributes, so keys sharing a first letter do not share a probe sequence.
+        The step lies in 1..table_size-1, which is coprime with the (prime) table sizes, so a probe
+        visits every slot. Composite sizes passed in by the caller are corrected with gcd.
 
         Complexity:
-        Best Case Complexity:
-        Worst Case Complexity:
-
+        Best Case Complexity: O(1), the step is found in the step cache
+        Worst Case Complexity: O(len(key)), plus O(table_size) for a composite table size
         """
-        step = (((ord(key[0]) - ord("A"))) % (self.table_size-1)) + 1
-        return step
-
-
-    @property
-    def table_size(self) -> int:
-        return len(self.array)
+        if self.step_cache is not None:
+            return self.step_cache.lookup(key, self.table_size, self._hash2)
+        return self._hash2(key)
 
-    def __len__(self) -> int:
+    def _hash2(self, key: K) -> int:
         """
-        Returns number of elements in the hash table
+        Computes the step of a key from its characters.
+
+        Complexity:
+        Best Case Complexity: O(len(key))
+        Worst Case Complexity: O(len(key)), plus O(table_size) for a composite table size
         """
-        return self.count
+        modulus = max(1, self.table_size - 1)
+        value = 0
+        for char in key:
+            value = (value * self.STEP_HASH_BASE + ord(char)) % modulus
+        step = value + 1
+        while gcd(step, self.table_size) != 1:
+            step = step % modulus + 1
+        return step
 
     def _hashy_probe(self, key: K, is_insert: bool) -> int:
         """
@@ -105,53 +114,27 @@ class HashyStepTable(Generic[K, V]):
         """
         position = self.hash(key)
         jump = self.hash2(key)
+        first_deleted = None
         for _ in range(len(self.array)):
-            if self.array[position] is None:
+            item = self.array[position]
+            if item is None:
                 if is_insert:
-                    # If inserting, having None here is ok.
-                    return position
+                    # If inserting, reuse the first tombstone we passed, otherwise having None here is ok.
+                    return position if first_deleted is None else first_deleted
                 raise KeyError(key)
-            elif self.array[position][0] == key:
+            elif item is self.sentinel:
+                # Keep probing, the key may live further along the chain.
+                if first_deleted is None:
+                    first_deleted = position
+            elif item[0] == key:
                 return position
-            else:
-                position = (position + jump) % self.table_size
-    
-    def keys(self) -> list[K]:
-        """
-        Returns all keys in the hash table.
+            position = (position + jump) % self.table_size
 
-        :complexity: O(N) where N is self.table_size.
-        """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
-        return res
-
-    def values(self) -> list[V]:
-        """
-        Returns all values in the hash table.
-
-        :complexity: O(N) where N is self.table_size.
-        """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
-        return res
-
-    def __contains__(self, key: K) -> bool:
-        """
-        Checks to see if the given key is in the Hash Table
-
-        :complexity: See hashy probe.
-        """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        if is_insert:
+            if first_deleted is not None:
+                return first_deleted
+            raise FullError("Table is full!")
+        raise KeyError(key)
 
     def __getitem__(self, key: K) -> V:
         """
@@ -161,8 +144,6 @@ class HashyStepTable(Generic[K, V]):
         :raises KeyError: when the key doesn't exist.
         """
         position = self._hashy_probe(key, False)
-        if self.array[position][1] == self.sentinel:
-            raise KeyError
         return self.array[position][1]
 
     def __setitem__(self, key: K, data: V) -> None:
@@ -176,10 +157,16 @@ class HashyStepTable(Generic[K, V]):
 
         if self.array[position] is None:
             self.count += 1
+            self.slots.add(position)
+        elif self.array[position] is self.sentinel:
+            # Reusing the slot of a deleted item
+            self.count += 1
+            self.tombstones -= 1
+            self.slots.add(position)
 
         self.array[position] = (key, data)
 
-        if len(self) > self.table_size * 2 / 3:
+        if self.count + self.tombstones > self.table_size * self.MAX_LOAD_FACTOR:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
@@ -187,48 +174,59 @@ class HashyStepTable(Generic[K, V]):
         Deletes a (key, value) pair in our hash table.
 
         :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
-        :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+        :complexity worst: O(hash(key) + N*comp(K)) deleting item is at the end of a long chain,
+                    plus O(N*hash(K)) when the delete triggers a cleanup rehash or shrinks the table.
         :raises KeyError: when the key doesn't exist.
         """
         position = self._hashy_probe(key, False)
-        # Remove the element
-        self.array[position] = (key,self.sentinel)
-        self.count -=1
-    def is_empty(self) -> bool:
-        return self.count == 0
+        # Leave a tombstone so chains passing through this slot are not cut
+        self.array[position] = self.sentinel
+        self.slots.remove(position)
+        self.count -= 1
+        self.tombstones += 1
+        if not self._shrink_if_sparse() and self.tombstones > self.table_size * self.TOMBSTONE_FACTOR:
+            self._rehash(grow=False)
 
-    def is_full(self) -> bool:
-        return self.count == self.table_size
-
-    def _rehash(self) -> None:
+    def _rehash(self, grow: bool = True) -> None:
         """
-        Need to resize table and reinsert all values
+        Rebuilds the table without tombstones. When `grow` is set the table moves to the next size,
+        unless the live items alone fill less than half of the allowed load (then purging is enough).
 
         :complexity best: O(N*hash(K)) No probing.
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
         """
-        old_array = self.array
-        self.size_index += 1
-        if self.size_index == len(self.TABLE_SIZES):
-            # Cannot be resized further.
-            return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
-        for item in old_array:
-            if item is not None:
-                key, value = item
-                self[key] = value
-
-    def __str__(self) -> str:
-        """
-        Returns all they key/value pairs in our hash table (no particular
-        order).
-        :complexity: O(N * (str(key) + str(value))) where N is the table size
-        """
-        result = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+        size_index = self.size_index
+        if grow and self.count > self.table_size * self.MAX_LOAD_FACTOR / 2:
+            if self.size_index + 1 == len(self.TABLE_SIZES) and self.tombstones == 0:
+                # Cannot be resized further and there is nothing to clean up.
+                return
+            size_index = min(self.size_index + 1, len(self.TABLE_SIZES) - 1)
+        self._resize(size_index)
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Rebuilds the table with size TABLE_SIZES[size_index], dropping every tombstone.
+
+        :complexity best: O(N*hash(K) + M) No probing.
+        :complexity worst: O(N*hash(K) + N^2*comp(K) + M) Lots of probing.
+        Where N is len(self) and M is the new table size
+        """
+        old_array, old_slots = self.array, self.slots
+        self._allocate(size_index)
+        for old_position in old_slots:
+            item = old_array[old_position]
+            # The new table holds no tombstones and cannot overflow, so place the item directly
+            position = self._hashy_probe(item[0], True)
+            self.array[position] = item
+            self.slots.add(position)
+            self.count += 1
+
+    def compact(self) -> None:
+        """
+        Drops every tombstone and shrinks the table to the smallest size holding its items
+        at half the maximum load. Never grows the table.
+
+        :complexity: See _resize.
+        """
+        self._resize(min(self.size_index, self._fitting_size_index()))
@@ -0,0 +1,184 @@
+""" Perfect hash generator
+
+Builds HashyPerfectionTable subclasses for any closed set of string keys, e.g. the values of
+TeamStats, ResultStats, PlayerPosition or the player names of a league, so that every lookup
+in those tables is a single hash and a single probe.
+
+Small key sets get a parameter search over the HashyPerfectionTable hash
+(HASH_BASE, OFFSET, TABLE_SIZE). Larger sets, where a collision free choice of parameters is
+vanishingly unlikely, fall back to hash and displace (HashyDisplacementTable).
+"""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Iterable, Union
+
+from hashy_perfection_table import HashyDisplacementTable, HashyPerfectionTable
+
+# Key sets larger than this skip the parameter search, its odds of success fall off factorially
+MAX_SEARCH_KEYS = 24
+# Largest table searched, as a multiple of the number of keys
+MAX_SIZE_FACTOR = 2
+# Candidate (base, offset) pairs tried per table size before moving on to the next size
+ATTEMPTS_PER_SIZE = 4000
+HASH_BASES = range(2, 128)
+OFFSETS = range(7, 256)
+
+# Average number of keys per bucket in a displacement table
+KEYS_PER_BUCKET = 2
+# Seeds tried for a bucket before the table is made one slot larger
+MAX_DISPLACEMENT = 1 << 16
+
+
+def find_parameters(keys: Iterable[str], max_size: Union[int, None] = None) -> Union[tuple[int, int, int], None]:
+    """
+    Searches the HashyPerfectionTable hash family for parameters without collisions on `keys`,
+    trying the smallest table sizes first.
+
+    Args:
+        keys (Iterable[str]): The closed key set.
+        max_size (Union[int, None]): The largest table size to try, MAX_SIZE_FACTOR times the key count by default.
+
+    Returns:
+        Union[tuple[int, int, int], None]: (hash base, offset, table size), or None when the search failed.
+
+    Complexity:
+        Best Case Complexity: O(L), where L is the total length of the keys (the first candidate works)
+        Worst Case Complexity: O(S*A*L), where S is the number of sizes and A is ATTEMPTS_PER_SIZE
+    """
+    keys = _distinct(keys)
+    if max_size is None:
+        max_size = MAX_SIZE_FACTOR * len(keys)
+    # the formula adds the key length to every character
+    codes = [[ord(char) + len(key) for char in key] for key in keys]
+    longest = max(len(key) for key in keys)
+    for table_size in range(len(keys), max_size + 1):
+        attempts = 0
+        for hash_base in HASH_BASES:
+            for offset in OFFSETS:
+                if attempts == ATTEMPTS_PER_SIZE:
+                    break
+                attempts += 1
+                powers = [pow(hash_base, i, offset) for i in range(longest)]
+                used = set()
+                for key_codes in codes:
+                    slot = sum(code * powers[i] % offset for i, code in enumerate(key_codes)) % table_size
+                    if slot in used:
+                        break
+                    used.add(slot)
+                else:
+                    return hash_base, offset, table_size
+    return None
+
+
+def find_displacements(keys: Iterable[str], table_size: Union[int, None] = None) -> tuple[tuple[int, ...], int]:
+    """
+    Hash and displace: splits the keys into buckets and, largest bucket first, finds for every
+    bucket the first seed that sends all its keys to free slots.
+
+    Args:
+        keys (Iterable[str]): The closed key set.
+        table_size (Union[int, None]): The table size to start from, the number of keys (minimal) by default.
+
+    Returns:
+        tuple[tuple[int, ...], int]: The displacement of every bucket and the table size.
+
+    Complexity:
+        Best Case Complexity: O(L), where L is the total length of the keys
+        Worst Case Complexity: O(B*D*L), where B is the number of buckets and D is MAX_DISPLACEMENT
+    """
+    keys = _distinct(keys)
+    table_size = max(table_size or len(keys), len(keys))
+    num_buckets = max(1, -(-len(keys) // KEYS_PER_BUCKET))
+    buckets: list[list[str]] = [[] for _ in range(num_buckets)]
+    for key in keys:
+        buckets[HashyDisplacementTable.seeded_hash(key, 0) % num_buckets].append(key)
+    order = sorted(range(num_buckets), key=lambda bucket: -len(buckets[bucket]))
+
+    while True:
+        displacements = [0] * num_buckets
+        used: set[int] = set()
+        for bucket in order:
+            seed = _displace(buckets[bucket], used, table_size)
+            if seed is None:
+                break
+            displacements[bucket] = seed
+        else:
+            return tuple(displacements), table_size
+        table_size += 1
+
+
+def _displace(bucket: list[str], used: set[int], table_size: int) -> Union[int, None]:
+    """
+    Finds the first seed sending every key of the bucket to a distinct free slot, and marks those slots used.
+    Returns None when no seed below MAX_DISPLACEMENT works.
+    """
+    if len(bucket) == 0:
+        return 0
+    for seed in range(1, MAX_DISPLACEMENT):
+        slots = {HashyDisplacementTable.seeded_hash(key, seed) % table_size for key in bucket}
+        if len(slots) == len(bucket) and used.isdisjoint(slots):
+            used |= slots
+            return seed
+    return None
+
+
+def perfect_table_class(keys: Union[Iterable[str], type[Enum]], name: str = "GeneratedPerfectionTable") -> type[HashyPerfectionTable]:
+    """
+    Generates a table class with a perfect hash for the given keys.
+
+    Args:
+        keys (Union[Iterable[str], type[Enum]]): The closed key set, or an Enum whose values are the keys.
+        name (str): The name of the generated class.
+
+    Returns:
+        type[HashyPerfectionTable]: A HashyPerfectionTable (or HashyDisplacementTable) subclass only accepting `keys`.
+
+    Raises:
+        ValueError: When the key set is empty or holds duplicates.
+    """
+    if isinstance(keys, type) and issubclass(keys, Enum):
+        keys = [member.value for member in keys]
+    keys = _distinct(keys)
+    parameters = find_parameters(keys) if len(keys) <= MAX_SEARCH_KEYS else None
+    if parameters is not None:
+        hash_base, offset, table_size = parameters
+        attributes = {"HASH_BASE": hash_base, "OFFSET": offset, "TABLE_SIZE": table_size}
+        table_class = type(name, (HashyPerfectionTable,), attributes)
+    else:
+        displacements, table_size = find_displacements(keys)
+        attributes = {"DISPLACEMENTS": displacements, "TABLE_SIZE": table_size}
+        table_class = type(name, (HashyDisplacementTable,), attributes)
+    table_class.KEYS = frozenset(keys)
+    table_class.__doc__ = f"Perfect hash table for {len(keys)} keys, generated by perfect_hash_generator."
+    return table_class
+
+
+def table_source(table_class: type[HashyPerfectionTable]) -> str:
+    """
+    Returns the source of a generated table class, to paste into a module so the search
+    does not run again on import.
+    """
+    base = table_class.__bases__[0]
+    lines = [f"class {table_class.__name__}({base.__name__}):",
+             f'    """ {table_class.__doc__} """',
+             f"    KEYS = frozenset({sorted(table_class.KEYS)!r})",
+             f"    TABLE_SIZE = {table_class.TABLE_SIZE}"]
+    if issubclass(table_class, HashyDisplacementTable):
+        lines.append(f"    DISPLACEMENTS = {table_class.DISPLACEMENTS!r}")
+    else:
+        lines.append(f"    HASH_BASE = {table_class.HASH_BASE}")
+        lines.append(f"    OFFSET = {table_class.OFFSET}")
+    return "\n".join(lines) + "\n"
+
+
+def _distinct(keys: Iterable[str]) -> list[str]:
+    """
+    :raises ValueError: when the key set is empty or holds duplicates
+    """
+    keys = list(keys)
+    if len(keys) == 0:
+        raise ValueError("Cannot build a perfect hash for an empty key set")
+    if len(set(keys)) != len(keys):
+        raise ValueError("The keys of a perfect hash must be distinct")
+    return keys
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from constants import PlayerPosition, PlayerStats
 from data_structures.hash_table import LinearProbeTable
-from hashy_perfection_table import HashyPerfectionTable
+from data_structures.enum_table import EnumTable
 class Player:
 
     def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
@@ -24,7 +24,9 @@ class Player:
         self.name = name
         self.position = position
         self.age = age
-        self.statistics = HashyPerfectionTable()
+        self.statistics = EnumTable(PlayerStats)
+        # bumped on every stat write through the player, lets cached samplers detect changed weights
+        self.version = 0
 
         for stat in PlayerStats:
             self.statistics[stat.value] = 0
@@ -43,6 +45,7 @@ class Player:
         """
         for stat in PlayerStats:
             self.statistics[stat.value] = 0
+        self.version += 1
 
     def get_name(self) -> str:
         """
@@ -96,9 +99,10 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(N*hash(K) + N^2*comp(K)), for N = len(self) and K as input object
+            Worst Case Complexity: O(1), the stats are stored in an EnumTable
         """
         self.statistics[statistic.value] = value
+        self.version += 1
 
     def __getitem__(self, statistic: PlayerStats) -> int:
         """
@@ -112,7 +116,7 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(N*hash(K) + N^2*comp(K)), for N = len(self) and K as input object
+            Worst Case Complexity: O(1), the stats are stored in an EnumTable
         """
         return self.statistics[statistic.value]
 
@@ -1,72 +1,282 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
+try:
+    import numpy
+except ImportError:  # numpy is optional, the bulk draws fall back to the array module
+    numpy = None
 
-class RandomGen:
+
+def lcg_jump(seed: int, steps: int, a: int, c: int, mod: int) -> int:
     """
-    Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
+    Returns the LCG state reached after `steps` calls to `random` starting at `seed`.
+    The affine step x -> a*x + c is composed with itself by repeated squaring.
+    :complexity: O(log(steps))
+    """
+    if steps < 0:
+        raise ValueError("Cannot jump backwards")
+    mul, add = 1, 0            # accumulated map, starts as the identity
+    step_mul, step_add = a, c  # the map for 2^i steps
+    while steps:
+        if steps & 1:
+            mul, add = (step_mul * mul) % mod, (step_mul * add + step_add) % mod
+        step_mul, step_add = (step_mul * step_mul) % mod, (step_mul * step_add + step_add) % mod
+        steps >>= 1
+    return (mul * seed + add) % mod
 
-    Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
 
-    Usage:
-    ```
-    RandomGen.set_seed(123)
-    RandomGen.random()           # Random number from 0 to 2^32-1
-    RandomGen.randint(1, 10)     # Random number from 1 to 10
-    RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
-    ```
+def mix_seed(seed: int) -> int:
+    """
+    Scrambles a seed with the SplitMix64 finaliser, so that nearby seeds (0, 1, 2, ...) give
+    unrelated starting states instead of LCG sequences that only differ in their first steps.
+    :complexity: O(1)
+    """
+    mask = (1 << 64) - 1
+    z = (seed + 0x9E3779B97F4A7C15) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    return z ^ (z >> 31)
+
+
+# Number of states produced per vectorised block by `lcg_block`.
+BLOCK_SIZE = 1024
+_block_coefficients = {}
+
+
+def _coefficients(a: int, c: int, mod: int) -> tuple:
+    """
+    Returns the (multiplier, increment) pairs taking a state 1..BLOCK_SIZE steps ahead, built once per LCG.
+    :complexity: O(BLOCK_SIZE) the first time, O(1) afterwards
+    """
+    key = (a, c, mod)
+    if key not in _block_coefficients:
+        muls, adds = [], []
+        mul, add = 1, 0
+        for _ in range(BLOCK_SIZE):
+            mul, add = (a * mul) % mod, (a * add + c) % mod
+            muls.append(mul)
+            adds.append(add)
+        if numpy is not None:
+            coefficients = (numpy.array(muls, dtype=numpy.uint64), numpy.array(adds, dtype=numpy.uint64))
+        else:
+            coefficients = tuple(zip(muls, adds))
+        _block_coefficients[key] = coefficients
+    return _block_coefficients[key]
+
+
+def lcg_block(seed: int, n: int, a: int, c: int, mod: int) -> tuple:
+    """
+    Produces the next `n` outputs (state >> 16) of the LCG starting at `seed`, exactly as
+    `n` calls to `random` would, and returns them together with the final seed.
+
+    Each block of BLOCK_SIZE states is computed independently from the block's starting state
+    (state_i = mul_i * seed + add_i), which vectorises with numpy when it is installed.
+    The modulus must be a power of two no larger than 2^64 so uint64 wrap-around is harmless.
+
+    :complexity: O(n)
+    """
+    mask = mod - 1
+    # reduce the seed like `random` does, negative or oversized seeds do not fit in a uint64
+    seed &= mask
+    if numpy is not None:
+        muls, adds = _coefficients(a, c, mod)
+        out = numpy.empty(n, dtype=numpy.uint64)
+        for start in range(0, n, BLOCK_SIZE):
+            size = min(BLOCK_SIZE, n - start)
+            states = (muls[:size] * numpy.uint64(seed) + adds[:size]) & numpy.uint64(mask)
+            out[start:start + size] = states >> numpy.uint64(16)
+            seed = int(states[-1])
+        return out, seed
+
+    coefficients = _coefficients(a, c, mod)
+    out = array('Q')
+    for start in range(0, n, BLOCK_SIZE):
+        block = coefficients if n - start >= BLOCK_SIZE else coefficients[:n - start]
+        states = [(mul * seed + add) & mask for mul, add in block]
+        out.extend([state >> 16 for state in states])
+        seed = states[-1]
+    return out, seed
+
+
+def _randint_block(values, lo: int, hi: int):
+    """Maps raw outputs onto `lo`..`hi` inclusive, like `randint`."""
+    span = hi - lo + 1
+    if numpy is not None:
+        return (values % numpy.uint64(span)).astype(numpy.int64) + lo
+    return array('q', [value % span + lo for value in values])
+
+
+def _chance_block(values, ratio: float):
+    """Returns value/2^32 < ratio for every raw output, like `random_chance`."""
+    # Dividing by 2^32 is exact in floating point, so compare against the scaled ratio instead.
+    threshold = ratio * (1 << 32)
+    if numpy is not None:
+        return values < threshold
+    return array('b', [value < threshold for value in values])
+
+
+class LCG:
     """
+    The draws shared by RandomGen and RandomStream, written once against `self.seed`.
+
+    RandomStream inherits them as instance methods. RandomGen binds the same functions with
+    `classmethod`, so there `self` is the class and every draw advances the global `RandomGen.seed`.
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
+    """
+    __slots__ = ()
 
     MOD: int = pow(2, 48)
     A: int = 25214903917
     C: int = 11
 
-    seed = time.time_ns()
-
-    @classmethod
-    def set_seed(cls, seed: int = None) -> None:
+    def set_seed(self, seed: int = None) -> None:
         """Seed all future calls to `random`."""
-        seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        self.seed = time.time_ns() if seed is None else seed
 
-    @classmethod
-    def random(cls) -> int:
+    def jump(self, steps: int) -> None:
+        """
+        Skips the next `steps` numbers of the sequence.
+        :complexity: O(log(steps))
+        """
+        self.seed = lcg_jump(self.seed, steps, self.A, self.C, self.MOD)
+
+    def random(self) -> int:
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
 
-    @classmethod
-    def random_float(cls) -> float:
+    def random_array(self, n: int):
+        """
+        Returns the next `n` numbers of `random` in one call.
+        A numpy uint64 array when numpy is installed, otherwise an array('Q').
+        :complexity: O(n)
+        """
+        values, self.seed = lcg_block(self.seed, n, self.A, self.C, self.MOD)
+        return values
+
+    def randint_array(self, lo: int, hi: int, n: int):
+        """
+        Returns the next `n` numbers of `randint(lo, hi)` in one call.
+        :complexity: O(n)
+        """
+        return _randint_block(self.random_array(n), lo, hi)
+
+    def random_chance_array(self, ratio: float, n: int):
+        """
+        Returns the next `n` results of `random_chance(ratio)` in one call (booleans, or 0/1 without numpy).
+        :complexity: O(n)
+        """
+        return _chance_block(self.random_array(n), ratio)
+
+    def choice_array(self, collection, n: int) -> list:
+        """
+        Returns the next `n` results of `random_choice(collection)` in one call.
+        :complexity: O(n)
+        """
+        return [collection[int(i)] for i in self.randint_array(0, len(collection) - 1, n)]
+
+    def random_float(self) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return self.random() / (1 << 32)
 
-    @classmethod
-    def randint(cls, lo: int, hi: int) -> int:
+    def randint(self, lo: int, hi: int) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return (self.random() % (hi - lo + 1)) + lo
 
-    @classmethod
-    def random_chance(cls, ratio: float) -> bool:
+    def random_chance(self, ratio: float) -> bool:
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return self.random_float() < ratio
 
-    @classmethod
-    def random_choice(cls, collection) -> None:
+    def random_choice(self, collection):
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return collection[self.randint(0, len(collection)-1)]
 
-    @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def random_shuffle(self, collection) -> None:
         """
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(self.random(), i) for i in range(len(collection))]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+class RandomGen:
+    """
+    Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
+
+    Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    The draws are the methods of LCG, bound to the class so they share the global `seed`.
+
+    Usage:
+    ```
+    RandomGen.set_seed(123)
+    RandomGen.random()           # Random number from 0 to 2^32-1
+    RandomGen.randint(1, 10)     # Random number from 1 to 10
+    RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    ```
+    """
+
+    MOD: int = LCG.MOD
+    A: int = LCG.A
+    C: int = LCG.C
+
+    seed = time.time_ns()
+
+    set_seed = classmethod(LCG.set_seed)
+    jump = classmethod(LCG.jump)
+    random = classmethod(LCG.random)
+    random_array = classmethod(LCG.random_array)
+    randint_array = classmethod(LCG.randint_array)
+    random_chance_array = classmethod(LCG.random_chance_array)
+    choice_array = classmethod(LCG.choice_array)
+    random_float = classmethod(LCG.random_float)
+    randint = classmethod(LCG.randint)
+    random_chance = classmethod(LCG.random_chance)
+    random_choice = classmethod(LCG.random_choice)
+    random_shuffle = classmethod(LCG.random_shuffle)
+
+    @classmethod
+    def stream(cls, seed: int = None) -> RandomStream:
+        """Returns an independent generator, seeded from `seed` (or the current global seed)."""
+        return RandomStream(cls.seed if seed is None else seed)
+
+
+class RandomStream(LCG):
+    """
+    Instance based version of RandomGen, with the same LCG constants and the same methods.
+
+    Each stream owns its seed, so separate simulations (threads, processes or interleaved
+    generators) never disturb each other. A stream seeded with `s` produces exactly the same
+    numbers as `RandomGen` after `RandomGen.set_seed(s)`.
+
+    Usage:
+    ```
+    season_rng = RandomStream(123)
+    week_rng = season_rng.substream(3)   # deterministic, non-overlapping with substream(2) and (4)
+    week_rng.randint(1, 10)
+    ```
+    """
+    __slots__ = ("seed",)
+
+    # Substreams are spaced 2^32 draws apart, which leaves room for 2^16 of them in the period.
+    SUBSTREAM_STRIDE: int = 1 << 32
+
+    def __init__(self, seed: int = None) -> None:
+        self.set_seed(seed)
+
+    def substream(self, index: int) -> RandomStream:
+        """
+        Returns a new stream starting `index * SUBSTREAM_STRIDE` draws ahead of this one.
+        Substreams with different indices do not overlap for fewer than SUBSTREAM_STRIDE draws.
+        :complexity: O(log(index * SUBSTREAM_STRIDE))
+        """
+        return RandomStream(lcg_jump(self.seed, index * self.SUBSTREAM_STRIDE, self.A, self.C, self.MOD))
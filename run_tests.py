@@ -19,17 +19,29 @@ if __name__ == "__main__":
     )
     args = p.parse_args()
 
+    suite = unittest.defaultTestLoader.discover('.')
+    # every task with at least one @number('task.x') test can be selected
+    tasks = set()
+    for s in suite:
+        for t in s:
+            if "FailedTest" in str(type(t)):
+                continue
+            for t2 in t:
+                func = getattr(t2, t2._testMethodName)
+                task = getattr(func, "__number__", "").split(".")[0]
+                if task.isdigit():
+                    tasks.add(int(task))
+
     while args.task == '':
         try:
-            task = input("Enter task [1 - 5], leave blank to run all tests: ")
+            task = input(f"Enter task [{min(tasks)} - {max(tasks)}], leave blank to run all tests: ")
             if task == '':
                 break
-            if 1 <= int(task) <= 5:
+            if int(task) in tasks:
                 args.task = int(task)
         except ValueError:
             pass
 
-    suite = unittest.defaultTestLoader.discover('.')
     for s in suite:
         for t in s:
             if "FailedTest" in str(type(t)):
@@ -1,13 +1,14 @@
 from __future__ import annotations
-from data_structures.bset import BSet
 from data_structures.referential_array import ArrayR
-from data_structures.linked_list import LinkedList
+from data_structures.indexable_skip_list import IndexableSkipList
 from algorithms import mergesort
+from algorithms.round_robin import round_robin
 from dataclasses import dataclass
 from team import Team
-from typing import Generator, Union
-from game_simulator import GameSimulator
-from constants import TeamStats,GameResult,PlayerStats,PlayerPosition,Constants,ResultStats
+from typing import Generator, Iterable, Union
+from game_simulator import GameSimulator, MatchResult
+from random_gen import RandomGen, RandomStream
+from constants import TeamStats,GameResult,PlayerStats,PlayerPosition,Constants
 from data_structures.array_sorted_list import ArraySortedList
 
 
@@ -96,24 +97,52 @@ class Season:
             teams (ArrayR[Team]): The teams played in this season.
 
         Complexity:
-            Best Case Complexity: O(S), S is the length of the schedule array
-            Worst Case Complexity: O(N^2+S), N is the number of the teams in the season, S is the length of the schedule array
+            Best Case Complexity: O(N^2), N is the number of the teams in the season
+            Worst Case Complexity: O(N^2), N is the number of the teams in the season
         """
         
         self.teams = teams
         self.leaderboard = ArraySortedList(len(teams))
-        for team in teams:
-            self.leaderboard.add(team)
+        self._rebuild_leaderboard()
         # for i in range(len(self.leaderboard)-1):
         #     for j in range(i+1,len(self.leaderboard)):
         #         if self.leaderboard[i].name > self.leaderboard[j].name:
         #             temp = self.leaderboard[i]
         #             self.leaderboard[i] = self.leaderboard[j]
         #             self.leaderboard[j] = temp
-        self.schedule = LinkedList()
-        schedule_array = self._generate_schedule()
-        for week in schedule_array:
+        # Weeks in playing order, moved by week number in O(log W)
+        self.schedule = IndexableSkipList()
+        for week in self.generate_weeks():
             self.schedule.append(week)
+        # Persistent position of get_next_game: the cursor and the number of weeks it handed out
+        self.schedule_cursor = iter(self.schedule)
+        self.weeks_served = 0
+
+    def generate_weeks(self) -> Generator[ArrayR[Game], None, None]:
+        """
+        Lazily generates the schedule one week at a time using the circle method,
+        so a large tournament can start simulating before the whole schedule exists.
+        The first half holds every pairing once, the second half replays the same
+        weeks with home and away flipped.
+
+        Yields:
+            ArrayR[Game]: The games for the next week of the season.
+
+        Complexity:
+            Best Case Complexity: O(N) per week, where N is the number of teams in the season.
+            Worst Case Complexity: O(N) per week, where N is the number of teams in the season.
+        """
+        for flipped in (False, True):
+            for pairs in round_robin(len(self.teams)):
+                if len(pairs) == 0:
+                    continue
+                games: ArrayR[Game] = ArrayR(len(pairs))
+                for i, (home, away) in enumerate(pairs):
+                    if flipped:
+                        home, away = away, home
+                    games[i] = Game(self.teams[home], self.teams[away])
+                yield games
+
     def _generate_schedule(self) -> ArrayR[ArrayR[Game]]:
         """
         Generates a schedule by generating all possible games between the teams.
@@ -127,59 +156,39 @@ class Season:
             Best Case Complexity: O(N^2) where N is the number of teams in the season.
             Worst Case Complexity: O(N^2) where N is the number of teams in the season.
         """
-        num_teams: int = len(self.teams)
-        weekly_games: list[ArrayR[Game]] = []
-        flipped_weeks: list[ArrayR[Game]] = []
-        games: list[Game] = []
-
-        # Generate all possible matchups (team1 vs team2, team2 vs team1, etc.)
-        for i in range(num_teams):
-            for j in range(i + 1, num_teams):
-                games.append(Game(self.teams[i], self.teams[j]))
-
-        # Allocate games into each week ensuring no team plays more than once in a week
-        week: int = 0
-        while games:
-            current_week: list[Game] = []
-            flipped_week: list[Game] = []
-            used_teams: BSet = BSet()
-
-            week_game_no: int = 0
-            for game in games[:]:  # Iterate over a copy of the list
-                if game.home_team.get_number() not in used_teams and game.away_team.get_number() not in used_teams:
-                    current_week.append(game)
-                    used_teams.add(game.home_team.get_number())
-                    used_teams.add(game.away_team.get_number())
+        return ArrayR.from_list(list(self.generate_weeks()))
 
-                    flipped_week.append(Game(game.away_team, game.home_team))
-                    games.remove(game)
-                    week_game_no += 1
-
-            weekly_games.append(ArrayR.from_list(current_week))
-            flipped_weeks.append(ArrayR.from_list(flipped_week))
-            week += 1
-
-        return ArrayR.from_list(weekly_games + flipped_weeks)
-
-    def simulate_season(self) -> None:
+    def simulate_season(self, rng: Union[type[RandomGen], RandomStream] = RandomGen) -> None:
         """
         Simulates the season.
 
+        Args:
+            rng (Union[type[RandomGen], RandomStream]): Source of randomness for every game.
+                Pass a RandomStream to keep the season independent of the global RandomGen.
+
         Complexity:
             Assume simulate_game is O(1)
             Remember to define your variables and their complexity.
 
-            Best Case Complexity: O(W*G), W is the number of weeks and G is the number of games in a week
-            Worst Case Complexity: O(W*G+P), W is the number of weeks, G is the number of games in a week, P is the number of players in a team
+            Best Case Complexity: O(W*G*(log(N)*comp + N + P + E)), W is the number of weeks, G is the number of games in a week,
+                N is the number of teams, P is the number of players in a team and E the number of events in a game.
+                Each game removes and binary re-inserts its two teams in the leaderboard.
+            Worst Case Complexity: O(W*G*(log(N)*comp + N + P + E)), see best case
         """
+        # stats may have changed since the leaderboard was last sorted (reset_stats, manual edits)
+        self._rebuild_leaderboard()
         for week in self.schedule:
             for game in week:
+                # take both teams out of the leaderboard while it is still sorted by their old stats
+                self.leaderboard.remove(game.home_team)
+                self.leaderboard.remove(game.away_team)
+
                 #updating results values
-                results = GameSimulator.simulate(game.home_team,game.away_team)
-                if results[ResultStats.HOME_GOALS.value]>results[ResultStats.AWAY_GOALS.value]:
+                results = GameSimulator.simulate(game.home_team,game.away_team,rng)
+                if results.home_goals>results.away_goals:
                     game.home_team[TeamStats.WINS] = game.home_team.statistics[TeamStats.WINS.value] + 1
                     game.away_team[TeamStats.LOSSES] += 1
-                elif results[ResultStats.HOME_GOALS.value]==results[ResultStats.AWAY_GOALS.value]:
+                elif results.home_goals==results.away_goals:
                     game.home_team[TeamStats.DRAWS] += 1
                     game.away_team[TeamStats.DRAWS] += 1
                 else:
@@ -187,10 +196,10 @@ class Season:
                     game.away_team[TeamStats.WINS] += 1
 
                 #updating goals for/against
-                game.home_team[TeamStats.GOALS_FOR] += results[ResultStats.HOME_GOALS.value]
-                game.home_team[TeamStats.GOALS_AGAINST] += results[ResultStats.AWAY_GOALS.value]
-                game.away_team[TeamStats.GOALS_FOR] += results[ResultStats.AWAY_GOALS.value]
-                game.away_team[TeamStats.GOALS_AGAINST] += results[ResultStats.HOME_GOALS.value]
+                game.home_team[TeamStats.GOALS_FOR] += results.home_goals
+                game.home_team[TeamStats.GOALS_AGAINST] += results.away_goals
+                game.away_team[TeamStats.GOALS_FOR] += results.away_goals
+                game.away_team[TeamStats.GOALS_AGAINST] += results.home_goals
 
                 # #updating games played
                 # game.home_team[TeamStats.GAMES_PLAYED.value] += 1
@@ -200,70 +209,107 @@ class Season:
                 for player_list in [game.home_team.get_players(), game.away_team.get_players()]:
                     for player in player_list:
                         player.statistics[PlayerStats.GAMES_PLAYED.value] += 1
-                        if results[ResultStats.GOAL_SCORERS.value] == None:
-                            pass
-                        elif player.name in results[ResultStats.GOAL_SCORERS.value]:
-                            for player_name in results[ResultStats.GOAL_SCORERS.value]:
-                                if player_name == player.name:
-                                    player.statistics[PlayerStats.GOALS.value] += 1
-                        if results[ResultStats.GOAL_ASSISTS.value] == None:
-                            pass
-                        elif player.name in results[ResultStats.GOAL_ASSISTS.value]:
-                            for player_name in results[ResultStats.GOAL_ASSISTS.value]:
-                                if player_name == player.name:
-                                    player.statistics[PlayerStats.ASSISTS.value] += 1
-                        if results[ResultStats.INTERCEPTIONS.value] == None:
-                            pass
-                        elif player.name in results[ResultStats.INTERCEPTIONS.value]:
-                            for player_name in results[ResultStats.INTERCEPTIONS.value]:
-                                if player_name == player.name:
-                                    player.statistics[PlayerStats.INTERCEPTIONS.value] += 1
-                        if results[ResultStats.TACKLES.value]==None:
-                            pass
-                        elif player.name in results[ResultStats.TACKLES.value]:
-                            for player_name in results[ResultStats.TACKLES.value]:
-                                if player_name == player.name:
-                                    player.statistics[PlayerStats.TACKLES.value] += 1
-                # re initialize leaderboard to get values in right order;
-                temp_list = self.leaderboard
-                self.leaderboard = ArraySortedList(len(self.teams))
-                for team in temp_list:
-                    self.leaderboard.add(team)
+                for player, counts in results.player_events().items():
+                    for stat, count in zip(MatchResult.EVENT_STATS, counts):
+                        if count > 0:
+                            player.statistics[stat.value] += count
+
+                # binary re-insert only the two teams whose stats changed
+                self.leaderboard.add(game.home_team)
+                self.leaderboard.add(game.away_team)
+
+    def _rebuild_leaderboard(self) -> None:
+        """
+        Sorts every team into the leaderboard again, by their current stats.
+
+        Complexity:
+            Best Case Complexity: O(N*log(N)*comp), N is the number of teams, each team goes at the end
+            Worst Case Complexity: O(N^2 + N*log(N)*comp), every insertion shuffles the whole leaderboard
+        """
+        self.leaderboard.reset()
+        for team in self.teams:
+            self.leaderboard.add(team)
 
     def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
         """
         Delay a week of games from one week to another.
+        get_next_game carries on from the same week number, in the new order.
 
         Args:
             orig_week (int): The original week to move the games from.
             new_week (Union[int, None]): The new week to move the games to. If this is None, it moves the games to the end of the season.
 
+        Raises:
+            ValueError: If either week is not in the schedule.
+
         Complexity:
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(N), N is the length of the schedule linked list
+            Best Case Complexity: O(log(W)), W is the number of weeks in the schedule (expected)
+            Worst Case Complexity: O(log(W)), see best case
+        """
+        self._move_week(orig_week, new_week)
+        self._reset_cursor()
+
+    def reschedule(self, moves: Iterable[tuple[int, Union[int, None]]]) -> None:
+        """
+        Applies several delays in one pass, in order, as if delay_week_of_games was called for each.
+        get_next_game carries on from the same week number, in the final order.
+
+        Args:
+            moves (Iterable[tuple[int, Union[int, None]]]): (orig_week, new_week) pairs, see delay_week_of_games.
+
+        Raises:
+            ValueError: If a week is not in the schedule. The moves before it stay applied.
+
+        Complexity:
+            Best Case Complexity: O(M*log(W)), M is the number of moves and W the number of weeks (expected)
+            Worst Case Complexity: O(M*log(W)), see best case
+        """
+        try:
+            for orig_week, new_week in moves:
+                self._move_week(orig_week, new_week)
+        finally:
+            self._reset_cursor()
+
+    def _move_week(self, orig_week: int, new_week: Union[int, None]) -> None:
+        """
+        Moves a week of games in the schedule, without touching the get_next_game cursor.
+
+        Complexity:
+            Best Case Complexity: O(log(W)), W is the number of weeks in the schedule (expected)
+            Worst Case Complexity: O(log(W)), see best case
+        """
+        if new_week is None:
+            new_week = len(self.schedule)
+        self.schedule.move(orig_week-1, new_week-1)
+
+    def _reset_cursor(self) -> None:
+        """
+        Moves the get_next_game cursor back onto the schedule after it changed,
+        past the weeks already handed out.
+
+        Complexity:
+            Best Case Complexity: O(log(W)), W is the number of weeks in the schedule (expected)
+            Worst Case Complexity: O(log(W)), see best case
         """
-        temp = self.schedule[orig_week-1]
-        if isinstance(new_week,int):
-            self.schedule.delete_at_index(orig_week-1)
-            self.schedule.insert(new_week-1,temp)
-        elif new_week == None:
-            self.schedule.delete_at_index(orig_week-1)
-            self.schedule.append(temp)
+        self.schedule_cursor = self.schedule.iterate_from(min(self.weeks_served, len(self.schedule)))
 
-    def get_next_game(self) -> Union[Generator[Game], None]:
+    def get_next_game(self) -> Union[ArrayR[Game], None]:
         """
-        Gets the next game in the season.
+        Gets the next week of games in the season.
+        Every call moves on by one week, starting with the first.
 
         Returns:
-            Game: The next game in the season.
+            ArrayR[Game]: The games of the next week in the season.
             or None if there are no more games left.
 
         Complexity:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        iter(self.schedule)
-        return next(self.schedule)
+        week = next(self.schedule_cursor, None)
+        if week is not None:
+            self.weeks_served += 1
+        return week
 
     def get_leaderboard(self) -> ArrayR[ArrayR[Union[int, str]]]:
         """
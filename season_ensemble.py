@@ -0,0 +1,275 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Iterable, Union
+
+from constants import PlayerPosition, PlayerStats, TeamStats
+from data_structures.referential_array import ArrayR
+from player import Player
+from random_gen import RandomStream, mix_seed
+from season import Season
+from team import Team
+
+
+# The per-game statistics accumulated by the simulator, in the order they are reported by a run.
+ENSEMBLE_PLAYER_STATS = (PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                         PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
+# The attributes a player brings into a season, the only stats a PlayerSpec copies.
+SPEC_PLAYER_STATS = (PlayerStats.WEIGHT, PlayerStats.HEIGHT, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+
+
+@dataclass(frozen=True)
+class PlayerSpec:
+    """
+    Picklable description of a player, used to rebuild the player inside a worker process.
+    `attributes` holds the (stat, value) pairs set on the player before the season starts.
+    """
+    name: str
+    position: PlayerPosition
+    age: int
+    attributes: tuple[tuple[PlayerStats, int], ...] = ()
+
+    @classmethod
+    def from_player(cls, player: Player) -> PlayerSpec:
+        """
+        Captures the name, position, age and non-zero SPEC_PLAYER_STATS of an existing player.
+        Per-game totals are left out, so a player who already played starts every run afresh.
+
+        Complexity:
+            Best Case Complexity: O(A), where A is the number of SPEC_PLAYER_STATS
+            Worst Case Complexity: O(A), where A is the number of SPEC_PLAYER_STATS
+        """
+        attributes = tuple((stat, player[stat]) for stat in SPEC_PLAYER_STATS if player[stat] != 0)
+        return cls(player.get_name(), player.get_position(), player.age, attributes)
+
+    def build(self) -> Player:
+        """
+        Creates a fresh player from this spec.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of PlayerStats
+            Worst Case Complexity: O(S), where S is the number of PlayerStats
+        """
+        player = Player(self.name, self.position, self.age)
+        for stat, value in self.attributes:
+            player[stat] = value
+        return player
+
+
+@dataclass(frozen=True)
+class TeamSpec:
+    """
+    Picklable description of a team and its (non-empty) roster.
+    """
+    name: str
+    players: tuple[PlayerSpec, ...]
+
+    @classmethod
+    def from_team(cls, team: Team) -> TeamSpec:
+        """
+        Captures the name and the current roster of an existing team.
+
+        Complexity:
+            Best Case Complexity: O(P*S), where P is the number of players and S the number of PlayerStats
+            Worst Case Complexity: O(P*S), where P is the number of players and S the number of PlayerStats
+        """
+        return cls(team.get_name(), tuple(PlayerSpec.from_player(player) for player in team.get_players()))
+
+    def build(self) -> Team:
+        """
+        Creates a fresh team (with fresh players) from this spec.
+
+        Complexity:
+            Best Case Complexity: O(P*S), where P is the number of players and S the number of PlayerStats
+            Worst Case Complexity: O(P*S), where P is the number of players and S the number of PlayerStats
+        """
+        players: ArrayR[Player] = ArrayR(len(self.players))
+        for i, player in enumerate(self.players):
+            players[i] = player.build()
+        return Team(self.name, players)
+
+
+def simulate_run(team_specs: tuple[TeamSpec, ...], seed: int) -> tuple:
+    """
+    Simulates a single season from scratch and summarises it with plain tuples,
+    so only a few numbers (not the object graph) travel back to the parent process.
+
+    Args:
+        team_specs (tuple[TeamSpec, ...]): The teams of the league.
+        seed (int): The seed of this run, scrambled with mix_seed before seeding its stream.
+
+    Returns:
+        tuple: (positions, points, player_stats) where positions[t] is the final (0-based)
+            leaderboard position of team t, points[t] its points, and player_stats[t][p]
+            the values of ENSEMBLE_PLAYER_STATS for player p of team t.
+
+    Complexity:
+        Best Case Complexity: O(season), the cost of building and simulating the season.
+        Worst Case Complexity: O(season), the cost of building and simulating the season.
+    """
+    teams: ArrayR[Team] = ArrayR(len(team_specs))
+    for i, spec in enumerate(team_specs):
+        teams[i] = spec.build()
+
+    season = Season(teams)
+    # A private stream keeps the run independent of the global RandomGen (and of other runs).
+    # Consecutive seeds would start LCG sequences that stay correlated, so the seed is scrambled first.
+    season.simulate_season(RandomStream(mix_seed(seed)))
+
+    team_index = {id(teams[i]): i for i in range(len(teams))}
+    positions = [0] * len(teams)
+    for position, team in enumerate(season.leaderboard):
+        positions[team_index[id(team)]] = position
+
+    points = tuple(teams[i][TeamStats.POINTS] for i in range(len(teams)))
+    # initial_player_states keeps the players in spec order, get_players would group them by position
+    player_stats = tuple(
+        tuple(tuple(player[stat] for stat in ENSEMBLE_PLAYER_STATS) for player in teams[i].initial_player_states)
+        for i in range(len(teams))
+    )
+    return tuple(positions), points, player_stats
+
+
+class SeasonEnsemble:
+    """
+    Monte Carlo runner that replays the same league under many seeds across a process pool
+    and aggregates the outcome of every run as it arrives.
+
+    Usage:
+    ```
+    ensemble = SeasonEnsemble([TeamSpec.from_team(team) for team in teams], range(1000))
+    ensemble.run()
+    ensemble.title_probability(0)
+    ```
+    """
+
+    def __init__(self, team_specs: Iterable[TeamSpec], seeds: Iterable[int]) -> None:
+        """
+        Args:
+            team_specs (Iterable[TeamSpec]): The teams of the league, in a fixed order.
+            seeds (Iterable[int]): One seed per simulated season.
+
+        Complexity:
+            Best Case Complexity: O(T*(T+R+P)), where T is the number of teams, R the number of seeds and P the largest squad size
+            Worst Case Complexity: O(T*(T+R+P)), where T is the number of teams, R the number of seeds and P the largest squad size
+        """
+        self.team_specs: tuple[TeamSpec, ...] = tuple(team_specs)
+        self.seeds: tuple[int, ...] = tuple(seeds)
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Empties the aggregates, so they only describe the runs of the next call to run.
+
+        Complexity:
+            Best Case Complexity: O(T*(T+R+P)), where T is the number of teams, R the number of seeds and P the largest squad size
+            Worst Case Complexity: O(T*(T+R+P)), where T is the number of teams, R the number of seeds and P the largest squad size
+        """
+        self.runs = 0
+        num_teams = len(self.team_specs)
+        self.position_histogram: ArrayR[ArrayR[int]] = ArrayR(num_teams)
+        self.points: ArrayR[ArrayR[int]] = ArrayR(num_teams)
+        self.player_stat_totals: ArrayR[ArrayR[ArrayR[int]]] = ArrayR(num_teams)
+        for t, spec in enumerate(self.team_specs):
+            self.position_histogram[t] = ArrayR(num_teams)
+            self.points[t] = ArrayR(max(1, len(self.seeds)))
+            self.player_stat_totals[t] = ArrayR(len(spec.players))
+            for position in range(num_teams):
+                self.position_histogram[t][position] = 0
+            for p in range(len(spec.players)):
+                self.player_stat_totals[t][p] = ArrayR(len(ENSEMBLE_PLAYER_STATS))
+                for s in range(len(ENSEMBLE_PLAYER_STATS)):
+                    self.player_stat_totals[t][p][s] = 0
+
+    def run(self, max_workers: Union[int, None] = None, chunksize: int = 1) -> SeasonEnsemble:
+        """
+        Simulates one season per seed across a ProcessPoolExecutor.
+        The results are aggregated in seed order, so the outcome does not depend on the number of workers.
+        Running again starts the aggregates afresh instead of adding to the previous runs.
+
+        Args:
+            max_workers (Union[int, None]): Number of worker processes, None lets the executor decide.
+            chunksize (int): Number of seeds sent to a worker at a time.
+
+        Returns:
+            SeasonEnsemble: self, to allow chaining.
+
+        Complexity:
+            Best Case Complexity: O(R*season/W), R is the number of seeds and W the number of workers.
+            Worst Case Complexity: O(R*season/W), R is the number of seeds and W the number of workers.
+        """
+        self._reset()
+        worker = partial(simulate_run, self.team_specs)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for summary in executor.map(worker, self.seeds, chunksize=chunksize):
+                self._add_run(*summary)
+        return self
+
+    def _add_run(self, positions: tuple, points: tuple, player_stats: tuple) -> None:
+        """
+        Folds the summary of a single run into the aggregates.
+
+        Complexity:
+            Best Case Complexity: O(T*P), where T is the number of teams and P the largest squad size
+            Worst Case Complexity: O(T*P), where T is the number of teams and P the largest squad size
+        """
+        for t in range(len(self.team_specs)):
+            self.position_histogram[t][positions[t]] += 1
+            self.points[t][self.runs] = points[t]
+            for p, values in enumerate(player_stats[t]):
+                totals = self.player_stat_totals[t][p]
+                for s, value in enumerate(values):
+                    totals[s] += value
+        self.runs += 1
+
+    def position_probability(self, team_index: int, position: int) -> float:
+        """
+        Returns the fraction of runs in which the team finished at the given 0-based position.
+        """
+        if self.runs == 0:
+            return 0.0
+        return self.position_histogram[team_index][position] / self.runs
+
+    def title_probability(self, team_index: int) -> float:
+        """
+        Returns the fraction of runs the team finished top of the leaderboard.
+        """
+        return self.position_probability(team_index, 0)
+
+    def relegation_probability(self, team_index: int, places: int = 3) -> float:
+        """
+        Returns the fraction of runs the team finished in one of the bottom `places` positions.
+
+        Complexity:
+            Best Case Complexity: O(places)
+            Worst Case Complexity: O(places)
+        """
+        num_teams = len(self.team_specs)
+        return sum(self.position_probability(team_index, position)
+                   for position in range(max(0, num_teams - places), num_teams))
+
+    def mean_points(self, team_index: int) -> float:
+        """
+        Returns the mean points of the team over all runs.
+
+        Complexity:
+            Best Case Complexity: O(R), where R is the number of runs
+            Worst Case Complexity: O(R), where R is the number of runs
+        """
+        if self.runs == 0:
+            return 0.0
+        return sum(self.points[team_index][run] for run in range(self.runs)) / self.runs
+
+    def mean_player_stat(self, team_index: int, player_index: int, stat: PlayerStats) -> float:
+        """
+        Returns the mean of a per-game statistic (see ENSEMBLE_PLAYER_STATS) for a player over all runs.
+
+        Raises:
+            ValueError: If the statistic is not accumulated during a season.
+        """
+        if stat not in ENSEMBLE_PLAYER_STATS:
+            raise ValueError(f"{stat} is not accumulated by the simulator")
+        if self.runs == 0:
+            return 0.0
+        return self.player_stat_totals[team_index][player_index][ENSEMBLE_PLAYER_STATS.index(stat)] / self.runs
@@ -1,18 +1,27 @@
 from __future__ import annotations
 from data_structures.referential_array import ArrayR
-from data_structures.hash_table import LinearProbeTable
-from data_structures.linked_stack import LinkedStack
 from data_structures.linked_list import LinkedList
-from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
 from data_structures.linked_queue import LinkedQueue
+from data_structures.enum_table import EnumTable
 from constants import GameResult, PlayerPosition, PlayerStats, TeamStats, Constants
 from player import Player
 from typing import Collection, Union, TypeVar
-from hashy_step_table import HashyStepTable
+from hashy_perfection_table import HashyPerfectionTable
 
 T = TypeVar("T")
 
 
+# Single probe table for the squads, keyed by position value.
+# Pasted from table_source(perfect_table_class(PlayerPosition, "PlayerPositionTable")) so importing
+# this module does not run the parameter search, regenerate it when PlayerPosition changes.
+class PlayerPositionTable(HashyPerfectionTable):
+    """ Perfect hash table for 4 keys, generated by perfect_hash_generator. """
+    KEYS = frozenset(['Defender', 'Goalkeeper', 'Midfielder', 'Striker'])
+    TABLE_SIZE = 4
+    HASH_BASE = 2
+    OFFSET = 8
+
+
 class Team:
     count = 0
     def __init__(self, team_name: str, players: ArrayR[Player]) -> None:
@@ -35,11 +44,13 @@ class Team:
         Team.count += 1             #increments the class count by 1 every time an instance of the Team object 
         self.number = Team.count    #is initialised and assigns it to that initialisation.
         self.name = team_name
-        self.statistics = HashyStepTable()
+        self.statistics = EnumTable(TeamStats)
         for stat in TeamStats:
             self.statistics[stat.value] = 0
         self.statistics[TeamStats.LAST_FIVE_RESULTS.value] = LinkedQueue()
-        self.players = HashyStepTable()
+        self.players = PlayerPositionTable()
+        # bumped whenever a player joins or leaves, lets cached samplers detect roster changes
+        self.roster_version = 0
         for position in PlayerPosition:
             self.players[position.value] = LinkedList()
         for player in players:
@@ -73,6 +84,7 @@ class Team:
             Worst Case Complexity: O(n), n is the number of elements in the players hash table
         """
         self.players[player.position.value].append(player)
+        self.roster_version += 1
 
     def remove_player(self, player: Player) -> None:
         """
@@ -91,6 +103,7 @@ class Team:
         playerpos = player.position.value
         player_ind_in_lst = self.players[playerpos].index(player)
         self.players[playerpos].delete_at_index(player_ind_in_lst)
+        self.roster_version += 1
         return None
 
     def get_number(self) -> int:
@@ -226,22 +239,23 @@ class Team:
             Best Case Complexity: O(comp), comp is cost of comparison
             Worst Case Complexity: O(comp^2), comp is cost of comparison
         """
-        self.statistics[statistic.value] = value
-        if statistic.value in [TeamStats.WINS.value,TeamStats.DRAWS.value,TeamStats.LOSSES.value]:
-            self.statistics[TeamStats.GAMES_PLAYED.value]+=1
-            if statistic.value == TeamStats.WINS.value:
-                self.statistics[TeamStats.POINTS.value] +=  GameResult.WIN.value
-                self.statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.WIN)
-            elif statistic.value == TeamStats.DRAWS.value:
-                self.statistics[TeamStats.POINTS.value] += GameResult.DRAW.value
-                self.statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.DRAW)
-            elif statistic.value == TeamStats.LOSSES.value:
-                self.statistics[TeamStats.POINTS.value] += GameResult.LOSS.value
-                self.statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.LOSS)
-        if len(self.statistics[TeamStats.LAST_FIVE_RESULTS.value]) > 5:
-            self.statistics[TeamStats.LAST_FIVE_RESULTS.value].serve()
+        statistics = self.statistics
+        statistics[statistic.value] = value
+        if statistic is TeamStats.WINS or statistic is TeamStats.DRAWS or statistic is TeamStats.LOSSES:
+            statistics[TeamStats.GAMES_PLAYED.value]+=1
+            if statistic is TeamStats.WINS:
+                statistics[TeamStats.POINTS.value] +=  GameResult.WIN.value
+                statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.WIN)
+            elif statistic is TeamStats.DRAWS:
+                statistics[TeamStats.POINTS.value] += GameResult.DRAW.value
+                statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.DRAW)
+            else:
+                statistics[TeamStats.POINTS.value] += GameResult.LOSS.value
+                statistics[TeamStats.LAST_FIVE_RESULTS.value].append(GameResult.LOSS)
+        if len(statistics[TeamStats.LAST_FIVE_RESULTS.value]) > 5:
+            statistics[TeamStats.LAST_FIVE_RESULTS.value].serve()
         #if statistic in [TeamStats.GOALS_FOR,TeamStats.GOALS_AGAINST]:
-        self.statistics[TeamStats.GOALS_DIFFERENCE.value] = self.statistics[TeamStats.GOALS_FOR.value] - self.statistics[TeamStats.GOALS_AGAINST.value]
+        statistics[TeamStats.GOALS_DIFFERENCE.value] = statistics[TeamStats.GOALS_FOR.value] - statistics[TeamStats.GOALS_AGAINST.value]
 
     def __getitem__(self, statistic: TeamStats) -> int:
         """
@@ -273,8 +287,8 @@ class Team:
 
         # get number of players not this
         totallength = 0
-        for position in self.players.values():
-            totallength += len(position)
+        for position in PlayerPosition:
+            totallength += len(self.players[position.value])
         return totallength
     
     def __lt__(self,other:Team) -> bool:
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.linked_list import LinkedList
+
+
+class TestLinkedList(TestCase):
+
+    def setUp(self) -> None:
+        self.linked_list: LinkedList[int] = LinkedList()
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rear_maintenance(self):
+        for i in range(5):
+            self.linked_list.append(i)
+        self.linked_list.insert(5, 5)
+        self.assertEqual(self.linked_list.rear.item, 5, "Inserting at the end should move the rear")
+        self.assertEqual(list(self.linked_list), [0, 1, 2, 3, 4, 5])
+
+        self.linked_list.delete_at_index(5)
+        self.assertEqual(self.linked_list.rear.item, 4, "Deleting the last item should move the rear back")
+        self.linked_list.append(6)
+        self.assertEqual(list(self.linked_list), [0, 1, 2, 3, 4, 6])
+        self.assertRaises(ValueError, lambda: self.linked_list.delete_at_index(6))
+
+        self.linked_list.clear()
+        self.assertIsNone(self.linked_list.rear, "Clearing should drop the rear")
+        self.linked_list.append(7)
+        self.assertEqual(list(self.linked_list), [7])
+
+        self.linked_list.delete_at_index(0)
+        self.assertIsNone(self.linked_list.rear, "Emptying the list should drop the rear")
+        self.linked_list.insert(0, 8)
+        self.linked_list.append(9)
+        self.assertEqual(list(self.linked_list), [8, 9])
+        self.assertEqual(self.linked_list.rear.item, 9)
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_nested_iteration(self):
+        for i in range(4):
+            self.linked_list.append(i)
+        pairs = [(a, b) for a in self.linked_list for b in self.linked_list]
+        self.assertEqual(pairs, [(a, b) for a in range(4) for b in range(4)], "Nested traversals should not interfere")
+
+        first, second = iter(self.linked_list), iter(self.linked_list)
+        self.assertEqual(next(first), 0)
+        self.assertEqual(next(first), 1)
+        self.assertEqual(next(second), 0, "A new iterator should start from the head")
+        self.assertEqual(next(first), 2)
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_indexed_access_after_mutation(self):
+        for i in range(6):
+            self.linked_list.append(i)
+        self.assertEqual([self.linked_list[i] for i in range(6)], list(range(6)))
+        self.assertEqual(self.linked_list[3], 3, "Going back before the finger should walk from the head")
+
+        # mutations before, at and after the last accessed position
+        self.linked_list.insert(2, 10)
+        self.assertEqual(self.linked_list[3], 2)
+        self.linked_list.delete_at_index(0)
+        self.assertEqual(self.linked_list[3], 3)
+        self.linked_list.delete_at_index(3)
+        self.assertEqual(self.linked_list[3], 4)
+        self.linked_list[3] = 20
+        self.linked_list.insert(4, 30)
+        self.linked_list.append(40)
+        self.assertEqual([self.linked_list[i] for i in range(len(self.linked_list))], [1, 10, 2, 20, 30, 5, 40])
+
+        self.linked_list.clear()
+        self.linked_list.append(7)
+        self.assertEqual(self.linked_list[0], 7, "Clearing should drop the finger")
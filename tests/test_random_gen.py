@@ -0,0 +1,98 @@
+from unittest import TestCase, skipIf
+
+import random_gen
+from ed_utils.decorators import number, visibility
+from random_gen import RandomGen, RandomStream
+
+
+class TestRandomGen(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.expected: list[int] = [RandomGen.random() for _ in range(200)]
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_matches_global(self):
+        stream = RandomStream(123)
+        for i, value in enumerate(self.expected):
+            self.assertEqual(stream.random(), value, f"Stream diverged from RandomGen at draw {i}")
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_jump(self):
+        for steps in [0, 1, 2, 17, 199]:
+            stream = RandomStream(123)
+            stream.jump(steps)
+            self.assertEqual(stream.random(), self.expected[steps], f"Jumping {steps} steps landed on the wrong draw")
+
+        RandomGen.set_seed(123)
+        RandomGen.jump(50)
+        self.assertEqual(RandomGen.random(), self.expected[50], "RandomGen.jump landed on the wrong draw")
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_substreams_are_independent(self):
+        base = RandomStream(123)
+        first = base.substream(1)
+        second = base.substream(2)
+        walked = RandomStream(123)
+        walked.jump(RandomStream.SUBSTREAM_STRIDE)
+
+        # Interleaving draws of the two substreams must not change either sequence
+        for _ in range(50):
+            self.assertEqual(first.random(), walked.random(), "Substream 1 does not start one stride ahead")
+            second.random()
+        self.assertEqual(base.random(), self.expected[0], "Creating substreams must not advance the parent stream")
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bulk_draws_match_scalar_draws(self):
+        for n in [1, 7, 1024, 2500]:
+            scalar, bulk = RandomStream(42), RandomStream(42)
+            expected = [scalar.random() for _ in range(n)]
+            self.assertEqual([int(value) for value in bulk.random_array(n)], expected, f"random_array({n}) differs")
+            self.assertEqual(bulk.seed, scalar.seed, "Bulk draws left the stream at a different state")
+
+            expected = [scalar.randint(3, 9) for _ in range(n)]
+            self.assertEqual([int(value) for value in bulk.randint_array(3, 9, n)], expected, "randint_array differs")
+
+            expected = [scalar.random_chance(0.7) for _ in range(n)]
+            self.assertEqual([bool(value) for value in bulk.random_chance_array(0.7, n)], expected, "random_chance_array differs")
+
+            expected = [scalar.random_choice("ABCDE") for _ in range(n)]
+            self.assertEqual(bulk.choice_array("ABCDE", n), expected, "choice_array differs")
+
+        RandomGen.set_seed(123)
+        self.assertEqual([int(value) for value in RandomGen.random_array(150)], self.expected[:150])
+        self.assertEqual(RandomGen.random(), self.expected[150], "RandomGen.random_array did not advance the global seed")
+
+        for seed in [-5, 2 ** 70]:
+            scalar, bulk = RandomStream(seed), RandomStream(seed)
+            expected = [scalar.random() for _ in range(1500)]
+            self.assertEqual([int(value) for value in bulk.random_array(1500)], expected, f"random_array differs for seed {seed}")
+
+    @number("6.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(random_gen.numpy is None, "numpy is not installed")
+    def test_numpy_bulk_draws(self):
+        for seed in [42, -5, 2 ** 70, RandomStream.MOD - 1]:
+            scalar, bulk = RandomStream(seed), RandomStream(seed)
+            expected = [scalar.random() for _ in range(2500)]
+            values = bulk.random_array(2500)
+            self.assertIsInstance(values, random_gen.numpy.ndarray, "numpy should be used when installed")
+            self.assertEqual(values.tolist(), expected, f"numpy random_array differs for seed {seed}")
+            self.assertEqual(bulk.seed, scalar.seed, "numpy draws left the stream at a different state")
+
+    @number("6.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_mixed_seeds_are_uncorrelated(self):
+        def first_draw_gaps(seeds) -> set:
+            draws = [RandomStream(seed).random() for seed in seeds]
+            return {(after - before) % 2 ** 32 for before, after in zip(draws, draws[1:])}
+
+        # Consecutive raw seeds start one multiplier apart, so their first draws are evenly spaced
+        self.assertLessEqual(len(first_draw_gaps(range(100))), 2)
+        self.assertEqual(len(first_draw_gaps(random_gen.mix_seed(seed) for seed in range(100))), 99,
+                         "Mixed consecutive seeds should start unrelated sequences")
+        self.assertEqual(random_gen.mix_seed(7), random_gen.mix_seed(7), "mix_seed must be deterministic")
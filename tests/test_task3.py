@@ -1,9 +1,16 @@
 from unittest import TestCase
 
 from ed_utils.decorators import number, visibility
-from constants import PlayerStats, TeamStats
+from constants import PlayerPosition, PlayerStats, TeamStats
 from hashy_perfection_table import HashyPerfectionTable
 from hashy_step_table import HashyStepTable
+from perfect_hash_generator import perfect_table_class
+from team import PlayerPositionTable
+from data_structures.enum_table import EnumTable
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import ArrayBucket, HashTableSeparateChaining, LinkedBucket
+from data_structures.robin_hood_table import RobinHoodTable
+from data_structures.hash_cache import HashCache
 
 
 class TestTask3(TestCase):
@@ -74,3 +81,242 @@ class TestTask3(TestCase):
                 self.assertEqual(self.step_table[lookup_table[j]], lookup_table[j], f"Letter not found after deletion")
 
             self.assertEqual(len(self.step_table), len(lookup_table) - i - 1, f"Wrong length: expected {len(PlayerStats) - i - 1}, got {len(self.step_table)}")
+
+    @number("3.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_hash_tombstones(self):
+        for i, player_stat in enumerate(PlayerStats):
+            self.step_table[player_stat.value] = i
+        del self.step_table[PlayerStats.GOALS.value]
+
+        self.assertNotIn(PlayerStats.GOALS.value, self.step_table.keys(), "Deleted keys should not be returned by keys()")
+        self.assertEqual(len(self.step_table.values()), len(PlayerStats) - 1, "Deleted values should not be returned by values()")
+
+        self.step_table[PlayerStats.GOALS.value] = 100
+        self.assertEqual(self.step_table[PlayerStats.GOALS.value], 100)
+        self.assertEqual(len(self.step_table), len(PlayerStats), "Re-inserting a deleted key should count it again")
+
+        # Heavy churn must not let tombstones pile up
+        for i in range(2000):
+            self.step_table[f"Player {i}"] = i
+            del self.step_table[f"Player {i}"]
+        self.assertLessEqual(self.step_table.tombstones, self.step_table.table_size * HashyStepTable.TOMBSTONE_FACTOR)
+        self.assertEqual(len(self.step_table), len(PlayerStats))
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hash_cache(self):
+        cache = HashCache(capacity=4)
+        self.step_table.hash_cache = cache
+        for i, player_stat in enumerate(PlayerStats):
+            self.assertEqual(self.step_table.hash(player_stat.value), self.step_table._hash(player_stat.value),
+                             "Cached hash differs from the computed one")
+            self.step_table[player_stat.value] = i
+        for i, player_stat in enumerate(PlayerStats):
+            self.assertEqual(self.step_table[player_stat.value], i, f"Player stat {player_stat.name} not set to {i}")
+
+        self.assertLessEqual(len(cache), 4, "The cache should never exceed its capacity")
+        self.assertGreater(cache.hits, 0, "Repeated keys should be answered from the cache")
+
+        # least recently used eviction: a hot key survives a stream of new keys
+        cache = HashCache(capacity=2)
+        self.step_table.hash_cache = cache
+        for key in ["Hot", "Cold 1", "Hot", "Cold 2", "Hot"]:
+            self.step_table.hash(key)
+        self.assertEqual(cache.hits, 2, "The hot key should stay cached")
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_enum_table(self):
+        table = EnumTable(TeamStats)
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.keys(), (), "An empty table has no keys")
+        self.assertEqual(table.values(), (), "An empty table has no values")
+        for i, team_stat in enumerate(TeamStats):
+            table[team_stat] = i
+        for i, team_stat in enumerate(TeamStats):
+            self.assertEqual(table[team_stat.value], i, "Members and their values should address the same slot")
+        self.assertEqual(len(table), len(TeamStats))
+        self.assertEqual(table.keys(), tuple(TeamStats), "Keys should be returned in Enum order")
+        self.assertEqual(table.values(), tuple(range(len(TeamStats))), "Values should be returned in Enum order")
+
+        del table[TeamStats.WINS]
+        self.assertNotIn(TeamStats.WINS, table)
+        self.assertRaises(KeyError, lambda: table[TeamStats.WINS])
+        self.assertRaises(KeyError, lambda: table[PlayerStats.GOALS.value])
+        self.assertEqual(len(table), len(TeamStats) - 1)
+
+    @number("3.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_perfect_table_generator(self):
+        names = [f"Player {i}" for i in range(100)]
+        for keys in ([team_stat.value for team_stat in TeamStats], names):
+            table = perfect_table_class(keys)()
+            self.assertGreaterEqual(table.table_size, len(keys))
+            self.assertLessEqual(table.table_size, 2 * len(keys), "The table should be near minimal")
+            for i, key in enumerate(keys):
+                table[key] = i
+            for i, key in enumerate(keys):
+                self.assertEqual(table[key], i, f"{key} not set to {i}")
+            self.assertEqual(len(table), len(keys), "Every key needs its own slot")
+            self.assertRaises(KeyError, lambda: table["Apple"])
+            with self.assertRaises(KeyError):
+                table["Apple"] = 0
+
+        # The squad table pasted into team.py must still be perfect for the current positions
+        table = PlayerPositionTable()
+        self.assertEqual(PlayerPositionTable.KEYS, {position.value for position in PlayerPosition})
+        for position in PlayerPosition:
+            table[position.value] = position
+        self.assertEqual(len(table), len(PlayerPosition), "Every position needs its own slot")
+
+    @number("3.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_linear_probe_delete(self):
+        # A single small size keeps the clusters long and wrapping around the end of the array
+        table = LinearProbeTable([29])
+        expected = {}
+        for i in range(14):
+            table[f"Player {i}"] = expected[f"Player {i}"] = i
+        for i in range(14, 200):
+            del table[f"Player {i - 14}"]
+            del expected[f"Player {i - 14}"]
+            table[f"Player {i}"] = expected[f"Player {i}"] = i
+            for key, value in expected.items():
+                self.assertEqual(table[key], value, f"{key} lost after deleting Player {i - 14}")
+            self.assertNotIn(f"Player {i - 14}", table)
+        self.assertEqual(len(table), len(expected))
+
+    @number("3.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_robin_hood_table(self):
+        table = RobinHoodTable()
+        expected = {}
+        # Enough keys to fill the table past 0.8 of its slots
+        for i in range(20000):
+            table[f"Player {i}"] = expected[f"Player {i}"] = i
+        self.assertGreater(len(table), table.table_size * 0.8)
+        self.assertLess(table.mean_probe_distance, 2, "Keys should spread over the home slots")
+        self.assertLess(table.max_probe_distance, 20, "Keys should spread over the home slots")
+        for i in range(0, 20000, 3):
+            del table[f"Player {i}"]
+            del expected[f"Player {i}"]
+        for key, value in expected.items():
+            self.assertEqual(table[key], value)
+        for i in range(0, 20000, 3):
+            self.assertNotIn(f"Player {i}", table)
+        self.assertEqual(len(table), len(expected))
+        self.assertLessEqual(len(table), table.table_size * RobinHoodTable.MAX_LOAD_FACTOR)
+
+        distances = [table.distance(position) for position in range(table.table_size) if table.array[position] is not None]
+        self.assertEqual(table.mean_probe_distance, sum(distances) / len(distances), "Mean probe distance out of date")
+        self.assertLessEqual(max(distances), table.max_probe_distance)
+
+    @number("3.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_separate_chaining_resize(self):
+        for bucket in (LinkedBucket, ArrayBucket):
+            table = HashTableSeparateChaining(bucket=bucket)
+            for i in range(1000):
+                table[f"Player {i}"] = i
+            self.assertEqual(len(table), 1000)
+            self.assertIn(len(table.table), HashTableSeparateChaining.TABLE_SIZES, "The table should grow along TABLE_SIZES")
+            self.assertLessEqual(len(table), len(table.table) * table.load_factor)
+            table["Player 0"] = "updated"
+            self.assertEqual(table["Player 0"], "updated")
+            self.assertEqual(sorted(value for value in table.values() if value != "updated"), list(range(1, 1000)))
+
+            for i in range(1, 1000):
+                del table[f"Player {i}"]
+            self.assertEqual(len(table.table), HashTableSeparateChaining.DEFAULT_TABLE_SIZE, "The table should shrink back")
+            self.assertEqual(table["Player 0"], "updated")
+            self.assertRaises(KeyError, lambda: table["Player 1"])
+
+    @number("3.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_open_addressing_shrink(self):
+        for table_class in (LinearProbeTable, RobinHoodTable, HashyStepTable):
+            table = table_class()
+            for i in range(5000):
+                table[f"Player {i}"] = i
+            grown = table.table_size
+            for i in range(10, 5000):
+                del table[f"Player {i}"]
+            self.assertLess(table.table_size, grown, f"{table_class.__name__} should shrink after a bulk delete")
+            for i in range(10):
+                self.assertEqual(table[f"Player {i}"], i)
+
+            table.compact()
+            fitting = min(size for size in table.TABLE_SIZES if 10 <= size * table.MAX_LOAD_FACTOR / 2)
+            self.assertEqual(table.table_size, fitting, f"{table_class.__name__} should compact to fit 10 items")
+            self.assertEqual(len(table.keys()), 10)
+
+            table.clear()
+            self.assertEqual(len(table), 0)
+            self.assertEqual(table.table_size, table.TABLE_SIZES[0])
+            self.assertNotIn("Player 0", table)
+            table["Player 0"] = 0
+            self.assertEqual(table["Player 0"], 0)
+
+            # No size below 1543 fits the remaining items, so deleting must not rebuild at the same size
+            table = table_class(sizes=[5, 1543, 3079])
+            for i in range(300):
+                table[f"Player {i}"] = i
+            array, rebuilds = table.array, 0
+            for i in range(297):
+                del table[f"Player {i}"]
+                if table.array is not array:
+                    array, rebuilds = table.array, rebuilds + 1
+            self.assertEqual(rebuilds, 0, f"{table_class.__name__} rebuilt without shrinking")
+            self.assertEqual(table.table_size, 1543)
+            self.assertEqual(table["Player 299"], 299)
+
+    @number("3.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bulk_load(self):
+        items = [(f"Player {i}", i) for i in range(3000)]
+        for table_class in (LinearProbeTable, HashyStepTable, HashTableSeparateChaining):
+            table = table_class.from_items(items)
+            self.assertEqual(len(table), len(items))
+            self.assertEqual(sorted(table.values()), list(range(3000)))
+
+            table.update([("Player 0", "updated"), ("Player 3000", 3000)])
+            self.assertEqual(table["Player 0"], "updated")
+            self.assertEqual(table["Player 3000"], 3000)
+            self.assertEqual(len(table), len(items) + 1)
+
+    @number("3.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_table_views(self):
+        for table_class in (LinearProbeTable, RobinHoodTable, HashyStepTable):
+            table = table_class()
+            self.assertEqual(len(table.keys()), 0, "An empty table has no keys")
+            keys = table.keys()
+            for i in range(200):
+                table[f"Player {i}"] = i
+            for i in range(0, 200, 2):
+                del table[f"Player {i}"]
+
+            self.assertEqual(len(keys), 100, "Views should reflect later changes")
+            self.assertEqual(sorted(table.values()), list(range(1, 200, 2)))
+            self.assertEqual(sorted(table), list(range(1, 200, 2)), "Iterating a table yields its values")
+            self.assertEqual(dict(table.items()), {f"Player {i}": i for i in range(1, 200, 2)})
+            self.assertIn("Player 1", table.keys())
+            self.assertNotIn("Player 0", table.keys())
+            for i in range(len(table)):
+                self.assertEqual(table[table.keys()[i]], table.values()[i])
+            self.assertEqual(len(table.slots), len(table), "Only occupied slots are indexed")
+
+    @number("3.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hash_cache_subclasses(self):
+        class OtherBaseTable(HashyPerfectionTable):
+            HASH_BASE = HashyPerfectionTable.HASH_BASE + 2
+
+        HashyPerfectionTable.hash_cache = HashCache()
+        self.addCleanup(setattr, HashyPerfectionTable, "hash_cache", None)
+        base_table, other_table = HashyPerfectionTable(), OtherBaseTable()
+        for key in ["Goals", "Assists", "Tackles"]:
+            self.assertEqual(base_table.hash(key), base_table._hash(key))
+            self.assertEqual(other_table.hash(key), other_table._hash(key),
+                             "A subclass sharing the cache should not get the base class hashes")
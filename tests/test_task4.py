@@ -133,4 +133,68 @@ class TestTask4(TestCase):
         # Check the order of the leaderboard should be according to the name of the teams
         sorted_teams: ArrayR[Team] = sorted(self.teams, key=lambda team: team.get_name())
         for i, team in enumerate(self.season.leaderboard):
-            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
\ No newline at end of file
+            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_robin_schedule(self):
+        for num_teams in [len(self.TEAM_NAMES), 3]:
+            self.season = Season(self.teams[0:num_teams])
+            # N-1 weeks for an even number of teams, N weeks (with a bye each week) for an odd number, played twice
+            expected_weeks: int = 2 * (num_teams - 1 if num_teams % 2 == 0 else num_teams)
+            self.assertEqual(len(self.season.schedule), expected_weeks, "Wrong number of weeks in the schedule")
+
+            fixtures: set[tuple[str, str]] = set()
+            for week in self.season.schedule:
+                playing: set[str] = set()
+                for game in week:
+                    self.assertNotIn(game.home_team.get_name(), playing, "A team plays twice in the same week")
+                    self.assertNotIn(game.away_team.get_name(), playing, "A team plays twice in the same week")
+                    playing.add(game.home_team.get_name())
+                    playing.add(game.away_team.get_name())
+                    fixtures.add((game.home_team.get_name(), game.away_team.get_name()))
+            self.assertEqual(len(fixtures), num_teams * (num_teams - 1), "Every team should host every other team once")
+
+    @number("4.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_next_game_cursor(self):
+        self.season = Season(self.teams[0:4])
+        weeks = list(self.season.schedule)
+        self.assertIs(self.season.get_next_game(), weeks[0])
+        self.assertIs(self.season.get_next_game(), weeks[1])
+
+        # Iterating the schedule meanwhile must not disturb the cursor
+        self.assertEqual(len(list(self.season.schedule)), len(weeks))
+        self.assertIs(self.season.get_next_game(), weeks[2])
+
+        # Delaying week 4 to the end: the cursor carries on with what is now week 4
+        self.season.delay_week_of_games(4)
+        self.assertIs(self.season.get_next_game(), weeks[4])
+        for week in weeks[5:] + [weeks[3]]:
+            self.assertIs(self.season.get_next_game(), week)
+        self.assertIsNone(self.season.get_next_game(), "No weeks should be left")
+
+    @number("4.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reschedule(self):
+        delayed = Season(self.teams)
+        rescheduled = Season(self.teams)
+        delayed_weeks, rescheduled_weeks = list(delayed.schedule), list(rescheduled.schedule)
+        self.assertIs(delayed.get_next_game(), delayed_weeks[0])
+        self.assertIs(rescheduled.get_next_game(), rescheduled_weeks[0])
+
+        moves = [(2, 5), (3, None), (1, 3), (4, 2)]
+        for orig_week, new_week in moves:
+            delayed.delay_week_of_games(orig_week, new_week)
+        rescheduled.reschedule(moves)
+        order = [delayed_weeks.index(week) for week in delayed.schedule]
+        self.assertEqual(order, [2, 1, 4, 0, 5, 3])
+        self.assertEqual([rescheduled_weeks.index(week) for week in rescheduled.schedule], order,
+                         "reschedule should apply the moves in order, like delay_week_of_games")
+
+        # Both cursors carry on from week 2 of the new order
+        for week in order[1:]:
+            self.assertIs(delayed.get_next_game(), delayed_weeks[week])
+            self.assertIs(rescheduled.get_next_game(), rescheduled_weeks[week])
+        self.assertIsNone(rescheduled.get_next_game())
+        self.assertRaises(ValueError, lambda: rescheduled.reschedule([(len(rescheduled_weeks) + 1, 1)]))
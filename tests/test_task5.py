@@ -1,14 +1,18 @@
+import gc
+import weakref
 from unittest import TestCase
 
-from constants import Constants, PlayerPosition, PlayerStats, TeamStats
+from constants import Constants, PlayerPosition, PlayerStats, ResultStats, TeamStats
 from ed_utils.decorators import number, visibility
 from data_structures.bset import BSet
 from data_structures.referential_array import ArrayR
 from tests.helper import take_out_from_adt
 from constants import Constants, GameResult
 from player import Player
-from random_gen import RandomGen
+from random_gen import RandomGen, RandomStream
+from game_simulator import GameSimulator, MatchResult
 from season import Season
+from season_ensemble import SeasonEnsemble, TeamSpec, simulate_run
 from team import Team
 from typing import Union
 
@@ -146,3 +150,139 @@ class TestTask5(TestCase):
             player = players_dict[player_name]
             for stat, value in stats.items():
                 self.assertEqual(value, player[stat], f"{player_name} {stat} not correct")
+
+    @number("5.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_season_ensemble(self):
+        teams = Roster.generate_teams(4)
+        specs = [TeamSpec.from_team(team) for team in teams]
+        seeds = [123, 456, 789]
+        ensemble = SeasonEnsemble(specs, seeds).run(max_workers=2)
+
+        self.assertEqual(ensemble.runs, len(seeds))
+        for position in range(len(specs)):
+            self.assertEqual(sum(ensemble.position_histogram[t][position] for t in range(len(specs))), len(seeds),
+                             "Every position should be taken by exactly one team per run")
+
+        # The parallel runs must match simulating the same seeds serially
+        for run, seed in enumerate(seeds):
+            positions, points, player_stats = simulate_run(tuple(specs), seed)
+            for t in range(len(specs)):
+                self.assertEqual(ensemble.points[t][run], points[t], f"Points of team {t} differ for seed {seed}")
+
+        # Running again replaces the aggregates of the first run
+        means = [ensemble.mean_points(t) for t in range(len(specs))]
+        ensemble.run(max_workers=1)
+        self.assertEqual(ensemble.runs, len(seeds), "A second run should not add to the first")
+        self.assertEqual([ensemble.mean_points(t) for t in range(len(specs))], means)
+
+        # Specs taken after a season carry the attributes but not the per-game totals
+        Season(teams).simulate_season()
+        player = teams[0].get_players()[0]
+        rebuilt = TeamSpec.from_team(teams[0]).build().get_players()[0]
+        self.assertEqual(rebuilt[PlayerStats.GAMES_PLAYED], 0, "Specs should not copy per-game totals")
+        self.assertEqual(rebuilt[PlayerStats.HEIGHT], player[PlayerStats.HEIGHT], "Specs should copy the attributes")
+
+    @number("5.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_season_with_stream(self):
+        teams = Roster.generate_teams(4)
+        self.season = Season(teams)
+        stream = RandomGen.stream()
+        # Scrambling the global generator must not affect a season driven by its own stream
+        RandomGen.set_seed(0)
+        self.season.simulate_season(stream)
+
+        self.assertEqual(self.season.get_leaderboard()[0][0], 'Badgers', "Stream driven season differs from the seeded one")
+        self.assertEqual(self.season.get_leaderboard()[0][2], 11, "Stream driven season differs from the seeded one")
+
+    @number("5.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sampler_invalidation(self):
+        team = Roster.generate_teams(1)[0]
+        sampler = GameSimulator.get_sampler(team, False, PlayerStats.HEIGHT)
+        self.assertIs(GameSimulator.get_sampler(team, False, PlayerStats.HEIGHT), sampler, "Sampler should be reused")
+
+        player = team.get_players()[0]
+        player[PlayerStats.HEIGHT] += 1
+        rebuilt = GameSimulator.get_sampler(team, False, PlayerStats.HEIGHT)
+        self.assertIsNot(rebuilt, sampler, "Sampler should be rebuilt after a weight changed")
+        self.assertEqual(rebuilt.total, sampler.total + 1, "Rebuilt sampler should use the new weight")
+
+        team.remove_player(player)
+        self.assertEqual(len(GameSimulator.get_sampler(team, False, PlayerStats.HEIGHT).players), len(team),
+                         "Sampler should be rebuilt after the roster changed")
+
+    @number("5.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_resimulate_after_stat_changes(self):
+        teams = Roster.generate_teams(4)
+        self.season = Season(teams)
+        teams[2][TeamStats.WINS] += 1
+        self.season.simulate_season()
+
+        for team in teams:
+            team.reset_stats()
+        self.season.simulate_season()
+        for team in teams:
+            self.assertEqual(team[TeamStats.GAMES_PLAYED], 6, "Resetting should let the season be played again")
+        points = [row[2] for row in self.season.get_leaderboard()]
+        self.assertEqual(points, sorted(points, reverse=True), "Leaderboard should follow the new stats")
+
+    @number("5.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sampler_cache_releases_teams(self):
+        teams = Roster.generate_teams(2)
+        GameSimulator.simulate(teams[0], teams[1])
+        self.assertIn(teams[0], GameSimulator._samplers)
+        cached = len(GameSimulator._samplers)
+        team_ref = weakref.ref(teams[0])
+
+        del teams
+        gc.collect()
+        self.assertIsNone(team_ref(), "The sampler cache should not keep a team alive")
+        self.assertEqual(len(GameSimulator._samplers), cached - 2, "Entries should go together with their teams")
+
+    @number("5.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_match_result_compatibility_view(self):
+        striker = Player("Ann Bot", PlayerPosition.STRIKER, 20)
+        midfielder = Player("Ben Kerr", PlayerPosition.MIDFIELDER, 24)
+        result = MatchResult(2, 1, [striker, midfielder, striker], [midfielder], [], [striker])
+
+        self.assertEqual(result[ResultStats.HOME_GOALS.value], 2)
+        self.assertEqual(result[ResultStats.AWAY_GOALS.value], 1)
+        scorers = result[ResultStats.GOAL_SCORERS.value]
+        self.assertIsInstance(scorers, ArrayR, "Players should be reported as an ArrayR of names")
+        self.assertEqual(list(scorers), ["Ann Bot", "Ben Kerr", "Ann Bot"])
+        self.assertEqual(list(result[ResultStats.INTERCEPTIONS.value]), ["Ann Bot"])
+        self.assertIsNone(result[ResultStats.TACKLES.value], "No events should be reported as None")
+        self.assertRaises(KeyError, lambda: result["Own Goals"])
+        self.assertRaises(KeyError, lambda: result[ResultStats.HOME_GOALS])
+
+    @number("5.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_named_players_keep_their_own_stats(self):
+        def build_teams(shared_name: bool) -> ArrayR[Team]:
+            RandomGen.set_seed(123)
+            teams = Roster.generate_teams(4)
+            if shared_name:
+                # Give a player of the second team the name of a player of the first one
+                teams[1].initial_player_states[0].name = teams[0].initial_player_states[0].get_name()
+            return teams
+
+        event_stats = (PlayerStats.GOALS, PlayerStats.ASSISTS, PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
+        seasons = []
+        for shared_name in (False, True):
+            teams = build_teams(shared_name)
+            Season(teams).simulate_season(RandomStream(7))
+            seasons.append([[player[stat] for stat in event_stats]
+                            for team in teams for player in team.initial_player_states])
+
+        namesakes = build_teams(True)
+        self.assertEqual(namesakes[0].initial_player_states[0].get_name(), namesakes[1].initial_player_states[0].get_name())
+        distinct, shared = seasons
+        first, second = 0, len(namesakes[0].initial_player_states)
+        self.assertNotEqual(distinct[first], distinct[second], "The namesakes should have different records")
+        for player_no, (expected, actual) in enumerate(zip(distinct, shared)):
+            self.assertEqual(actual, expected, f"Player {player_no} got the events of a namesake")
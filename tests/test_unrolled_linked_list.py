@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList(TestCase):
+
+    def setUp(self) -> None:
+        self.unrolled: UnrolledLinkedList[int] = UnrolledLinkedList(4)
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_split_and_merge(self):
+        for i in range(8):
+            self.unrolled.append(i)
+        self.assertEqual(self.unrolled.block_count(), 2, "Appends should fill blocks before opening a new one")
+
+        self.unrolled.insert(1, 10)
+        self.unrolled.insert(6, 11)
+        self.assertEqual(self.unrolled.block_count(), 4, "Inserting into a full block should split it")
+        expected = [0, 10, 1, 2, 3, 4, 11, 5, 6, 7]
+        self.assertEqual(list(self.unrolled), expected)
+        self.assertEqual([self.unrolled[i] for i in range(len(self.unrolled))], expected)
+
+        self.assertEqual(self.unrolled.delete_at_index(1), 10)
+        self.assertEqual(self.unrolled.delete_at_index(5), 11)
+        self.assertEqual(list(self.unrolled), list(range(8)))
+        self.assertEqual(self.unrolled.block_count(), 2, "Blocks that fit together should merge")
+
+        for _ in range(8):
+            self.unrolled.delete_at_index(len(self.unrolled) - 1)
+        self.assertIsNone(self.unrolled.head, "Emptying the list should drop every block")
+        self.assertIsNone(self.unrolled.rear)
+        self.assertRaises(ValueError, lambda: self.unrolled.delete_at_index(0))
+        self.unrolled.insert(0, 12)
+        self.unrolled[0] = 13
+        self.assertEqual(list(self.unrolled), [13])
+        self.assertEqual(self.unrolled.index(13), 0)